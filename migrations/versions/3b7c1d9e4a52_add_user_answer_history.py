@@ -0,0 +1,41 @@
+"""Add user_answer_history seen-answer bitsets
+
+Revision ID: 3b7c1d9e4a52
+Revises: f92268ea34ee
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7c1d9e4a52'
+down_revision = 'f92268ea34ee'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_answer_history',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('game_mode', sa.Enum('CLASSIC', 'DISNEY', name='gamemode'), nullable=False),
+    sa.Column('lexicon_version', sa.String(length=64), nullable=True),
+    sa.Column('seen', sa.LargeBinary(), nullable=False),
+    sa.Column('seen_count', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'game_mode', name='uix_user_answer_history_user_mode')
+    )
+    with op.batch_alter_table('user_answer_history', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_user_answer_history_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user_answer_history', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_answer_history_user_id'))
+
+    op.drop_table('user_answer_history')
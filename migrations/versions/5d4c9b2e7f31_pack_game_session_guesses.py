@@ -0,0 +1,98 @@
+"""Add compact guesses_packed encoding to game_sessions
+
+Each guess is stored as 5 ASCII letter codes and one base-3 feedback byte.
+Existing rows are converted and their JSON guesses cleared; rows with words
+that cannot be packed keep their JSON guesses.
+
+Revision ID: 5d4c9b2e7f31
+Revises: 8e2f5a7c0d13
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d4c9b2e7f31'
+down_revision = '8e2f5a7c0d13'
+branch_labels = None
+depends_on = None
+
+# Same encoding as app.models.game.pack_guess, copied so the migration stays fixed
+FEEDBACK_STATES = ("absent", "present", "correct")
+BATCH_SIZE = 1000
+
+game_sessions = sa.table(
+    'game_sessions',
+    sa.column('id', sa.Integer),
+    sa.column('guesses', sa.JSON),
+    sa.column('guesses_packed', sa.LargeBinary)
+)
+
+
+def pack(guesses):
+    packed = b""
+    for guess in guesses:
+        word, feedback = guess['word'], guess['feedback']
+        if len(word) != 5 or not word.isascii():
+            return None
+        code = sum(FEEDBACK_STATES.index(state) * 3 ** position for position, state in enumerate(feedback))
+        packed += word.upper().encode('ascii') + bytes((code,))
+    return packed
+
+
+def unpack(packed):
+    return [
+        {
+            'word': packed[offset:offset + 5].decode('ascii'),
+            'feedback': [FEEDBACK_STATES[packed[offset + 5] // 3 ** position % 3] for position in range(5)]
+        }
+        for offset in range(0, len(packed), 6)
+    ]
+
+
+def convert(connection, source, transform):
+    """Rewrite rows in id order, BATCH_SIZE rows per executemany."""
+    statement = game_sessions.update().where(game_sessions.c.id == sa.bindparam('row_id')).values(
+        guesses=sa.bindparam('new_guesses'), guesses_packed=sa.bindparam('new_packed')
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(game_sessions.c.id, source)
+            .where(game_sessions.c.id > last_id, source.isnot(None))
+            .order_by(game_sessions.c.id).limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        params = []
+        for row_id, value in rows:
+            converted = transform(value)
+            if converted is not None:
+                params.append({'row_id': row_id, 'new_guesses': converted[0], 'new_packed': converted[1]})
+        if params:
+            connection.execute(statement, params)
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    with op.batch_alter_table('game_sessions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('guesses_packed', sa.LargeBinary(), nullable=True))
+
+    def to_packed(guesses):
+        if isinstance(guesses, str):
+            guesses = json.loads(guesses)
+        packed = pack(guesses or [])
+        return None if packed is None else ([], packed)
+
+    convert(op.get_bind(), game_sessions.c.guesses, to_packed)
+
+
+def downgrade():
+    convert(op.get_bind(), game_sessions.c.guesses_packed, lambda packed: (unpack(packed), None))
+
+    with op.batch_alter_table('game_sessions', schema=None) as batch_op:
+        batch_op.drop_column('guesses_packed')
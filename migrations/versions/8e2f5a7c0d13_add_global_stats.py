@@ -0,0 +1,43 @@
+"""Add global_stats aggregates
+
+Run scripts/rebuild_global_stats.py after upgrading to populate the totals
+from existing user_stats rows.
+
+Revision ID: 8e2f5a7c0d13
+Revises: 3b7c1d9e4a52
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e2f5a7c0d13'
+down_revision = '3b7c1d9e4a52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('global_stats',
+    sa.Column('game_mode', sa.Enum('CLASSIC', 'DISNEY', name='gamemode'), nullable=False),
+    sa.Column('total_players', sa.Integer(), nullable=False),
+    sa.Column('total_games', sa.Integer(), nullable=False),
+    sa.Column('total_wins', sa.Integer(), nullable=False),
+    sa.Column('dist_1', sa.Integer(), nullable=False),
+    sa.Column('dist_2', sa.Integer(), nullable=False),
+    sa.Column('dist_3', sa.Integer(), nullable=False),
+    sa.Column('dist_4', sa.Integer(), nullable=False),
+    sa.Column('dist_5', sa.Integer(), nullable=False),
+    sa.Column('dist_6', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('game_mode')
+    )
+
+
+def downgrade():
+    op.drop_table('global_stats')
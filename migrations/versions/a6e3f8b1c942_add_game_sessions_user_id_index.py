@@ -0,0 +1,26 @@
+"""Add (user_id, id) index on game_sessions for keyset-paged history
+
+Revision ID: a6e3f8b1c942
+Revises: 5d4c9b2e7f31
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6e3f8b1c942'
+down_revision = '5d4c9b2e7f31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('game_sessions', schema=None) as batch_op:
+        batch_op.create_index('ix_game_sessions_user_id_id', ['user_id', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('game_sessions', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_sessions_user_id_id')
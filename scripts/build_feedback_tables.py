@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Feedback table build script for Wordle application.
+Writes the memory-mapped guess x answer feedback tables next to the word lists.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from app import create_app
+from app.models.game import GameMode
+from app.repositories.game_repository import WordListRepository
+from app.services.feedback_engine import table_file_path, write_table_file, open_or_build_table
+
+
+def build_tables(modes, table_dir=None, force=False):
+    """Build feedback table files for the given game modes."""
+    app = create_app()
+
+    with app.app_context():
+        word_repo = WordListRepository()
+
+        for mode in modes:
+            game_mode = GameMode(mode)
+            words = word_repo.get_words_by_mode(game_mode)
+            if not words:
+                print(f"⚠️ No words found for {mode} mode, skipping")
+                continue
+
+            guesses = [word for word, _ in words]
+            answers = [word for word, is_answer in words if is_answer]
+            path = table_file_path(game_mode, table_dir)
+
+            if force:
+                write_table_file(path, guesses, answers)
+            table = open_or_build_table(game_mode, path, guesses, answers)
+
+            print(f"✅ {mode}: {len(guesses)} guesses x {len(answers)} answers -> {path} "
+                  f"({path.stat().st_size:,} bytes, digest {table.digest.hex()[:12]})")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Build feedback table files for Wordle application')
+    parser.add_argument(
+        '--modes',
+        nargs='+',
+        choices=['classic', 'disney', 'all'],
+        default=['all'],
+        help='Game modes to build (default: all)'
+    )
+    parser.add_argument(
+        '--dir',
+        default=None,
+        help='Directory for table files (default: data/)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild even if the existing files match the word lists'
+    )
+
+    args = parser.parse_args()
+
+    modes = ['classic', 'disney'] if 'all' in args.modes else args.modes
+    build_tables(modes, args.dir, args.force)
+
+
+if __name__ == "__main__":
+    main()
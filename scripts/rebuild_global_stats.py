@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Global statistics rebuild script for Wordle application.
+Reconciles the global_stats aggregates with the per-user statistics.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from app import create_app
+from app.models.game import GameMode
+from app.repositories.game_repository import GlobalStatsRepository
+
+
+def rebuild_global_stats(modes):
+    """Rebuild global statistics for the given game modes."""
+    app = create_app()
+
+    with app.app_context():
+        global_stats_repo = GlobalStatsRepository()
+
+        for mode in modes:
+            stats = global_stats_repo.rebuild(GameMode(mode))
+            if stats is None:
+                print(f"❌ {mode}: rebuild failed")
+                continue
+
+            print(f"✅ {mode}: {stats.total_players} players, {stats.total_games} games, "
+                  f"{stats.total_wins} wins, distribution {stats.get_guess_distribution()}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Rebuild global statistics for Wordle application')
+    parser.add_argument(
+        '--modes',
+        nargs='+',
+        choices=['classic', 'disney', 'all'],
+        default=['all'],
+        help='Game modes to rebuild (default: all)'
+    )
+
+    args = parser.parse_args()
+
+    modes = ['classic', 'disney'] if 'all' in args.modes else args.modes
+    rebuild_global_stats(modes)
+
+
+if __name__ == "__main__":
+    main()
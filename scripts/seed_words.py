@@ -17,7 +17,8 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
 from app import create_app
 from app.models.game import WordList, GameMode
-from app.database import db
+from app.database import db, unit_of_work
+from app.repositories.game_repository import WordListRepository
 
 
 # Configure logging
@@ -35,8 +36,8 @@ class WordListSeeder:
         """Initialize the word list seeder."""
         self.app = create_app()
         self.stats = {
-            'classic': {'added': 0, 'skipped': 0, 'errors': 0},
-            'disney': {'added': 0, 'skipped': 0, 'errors': 0}
+            'classic': {'added': 0, 'updated': 0, 'deleted': 0, 'skipped': 0, 'errors': 0},
+            'disney': {'added': 0, 'updated': 0, 'deleted': 0, 'skipped': 0, 'errors': 0}
         }
         self.validation_errors = []
     
@@ -174,83 +175,59 @@ class WordListSeeder:
             }
         }
     
-    def add_word_to_db(self, word: str, game_mode: GameMode, is_answer: bool, frequency_rank: int) -> bool:
-        """Add a single word to the database."""
-        try:
+    def build_entries(self, mode_words: Dict[str, List[str]]) -> List[Tuple[str, bool, int]]:
+        """Build (word, is_answer, frequency_rank) entries from loaded word lists.
+        
+        Answers are ranked first in file order, followed by guess-only words.
+        Invalid and duplicate words are skipped.
+        """
+        entries = []
+        seen = set()
+        for word, is_answer in [(w, True) for w in mode_words['answers']] + [(w, False) for w in mode_words['guesses']]:
             is_valid, error_msg = self.validate_word(word)
             if not is_valid:
                 self.validation_errors.append(f"{word}: {error_msg}")
-                return False
-            
-            # Check if word already exists
-            existing = db.session.query(WordList).filter_by(
-                word=word,
-                game_mode=game_mode
-            ).first()
-            
-            if existing:
-                logger.debug(f"Word {word} already exists in {game_mode.value} mode")
-                return False
-            
-            # Create new word entry
-            word_entry = WordList(
-                word=word,
-                game_mode=game_mode,
-                is_answer=is_answer,
-                frequency_rank=frequency_rank
-            )
-            
-            db.session.add(word_entry)
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error adding word {word}: {e}")
-            return False
+                continue
+            if word in seen:
+                continue
+            seen.add(word)
+            entries.append((word, is_answer, len(entries) + 1))
+        return entries
     
     def seed_word_list(self, game_mode: str, clear_existing: bool = False) -> Dict[str, int]:
-        """Seed words for a specific game mode."""
+        """Seed words for a specific game mode.
+        
+        The word list is diffed against the database and only the differences
+        are written, in one transaction, so reseeding is idempotent and does
+        not disturb running games.
+        """
         mode_enum = GameMode.CLASSIC if game_mode == 'classic' else GameMode.DISNEY
-        stats = {'added': 0, 'skipped': 0, 'errors': 0}
+        stats = {'added': 0, 'updated': 0, 'deleted': 0, 'skipped': 0, 'errors': 0}
         
         with self.app.app_context():
-            if clear_existing:
-                logger.info(f"Clearing existing {game_mode} words...")
-                deleted = db.session.query(WordList).filter_by(game_mode=mode_enum).delete()
-                logger.info(f"Deleted {deleted} existing words")
-            
             # Load word lists
             word_lists = self.load_word_lists()
             mode_words = word_lists[game_mode]
+            entries = self.build_entries(mode_words)
+            stats['skipped'] = len(mode_words['answers']) + len(mode_words['guesses']) - len(entries)
             
-            # Add answer words
-            logger.info(f"Adding {game_mode} answer words...")
-            frequency_rank = 1
-            
-            for word in mode_words['answers']:
-                if self.add_word_to_db(word, mode_enum, True, frequency_rank):
-                    stats['added'] += 1
-                    frequency_rank += 1
-                else:
-                    stats['skipped'] += 1
-            
-            # Add guess words
-            logger.info(f"Adding {game_mode} guess words...")
-            
-            for word in mode_words['guesses']:
-                if self.add_word_to_db(word, mode_enum, False, frequency_rank):
-                    stats['added'] += 1
-                    frequency_rank += 1
-                else:
-                    stats['skipped'] += 1
-            
+            logger.info(f"Syncing {len(entries)} {game_mode} words...")
             try:
-                db.session.commit()
-                logger.info(f"Successfully committed {stats['added']} words for {game_mode} mode")
+                with unit_of_work():
+                    result = WordListRepository().sync_words(mode_enum, entries, delete_missing=clear_existing)
             except Exception as e:
-                db.session.rollback()
-                logger.error(f"Failed to commit words for {game_mode}: {e}")
-                stats['errors'] = stats['added']
-                stats['added'] = 0
+                logger.error(f"Failed to sync words for {game_mode}: {e}")
+                stats['errors'] = len(entries)
+                return stats
+            
+            stats['added'] = result['inserted']
+            stats['updated'] = result['updated']
+            stats['deleted'] = result['deleted']
+            stats['skipped'] += result['unchanged']
+            logger.info(
+                f"Committed {game_mode} words: {result['inserted']} added, {result['updated']} updated, "
+                f"{result['deleted']} deleted, {result['unchanged']} unchanged"
+            )
         
         return stats
     
@@ -277,6 +254,8 @@ class WordListSeeder:
    Answer Words: {classic_answers}
    Guess Words: {classic_count - classic_answers}
    Added: {self.stats['classic']['added']}
+   Updated: {self.stats['classic']['updated']}
+   Deleted: {self.stats['classic']['deleted']}
    Skipped: {self.stats['classic']['skipped']}
    Errors: {self.stats['classic']['errors']}
 
@@ -285,6 +264,8 @@ class WordListSeeder:
    Answer Words: {disney_answers}
    Guess Words: {disney_count - disney_answers}
    Added: {self.stats['disney']['added']}
+   Updated: {self.stats['disney']['updated']}
+   Deleted: {self.stats['disney']['deleted']}
    Skipped: {self.stats['disney']['skipped']}
    Errors: {self.stats['disney']['errors']}
 
@@ -318,6 +299,7 @@ class WordListSeeder:
         print(report)
         
         logger.info("✅ Word list seeding completed!")
+        logger.info("Running servers pick up the new word list within LEXICON_REFRESH_SECONDS")
 
 
 def main():
@@ -333,7 +315,7 @@ def main():
     parser.add_argument(
         '--clear', 
         action='store_true',
-        help='Clear existing words before seeding'
+        help='Delete words that are no longer in the word lists'
     )
     parser.add_argument(
         '--verbose', 
@@ -13,6 +13,10 @@ from .config import get_flask_config
 from .database import init_db
 from .middleware.security import SecurityMiddleware
 from .middleware.rate_limiting import RateLimitConfig
+from .services.feedback_engine import init_feedback_engine
+from .services.lexicon import init_lexicon
+from .services.hot_sessions import init_hot_sessions
+from .utils.caching import init_cache
 
 
 def create_app(config_name: Optional[str] = None) -> Flask:
@@ -39,6 +43,18 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     # Initialize database
     init_db(app)
     
+    # Configure application cache bounds
+    init_cache(app)
+    
+    # Configure in-process word list index
+    init_lexicon(app)
+    
+    # Configure cache of in-progress game sessions
+    init_hot_sessions(app)
+    
+    # Precompute feedback tables (optional)
+    init_feedback_engine(app)
+    
     # Register blueprints
     register_blueprints(app)
     
@@ -106,6 +122,9 @@ def register_blueprints(app: Flask) -> None:
     
     # Register main template routes
     app.register_blueprint(main_bp)
+    
+    # Per-endpoint rate limits are attached by endpoint name
+    RateLimitConfig.apply_limits(app.extensions['limiter'], app)
 
 
 def register_error_handlers(app: Flask) -> None:
@@ -4,6 +4,7 @@ from flask import Blueprint, request, jsonify, make_response
 from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity, set_access_cookies, set_refresh_cookies
 from pydantic import BaseModel, ValidationError
 
+from ..database import unit_of_work
 from ..services.auth_service import AuthService
 from ..utils.responses import success_response, error_response
 from ..utils.validation import validate_json
@@ -41,15 +42,18 @@ def register():
         from flask import g
         data = g.validated_data
         
-        user = auth_service.register_user(data)
+        # Serialize before the commit expires the new row, which would reload it
+        with unit_of_work():
+            user = auth_service.register_user(data)
+            user_data = user.to_dict()
         
         # Create tokens (convert user.id to string for JWT)
-        access_token = create_access_token(identity=str(user.id))
-        refresh_token = create_refresh_token(identity=str(user.id))
+        access_token = create_access_token(identity=str(user_data['id']))
+        refresh_token = create_refresh_token(identity=str(user_data['id']))
         
         # SSR compatibility: set JWTs as HttpOnly cookies
         resp = make_response(success_response({
-            'user': user.to_dict(),
+            'user': user_data,
             'access_token': access_token,
             'refresh_token': refresh_token
         }, status_code=201))
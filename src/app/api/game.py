@@ -2,10 +2,11 @@
 
 import logging
 from datetime import date, datetime
-from flask import Blueprint, request
+from typing import Optional
+from flask import Blueprint, Response, request, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
-from ..services.game_service import GameService
+from ..services.game_service import EXPORT_FORMATS, GameService
 from ..services.word_validation_service import WordValidationService
 from ..models.game import GameMode
 from ..utils.responses import success_response, error_response
@@ -20,6 +21,12 @@ game_bp = Blueprint('game', __name__, url_prefix='/api/game')
 game_service = GameService()
 word_validation_service = WordValidationService()
 
+# Content types of game history exports
+EXPORT_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
 
 @game_bp.route('/daily/<game_mode>', methods=['GET'])
 @jwt_required()
@@ -189,6 +196,111 @@ def validate_word():
         return error_response("Internal server error", status_code=500)
 
 
+def _game_history(game_mode: Optional[GameMode]):
+    """Build a game history page response from the request's query parameters.
+    
+    Args:
+        game_mode: Game mode to filter by (all modes if None)
+        
+    Returns:
+        JSON response with games and next/previous page cursors
+    """
+    user_id = int(get_jwt_identity())
+    
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+    days = request.args.get('days', type=int)
+    result_filter = request.args.get('result')
+    if result_filter not in (None, '', 'won', 'lost'):
+        return error_response("Invalid result filter. Must be 'won' or 'lost'", status_code=400)
+    won = {'won': True, 'lost': False}.get(result_filter)
+    
+    result = game_service.get_user_game_history(
+        user_id, game_mode, limit, cursor=request.args.get('cursor'), won=won, days=days
+    )
+    if not result['success']:
+        status_code = 400 if result['error'] == 'Invalid cursor' else 500
+        return error_response(result['error'], status_code=status_code)
+    
+    return success_response({
+        'game_mode': game_mode.value if game_mode else None,
+        'games': result['games'],
+        'count': len(result['games']),
+        'next_cursor': result['next_cursor'],
+        'prev_cursor': result['prev_cursor']
+    })
+
+
+@game_bp.route('/history', methods=['GET'])
+@jwt_required()
+def get_all_game_history():
+    """Get user's game history across game modes.
+    
+    Query parameters:
+        mode: Game mode to filter by ('classic' or 'disney', default: all)
+        result: 'won' or 'lost' to filter by outcome
+        days: Only games from the last number of days
+        limit: Maximum number of games to return (default: 10, max: 50)
+        cursor: next_cursor or prev_cursor from a previous response
+        
+    Returns:
+        JSON response with game history
+    """
+    try:
+        mode = None
+        if request.args.get('mode'):
+            try:
+                mode = GameMode(request.args['mode'].lower())
+            except ValueError:
+                return error_response("Invalid game mode. Must be 'classic' or 'disney'", status_code=400)
+        
+        return _game_history(mode)
+        
+    except Exception as e:
+        logger.error(f"Error getting game history: {e}")
+        return error_response("Internal server error", status_code=500)
+
+
+@game_bp.route('/history/export', methods=['GET'])
+@jwt_required()
+def export_game_history():
+    """Download user's full game history as a streamed file.
+    
+    Rows are written to the response as they are read from the database,
+    so the export never holds the whole history in memory.
+    
+    Query parameters:
+        format: 'ndjson' (default) or 'csv'
+        mode: Game mode to filter by ('classic' or 'disney', default: all)
+        
+    Returns:
+        Streaming NDJSON or CSV response
+    """
+    try:
+        user_id = int(get_jwt_identity())
+        
+        export_format = request.args.get('format', 'ndjson').lower()
+        if export_format not in EXPORT_FORMATS:
+            return error_response("Invalid format. Must be 'ndjson' or 'csv'", status_code=400)
+        
+        mode = None
+        if request.args.get('mode'):
+            try:
+                mode = GameMode(request.args['mode'].lower())
+            except ValueError:
+                return error_response("Invalid game mode. Must be 'classic' or 'disney'", status_code=400)
+        
+        lines = game_service.export_game_history(user_id, export_format, mode)
+        return Response(
+            stream_with_context(lines),
+            mimetype=EXPORT_MIMETYPES[export_format],
+            headers={'Content-Disposition': f'attachment; filename="wordle-history.{export_format}"'}
+        )
+        
+    except Exception as e:
+        logger.error(f"Error exporting game history: {e}")
+        return error_response("Internal server error", status_code=500)
+
+
 @game_bp.route('/history/<game_mode>', methods=['GET'])
 @jwt_required()
 def get_game_history(game_mode: str):
@@ -198,7 +310,10 @@ def get_game_history(game_mode: str):
         game_mode: Game mode ('classic' or 'disney')
         
     Query parameters:
+        result: 'won' or 'lost' to filter by outcome
+        days: Only games from the last number of days
         limit: Maximum number of games to return (default: 10, max: 50)
+        cursor: next_cursor or prev_cursor from a previous response
         
     Returns:
         JSON response with game history
@@ -210,28 +325,8 @@ def get_game_history(game_mode: str):
         except ValueError:
             return error_response("Invalid game mode. Must be 'classic' or 'disney'", status_code=400)
         
-        # Get user ID from JWT token
-        current_user_id = get_jwt_identity()
-        user_id = int(current_user_id)
-        
-        # Get limit parameter
-        limit = request.args.get('limit', 10, type=int)
-        if limit > 50:
-            limit = 50
-        elif limit < 1:
-            limit = 1
-        
-        # Get game history
-        history = game_service.get_user_game_history(user_id, mode, limit)
+        return _game_history(mode)
         
-        return success_response({
-            'game_mode': mode.value,
-            'history': history,
-            'count': len(history)
-        })
-        
-    except ValueError as e:
-        return error_response(str(e), status_code=400)
     except Exception as e:
         logger.error(f"Error getting game history for mode {game_mode}: {e}")
         return error_response("Internal server error", status_code=500)
@@ -204,7 +204,8 @@ def get_user_rank(game_mode: str):
         game_mode: Game mode ('classic' or 'disney')
         
     Query parameters:
-        metric: Ranking metric ('win_percentage', 'total_wins', 'current_streak') - default: 'win_percentage'
+        metric: Ranking metric ('win_percentage', 'total_wins', 'current_streak', or 'all'
+            for every metric in one call) - default: 'win_percentage'
         
     Returns:
         JSON response with user's rank information
@@ -224,12 +225,15 @@ def get_user_rank(game_mode: str):
         metric = request.args.get('metric', 'win_percentage').lower()
         
         # Validate metric
-        valid_metrics = ['win_percentage', 'total_wins', 'current_streak']
+        valid_metrics = ['win_percentage', 'total_wins', 'current_streak', 'all']
         if metric not in valid_metrics:
             return error_response(f"Invalid metric. Must be one of: {', '.join(valid_metrics)}", status_code=400)
         
         # Get user rank
-        rank_info = stats_service.get_user_rank(user_id, mode, metric)
+        if metric == 'all':
+            rank_info = stats_service.get_user_ranks(user_id, mode)
+        else:
+            rank_info = stats_service.get_user_rank(user_id, mode, metric)
         
         return success_response(rank_info)
         
@@ -30,6 +30,19 @@ class Settings(BaseSettings):
     
     # Rate Limiting
     rate_limit_storage_url: str = Field(default="memory://", env="RATE_LIMIT_STORAGE_URL")
+    rate_limit_strategy: str = Field(default="sliding-window-counter", env="RATE_LIMIT_STRATEGY")
+    
+    # Game Engine
+    feedback_table_enabled: bool = Field(default=False, env="FEEDBACK_TABLE_ENABLED")
+    feedback_table_dir: Optional[str] = Field(default=None, env="FEEDBACK_TABLE_DIR")
+    lexicon_refresh_seconds: float = Field(default=60.0, env="LEXICON_REFRESH_SECONDS")
+    pack_guesses: bool = Field(default=True, env="PACK_GUESSES")
+    hot_session_cache_size: int = Field(default=10000, env="HOT_SESSION_CACHE_SIZE")
+    
+    # Caching
+    cache_url: str = Field(default="memory://", env="CACHE_URL")
+    cache_max_entries: int = Field(default=10000, env="CACHE_MAX_ENTRIES")
+    cache_max_bytes: int = Field(default=64 * 1024 * 1024, env="CACHE_MAX_BYTES")
     
     # Logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -71,6 +84,15 @@ def get_flask_config() -> dict:
         "JWT_ACCESS_TOKEN_EXPIRES": timedelta(seconds=settings.jwt_access_token_expires),
         "JWT_REFRESH_TOKEN_EXPIRES": timedelta(seconds=settings.jwt_refresh_token_expires),
         "RATELIMIT_STORAGE_URL": settings.rate_limit_storage_url,
+        "RATELIMIT_STRATEGY": settings.rate_limit_strategy,
+        "FEEDBACK_TABLE_ENABLED": settings.feedback_table_enabled,
+        "FEEDBACK_TABLE_DIR": settings.feedback_table_dir,
+        "LEXICON_REFRESH_SECONDS": settings.lexicon_refresh_seconds,
+        "PACK_GUESSES": settings.pack_guesses,
+        "HOT_SESSION_CACHE_SIZE": settings.hot_session_cache_size,
+        "CACHE_URL": settings.cache_url,
+        "CACHE_MAX_ENTRIES": settings.cache_max_entries,
+        "CACHE_MAX_BYTES": settings.cache_max_bytes,
         "JWT_TOKEN_LOCATION": ["headers", "cookies"],
         "JWT_COOKIE_CSRF_PROTECT": False,
     } 
\ No newline at end of file
@@ -1,5 +1,5 @@
 """Database package."""
 
-from .connection import db, init_db, get_db_session
+from .connection import db, init_db, get_db_session, unit_of_work, in_unit_of_work, run_after_commit
  
-__all__ = ["db", "init_db", "get_db_session"] 
\ No newline at end of file
+__all__ = ["db", "init_db", "get_db_session", "unit_of_work", "in_unit_of_work", "run_after_commit"] 
\ No newline at end of file
@@ -1,17 +1,29 @@
 """Database connection and session management."""
 
-from typing import Optional
+import logging
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
 
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from ..config import get_flask_config
 
+logger = logging.getLogger(__name__)
+
 # Initialize SQLAlchemy instance
 db = SQLAlchemy()
 migrate = Migrate()
 
+# Session.info key holding the unit-of-work nesting depth
+UNIT_OF_WORK_DEPTH = 'unit_of_work_depth'
+
+# Session.info key holding callbacks to run once the transaction commits
+AFTER_COMMIT_CALLBACKS = 'after_commit_callbacks'
+
 
 def init_db(app: Flask) -> None:
     """Initialize database with Flask application.
@@ -38,4 +50,83 @@ def get_db_session():
     Returns:
         SQLAlchemy database session
     """
-    return db.session 
\ No newline at end of file
+    return db.session
+
+
+@contextmanager
+def unit_of_work(session=None) -> Iterator:
+    """Group repository writes into a single transaction.
+    
+    Inside the block repository writes only flush; the outermost block commits
+    on success and rolls back if an exception escapes. Nested blocks join the
+    enclosing transaction.
+    
+    Args:
+        session: Database session (defaults to the request-scoped session)
+        
+    Yields:
+        The database session
+    """
+    session = session if session is not None else db.session
+    depth = session.info.get(UNIT_OF_WORK_DEPTH, 0)
+    session.info[UNIT_OF_WORK_DEPTH] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            session.commit()
+    except BaseException:
+        if depth == 0:
+            session.rollback()
+            # Rolling back a session that never began a transaction fires no events
+            session.info.pop(AFTER_COMMIT_CALLBACKS, None)
+        raise
+    finally:
+        session.info[UNIT_OF_WORK_DEPTH] = depth
+
+
+def in_unit_of_work(session=None) -> bool:
+    """Check if a unit of work is active on a session.
+    
+    Args:
+        session: Database session (defaults to the request-scoped session)
+        
+    Returns:
+        True if writes should flush instead of commit
+    """
+    session = session if session is not None else db.session
+    return session.info.get(UNIT_OF_WORK_DEPTH, 0) > 0
+
+
+def run_after_commit(callback: Callable[[], None], session=None) -> None:
+    """Run a callback once the current unit of work commits.
+    
+    Callbacks registered inside a unit of work are dropped if it rolls back,
+    so side effects such as cache invalidation only happen for committed
+    changes. Outside a unit of work writes are already committed and the
+    callback runs immediately.
+    
+    Args:
+        callback: Function taking no arguments
+        session: Database session (defaults to the request-scoped session)
+    """
+    session = session if session is not None else db.session
+    if not in_unit_of_work(session):
+        callback()
+        return
+    session.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(Session, 'after_commit')
+def _run_after_commit_callbacks(session) -> None:
+    """Run callbacks registered with run_after_commit."""
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS, []):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Error running after-commit callback {callback!r}: {e}")
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_after_commit_callbacks(session, previous_transaction) -> None:
+    """Drop callbacks registered for a transaction that rolled back."""
+    session.info.pop(AFTER_COMMIT_CALLBACKS, None)
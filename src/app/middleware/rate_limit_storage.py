@@ -0,0 +1,204 @@
+"""SQLite rate limit storage shared by all worker processes on a host."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from math import floor
+from typing import Tuple
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+
+logger = logging.getLogger(__name__)
+
+# Counter writes between sweeps of expired rows
+SQLITE_PURGE_INTERVAL = 1000
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """Rate limit counters kept in a SQLite WAL database shared by all workers.
+
+    Registered with the limits library for 'sqlite:///path/to/file' storage
+    URIs, so limits hold across every worker process on the host without an
+    external service. Sliding window checks read both window counters and
+    increment the current one inside a single write transaction, so
+    concurrent workers cannot overshoot a limit.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options):
+        """Initialize storage.
+
+        Args:
+            uri: 'sqlite:///path/to/file' URI of the shared database
+            wrap_exceptions: Wrap SQLite errors in limits.errors.StorageError
+            options: Unused storage options
+        """
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = uri[len('sqlite:///'):]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_purge = 0
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, count INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    @property
+    def base_exceptions(self):
+        """Exceptions raised by the storage."""
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening a new one after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _increment(self, conn: sqlite3.Connection, key: str, expiry: float, amount: int, now: float) -> int:
+        """Increment a counter, restarting it if it expired. Caller holds a write transaction."""
+        conn.execute(
+            "INSERT INTO rate_limits (key, count, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "count = CASE WHEN expires_at <= ? THEN excluded.count ELSE count + excluded.count END, "
+            "expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END",
+            (key, amount, now + expiry, now, now)
+        )
+        return conn.execute("SELECT count FROM rate_limits WHERE key = ?", (key,)).fetchone()[0]
+
+    def _purge_if_due(self, conn: sqlite3.Connection, now: float) -> None:
+        """Sweep expired counters every SQLITE_PURGE_INTERVAL writes."""
+        with self._lock:
+            self._writes_since_purge += 1
+            due = self._writes_since_purge >= SQLITE_PURGE_INTERVAL
+            if due:
+                self._writes_since_purge = 0
+        if due:
+            conn.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Increment the counter for a key.
+
+        Args:
+            key: Rate limit key
+            expiry: Seconds until a new counter expires
+            amount: Amount to add
+
+        Returns:
+            Counter value after the increment
+        """
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            count = self._increment(conn, key, expiry, amount, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._purge_if_due(conn, now)
+        return count
+
+    def get(self, key: str) -> int:
+        """Get the current counter value for a key, or 0 if it expired."""
+        row = self._connection().execute(
+            "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        """Get the time a key's counter expires."""
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        """Check the database is reachable."""
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Rate limit storage check failed: {e}")
+            return False
+
+    def reset(self) -> int:
+        """Remove all counters and return how many there were."""
+        return self._connection().execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        """Remove the counter for a key."""
+        self._connection().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def _window_counts(self, conn: sqlite3.Connection, previous_key: str, current_key: str,
+                       expiry: int, now: float) -> Tuple[int, float, int, float]:
+        """Read both windows of a sliding window counter."""
+        counts = dict(conn.execute(
+            "SELECT key, count FROM rate_limits WHERE key IN (?, ?) AND expires_at > ?",
+            (previous_key, current_key, now)
+        ).fetchall())
+        previous_count = counts.get(previous_key, 0)
+        current_count = counts.get(current_key, 0)
+        previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        """Take an entry if the weighted count of both windows stays within the limit.
+
+        Args:
+            key: Rate limit key
+            limit: Entries allowed per window
+            expiry: Window length in seconds
+            amount: Entries to take
+
+        Returns:
+            True if the entries were taken
+        """
+        if amount > limit:
+            return False
+
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            previous_count, previous_ttl, current_count, _ = self._window_counts(
+                conn, previous_key, current_key, expiry, now
+            )
+            weighted_count = previous_count * previous_ttl / expiry + current_count
+            acquired = floor(weighted_count) + amount <= limit
+            if acquired:
+                # The current window is read as the previous one for another full window
+                self._increment(conn, current_key, 2 * expiry, amount, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if acquired:
+            self._purge_if_due(conn, now)
+        return acquired
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        """Get (previous count, previous TTL, current count, current TTL) for a key."""
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self._window_counts(self._connection(), previous_key, current_key, expiry, now)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        """Remove both window counters for a key."""
+        now = time.time()
+        for window_key in self.sliding_window_keys(key, expiry, now):
+            self.clear(window_key)
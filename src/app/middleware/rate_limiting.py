@@ -1,8 +1,28 @@
 """Enhanced rate limiting configuration for different endpoints."""
 
+import time
+
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from flask import Flask
+from flask import Flask, current_app
+
+# Registers the 'sqlite' storage scheme with the limits library
+from .rate_limit_storage import SQLiteStorage  # noqa: F401
+
+
+def get_user_or_remote_address() -> str:
+    """Rate limit key for the authenticated user, falling back to the client IP.
+    
+    Returns:
+        'user:<identity>' when the request carries a valid JWT, else the remote address
+    """
+    try:
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+    except Exception:
+        identity = None
+    return f"user:{identity}" if identity is not None else get_remote_address()
 
 
 class RateLimitConfig:
@@ -17,8 +37,10 @@ class RateLimitConfig:
         
         # Game endpoints - moderate limits
         'game_guess': '30 per minute',
+        'game_start': '30 per minute',
         'game_daily': '60 per minute',
         'game_validate': '100 per minute',
+        'game_export': '10 per hour',
         
         # Statistics endpoints - higher limits
         'stats_user': '200 per minute',
@@ -31,14 +53,40 @@ class RateLimitConfig:
         'frontend_pages': '1000 per hour'
     }
     
+    # Endpoint name -> (RATE_LIMITS entry, key function)
+    ENDPOINT_LIMITS = {
+        # Unauthenticated, so throttled per client IP
+        'auth.register': ('auth_register', get_remote_address),
+        'auth.login': ('auth_login', get_remote_address),
+        'auth.refresh': ('auth_refresh', get_remote_address),
+        
+        # Authenticated, so throttled per player wherever they connect from
+        'game.submit_guess': ('game_guess', get_user_or_remote_address),
+        'game.get_daily_puzzle': ('game_daily', get_user_or_remote_address),
+        'game.start_new_game': ('game_start', get_user_or_remote_address),
+        'game.validate_word': ('game_validate', get_user_or_remote_address),
+        'game.export_game_history': ('game_export', get_user_or_remote_address),
+        'stats.get_user_stats': ('stats_user', get_user_or_remote_address),
+        'stats.get_my_stats': ('stats_user', get_user_or_remote_address),
+        'stats.get_leaderboard': ('stats_leaderboard', get_user_or_remote_address)
+    }
+    
     @staticmethod
     def init_limiter(app: Flask) -> Limiter:
-        """Initialize and configure the rate limiter."""
+        """Initialize and configure the rate limiter.
+        
+        Counters live in RATELIMIT_STORAGE_URL. 'memory://' keeps them per
+        process, so with several workers each enforces its own copy of every
+        limit; 'sqlite:///path/to/file' shares them between all workers on
+        the host, and any URI supported by the limits library (e.g. redis://)
+        shares them between hosts.
+        """
         limiter = Limiter(
             app=app,
             key_func=get_remote_address,
             default_limits=["1000 per hour", "100 per minute"],
-            storage_uri="memory://",  # Use Redis in production
+            storage_uri=app.config.get('RATELIMIT_STORAGE_URL', 'memory://'),
+            strategy=app.config.get('RATELIMIT_STRATEGY', 'sliding-window-counter'),
             headers_enabled=True,
             retry_after="http-date"
         )
@@ -47,59 +95,39 @@ class RateLimitConfig:
     
     @staticmethod
     def apply_limits(limiter: Limiter, app: Flask) -> None:
-        """Apply rate limits to specific endpoints."""
-        
-        # Authentication endpoints
-        @limiter.limit(RateLimitConfig.RATE_LIMITS['auth_register'])
-        def limit_register():
-            pass
-        
-        @limiter.limit(RateLimitConfig.RATE_LIMITS['auth_login'])
-        def limit_login():
-            pass
+        """Apply rate limits to specific endpoints.
         
-        @limiter.limit(RateLimitConfig.RATE_LIMITS['auth_refresh'])
-        def limit_refresh():
-            pass
+        Must run after the blueprints are registered. Each view in
+        ENDPOINT_LIMITS is replaced with a limited version, which is checked
+        before the request reaches the view and replaces the default limits.
         
-        # Apply limits to blueprints
-        with app.app_context():
-            # Get blueprints and apply limits
-            for blueprint_name, blueprint in app.blueprints.items():
-                if blueprint_name == 'auth_bp':
-                    # Apply auth limits
-                    for endpoint in ['register', 'login', 'refresh']:
-                        if hasattr(blueprint, endpoint):
-                            limiter.limit(
-                                RateLimitConfig.RATE_LIMITS[f'auth_{endpoint}']
-                            )(getattr(blueprint, endpoint))
-                
-                elif blueprint_name == 'game_bp':
-                    # Apply game limits
-                    for endpoint in ['guess', 'daily', 'validate']:
-                        if hasattr(blueprint, endpoint):
-                            limiter.limit(
-                                RateLimitConfig.RATE_LIMITS[f'game_{endpoint}']
-                            )(getattr(blueprint, endpoint))
-                
-                elif blueprint_name == 'stats_bp':
-                    # Apply stats limits
-                    limiter.limit(
-                        RateLimitConfig.RATE_LIMITS['stats_user']
-                    )(blueprint)
+        Args:
+            limiter: Application rate limiter
+            app: Flask application instance
+        """
+        for endpoint, (limit_name, key_func) in RateLimitConfig.ENDPOINT_LIMITS.items():
+            view = app.view_functions.get(endpoint)
+            if view is None:
+                app.logger.warning(f"Rate limit configured for unknown endpoint: {endpoint}")
+                continue
+            app.view_functions[endpoint] = limiter.limit(
+                RateLimitConfig.RATE_LIMITS[limit_name], key_func=key_func
+            )(view)
     
     @staticmethod
     def get_error_handler():
         """Get custom error handler for rate limit exceeded."""
         def ratelimit_handler(e):
             """Handle rate limit exceeded errors."""
+            current_limit = current_app.extensions['limiter'].current_limit
+            reset_time = int(current_limit.reset_at) if current_limit else None
             return {
                 'success': False,
                 'error': 'Rate limit exceeded. Please try again later.',
                 'data': {
-                    'retry_after': e.retry_after,
-                    'limit': e.limit,
-                    'reset_time': e.reset_time
+                    'retry_after': max(reset_time - int(time.time()), 0) if reset_time else None,
+                    'limit': e.description,
+                    'reset_time': reset_time
                 }
             }, 429
         
@@ -1,8 +1,100 @@
 """Security middleware for adding security headers and protections."""
 
-from flask import Flask, request, g
+import re
+from flask import Flask, current_app, request, g
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
+
+# URL substrings that mark a request as suspicious (matched case-insensitively)
+SUSPICIOUS_URL_PATTERNS = (
+    'script>', '<iframe', 'javascript:', 'vbscript:',
+    'onload=', 'onerror=', 'alert(', 'document.cookie',
+    '../', '..\\', '/etc/passwd', '/admin', '/config'
+)
+
+# User-Agent substrings that identify automated clients
+BOT_USER_AGENT_PATTERNS = ('bot', 'crawler', 'spider', 'scraper')
+
+
+def compile_request_scanner(url_patterns: Iterable[str], user_agent_patterns: Iterable[str]) -> "re.Pattern":
+    """Compile suspicious-request patterns into one case-insensitive regex.
+    
+    The regex is matched against the URL and User-Agent joined by a NUL
+    byte, so a single search covers both. URL patterns are flagged wherever
+    they appear; User-Agent patterns only match after the separator.
+    
+    Args:
+        url_patterns: Substrings to look for in the URL, including the query string
+        user_agent_patterns: Substrings to look for in the User-Agent
+        
+    Returns:
+        Compiled pattern
+    """
+    url_alternation = '|'.join(re.escape(pattern) for pattern in url_patterns)
+    agent_alternation = '|'.join(re.escape(pattern) for pattern in user_agent_patterns)
+    return re.compile(f"{url_alternation}|\\x00[^\\x00]*?(?:{agent_alternation})", re.IGNORECASE)
+
+
+# Scanner for SecurityMiddleware, compiled once at import
+SUSPICIOUS_REQUEST_SCANNER = compile_request_scanner(SUSPICIOUS_URL_PATTERNS, BOT_USER_AGENT_PATTERNS)
+
+# Headers sent on every response
+SECURITY_HEADERS = {
+    # Prevent XSS attacks
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    
+    # Content Security Policy (TEMP: allow 'unsafe-eval' for Alpine.js dev)
+    'Content-Security-Policy': (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.tailwindcss.com https://unpkg.com; "
+        "style-src 'self' 'unsafe-inline' https://cdn.tailwindcss.com; "
+        "font-src 'self' https:; "
+        "img-src 'self' data: https:; "
+        "connect-src 'self'; "
+        "frame-ancestors 'none'; "
+        "base-uri 'self'; "
+        "form-action 'self';"
+    ),
+    
+    # HTTPS enforcement (in production)
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+    
+    # Referrer policy
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
+    
+    # Permissions policy
+    'Permissions-Policy': (
+        'accelerometer=(), camera=(), geolocation=(), '
+        'gyroscope=(), magnetometer=(), microphone=(), '
+        'payment=(), usb=()'
+    )
+}
+
+# Cache control for dynamic responses
+NO_CACHE_HEADERS = {
+    'Cache-Control': 'no-cache, no-store, must-revalidate',
+    'Pragma': 'no-cache',
+    'Expires': '0'
+}
+
+# CORS headers for API endpoints
+API_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': 'http://127.0.0.1:8000',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+    'Access-Control-Max-Age': '3600'
+}
+
+# Seconds browsers may cache static files
+STATIC_MAX_AGE = 3600
+
+# Per-path header overrides applied on top of the route class headers
+DEFAULT_HEADER_OVERRIDES = {
+    # Game mode descriptions only change on deploy
+    '/api/game/modes': {'Cache-Control': 'public, max-age=3600', 'Pragma': None, 'Expires': None}
+}
 
 
 class SecurityMiddleware:
@@ -11,11 +103,16 @@ class SecurityMiddleware:
     def __init__(self, app: Flask = None):
         """Initialize security middleware."""
         self.app = app
+        self.scanner = SUSPICIOUS_REQUEST_SCANNER
+        self.static_prefix = '/static/'
+        self.class_headers: Dict[str, Dict[str, str]] = {}
+        self.path_headers: Dict[str, Dict[str, str]] = {}
         if app is not None:
             self.init_app(app)
     
     def init_app(self, app: Flask) -> None:
         """Initialize security middleware with Flask app."""
+        self._build_headers(app)
         app.before_request(self._before_request)
         app.after_request(self._after_request)
         
@@ -24,6 +121,43 @@ class SecurityMiddleware:
         def start_timer():
             g.start_time = time.time()
     
+    def _build_headers(self, app: Flask) -> None:
+        """Freeze the static response headers for each route class.
+        
+        Header values never change per request, so they are merged once
+        here and applied to each response with a single update.
+        
+        Args:
+            app: Flask application instance
+        """
+        self.static_prefix = f"{(app.static_url_path or '/static').rstrip('/')}/"
+        self.class_headers = {
+            'api': {**SECURITY_HEADERS, **NO_CACHE_HEADERS, **API_CORS_HEADERS},
+            'html': {**SECURITY_HEADERS, **NO_CACHE_HEADERS},
+            'static': {**SECURITY_HEADERS, 'Cache-Control': f'public, max-age={STATIC_MAX_AGE}'}
+        }
+        self.path_headers = {}
+        for path, headers in {**DEFAULT_HEADER_OVERRIDES, **app.config.get('SECURITY_HEADER_OVERRIDES', {})}.items():
+            self.override_headers(path, headers)
+    
+    def override_headers(self, path: str, headers: Dict[str, Any]) -> None:
+        """Replace some headers for one path.
+        
+        Args:
+            path: Exact request path
+            headers: Header values to use instead; None removes a header
+        """
+        merged = {**self.path_headers.get(path, self.class_headers[self._route_class(path)]), **headers}
+        self.path_headers[path] = {name: value for name, value in merged.items() if value is not None}
+    
+    def _route_class(self, path: str) -> str:
+        """Classify a request path as 'api', 'static' or 'html'."""
+        if path.startswith('/api/'):
+            return 'api'
+        if path.startswith(self.static_prefix):
+            return 'static'
+        return 'html'
+    
     def _before_request(self) -> None:
         """Process request before handling."""
         # Add request ID for tracking
@@ -31,53 +165,15 @@ class SecurityMiddleware:
         
         # Log suspicious requests
         if self._is_suspicious_request():
-            app = self.app or request.app
-            app.logger.warning(f"Suspicious request: {request.remote_addr} - {request.url}")
+            current_app.logger.warning(f"Suspicious request: {request.remote_addr} - {request.url}")
     
     def _after_request(self, response):
         """Add security headers to response."""
-        # Security headers
-        security_headers = {
-            # Prevent XSS attacks
-            'X-Content-Type-Options': 'nosniff',
-            'X-Frame-Options': 'DENY',
-            'X-XSS-Protection': '1; mode=block',
-            
-            # Content Security Policy (TEMP: allow 'unsafe-eval' for Alpine.js dev)
-            'Content-Security-Policy': (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.tailwindcss.com https://unpkg.com; "
-                "style-src 'self' 'unsafe-inline' https://cdn.tailwindcss.com; "
-                "font-src 'self' https:; "
-                "img-src 'self' data: https:; "
-                "connect-src 'self'; "
-                "frame-ancestors 'none'; "
-                "base-uri 'self'; "
-                "form-action 'self';"
-            ),
-            
-            # HTTPS enforcement (in production)
-            'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
-            
-            # Referrer policy
-            'Referrer-Policy': 'strict-origin-when-cross-origin',
-            
-            # Permissions policy
-            'Permissions-Policy': (
-                'accelerometer=(), camera=(), geolocation=(), '
-                'gyroscope=(), magnetometer=(), microphone=(), '
-                'payment=(), usb=()'
-            ),
-            
-            # Cache control for security
-            'Cache-Control': 'no-cache, no-store, must-revalidate',
-            'Pragma': 'no-cache',
-            'Expires': '0'
-        }
-        
-        # Add security headers
-        for header, value in security_headers.items():
-            response.headers[header] = value
+        path = request.path
+        headers = self.path_headers.get(path)
+        if headers is None:
+            headers = self.class_headers[self._route_class(path)]
+        response.headers.update(headers)
         
         # Add performance headers
         if hasattr(g, 'start_time'):
@@ -88,13 +184,6 @@ class SecurityMiddleware:
         if hasattr(g, 'request_id'):
             response.headers['X-Request-ID'] = g.request_id
         
-        # CORS headers for API endpoints
-        if request.path.startswith('/api/'):
-            response.headers['Access-Control-Allow-Origin'] = 'http://127.0.0.1:8000'
-            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-            response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
-            response.headers['Access-Control-Max-Age'] = '3600'
-        
         return response
     
     def _generate_request_id(self) -> str:
@@ -103,48 +192,10 @@ class SecurityMiddleware:
         return str(uuid.uuid4())[:8]
     
     def _is_suspicious_request(self) -> bool:
-        """Check if request is suspicious."""
-        # Check for common attack patterns
-        suspicious_patterns = [
-            'script>', '<iframe', 'javascript:', 'vbscript:',
-            'onload=', 'onerror=', 'alert(', 'document.cookie',
-            '../', '..\\', '/etc/passwd', '/admin', '/config'
-        ]
-        
-        # Check URL and query parameters
-        full_url = request.url.lower()
-        for pattern in suspicious_patterns:
-            if pattern in full_url:
-                return True
-        
-        # Check User-Agent for bots (basic check)
-        user_agent = request.headers.get('User-Agent', '').lower()
-        bot_indicators = ['bot', 'crawler', 'spider', 'scraper']
-        if any(indicator in user_agent for indicator in bot_indicators):
-            return True
-        
-        # Check for too many requests from same IP (basic rate limiting)
-        # This is a simple check - in production, use Redis or similar
-        if not hasattr(g, 'ip_requests'):
-            g.ip_requests = {}
-        
-        client_ip = request.remote_addr
-        current_time = time.time()
-        
-        # Clean old requests (older than 1 minute)
-        g.ip_requests = {
-            ip: [req_time for req_time in times if current_time - req_time < 60]
-            for ip, times in g.ip_requests.items()
-        }
-        
-        # Count current IP requests
-        if client_ip not in g.ip_requests:
-            g.ip_requests[client_ip] = []
-        
-        g.ip_requests[client_ip].append(current_time)
-        
-        # Flag if more than 100 requests per minute
-        if len(g.ip_requests[client_ip]) > 100:
-            return True
+        """Check if request is suspicious.
         
-        return False
\ No newline at end of file
+        The URL, query string and User-Agent are scanned in one pass of a
+        precompiled pattern. Request frequency is left to the rate limiter.
+        """
+        user_agent = request.headers.get('User-Agent', '')
+        return self.scanner.search(f"{request.url}\x00{user_agent}") is not None
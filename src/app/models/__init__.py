@@ -2,10 +2,10 @@
 
 from .base import Base, BaseModel, TimestampMixin, SoftDeleteMixin
 from .user import User
-from .game import GameMode, WordList, GameSession, UserStats
+from .game import GameMode, WordList, GameSession, UserStats, GlobalStats, UserAnswerHistory
  
 __all__ = [
     "Base", "BaseModel", "TimestampMixin", "SoftDeleteMixin", 
     "User", 
-    "GameMode", "WordList", "GameSession", "UserStats"
+    "GameMode", "WordList", "GameSession", "UserStats", "GlobalStats", "UserAnswerHistory"
 ] 
\ No newline at end of file
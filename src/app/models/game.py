@@ -4,12 +4,82 @@ import enum
 from datetime import date
 from typing import Optional, List, Dict, Any
 
-from sqlalchemy import Column, String, Boolean, Integer, Date, JSON, ForeignKey, Enum, UniqueConstraint, Index
+from sqlalchemy import Column, String, Boolean, Integer, Date, JSON, ForeignKey, Enum, UniqueConstraint, Index, LargeBinary
 from sqlalchemy.orm import relationship, validates
 
 from .base import BaseModel
 
 
+# Feedback states indexed by their base-3 digit, as in the feedback engine
+GUESS_FEEDBACK_STATES = ("absent", "present", "correct")
+_FEEDBACK_DIGITS = {state: digit for digit, state in enumerate(GUESS_FEEDBACK_STATES)}
+
+# Packed guesses: 5 ASCII letter codes followed by one base-3 feedback byte
+PACKED_GUESS_SIZE = 6
+
+# Feedback lists for every base-3 code, so unpacking is a table lookup
+_FEEDBACK_BY_CODE = tuple(
+    tuple(GUESS_FEEDBACK_STATES[code // 3 ** position % 3] for position in range(5))
+    for code in range(3 ** 5)
+)
+
+
+def pack_guess(word: str, feedback: List[str]) -> bytes:
+    """Encode one guess in PACKED_GUESS_SIZE bytes.
+    
+    Args:
+        word: 5-letter ASCII word
+        feedback: Feedback for each letter ("correct", "present", "absent")
+        
+    Returns:
+        Packed guess
+        
+    Raises:
+        ValueError: If the word or feedback cannot be packed
+    """
+    if len(word) != 5 or not word.isascii() or len(feedback) != 5:
+        raise ValueError(f"Cannot pack guess {word!r}")
+    try:
+        code = sum(_FEEDBACK_DIGITS[state] * 3 ** position for position, state in enumerate(feedback))
+    except KeyError as e:
+        raise ValueError(f"Unknown feedback state {e}") from None
+    return word.upper().encode('ascii') + bytes((code,))
+
+
+def unpack_guesses(data: bytes) -> List[Dict[str, Any]]:
+    """Decode packed guesses into the {"word", "feedback"} dicts used by the API.
+    
+    Args:
+        data: Concatenated packed guesses
+        
+    Returns:
+        List of guess dictionaries
+    """
+    return [
+        {
+            "word": data[offset:offset + 5].decode('ascii'),
+            "feedback": list(_FEEDBACK_BY_CODE[data[offset + 5]])
+        }
+        for offset in range(0, len(data), PACKED_GUESS_SIZE)
+    ]
+
+
+def decode_guesses(guesses_json: Optional[List[Dict[str, Any]]],
+                   guesses_packed: Optional[bytes]) -> List[Dict[str, Any]]:
+    """Get a session's guesses from whichever column holds them.
+    
+    Args:
+        guesses_json: Value of the JSON guesses column
+        guesses_packed: Value of the packed guesses column
+        
+    Returns:
+        List of guess dictionaries
+    """
+    if guesses_packed is not None:
+        return unpack_guesses(guesses_packed)
+    return guesses_json or []
+
+
 class GameMode(enum.Enum):
     """Game mode enumeration."""
     CLASSIC = "classic"
@@ -84,7 +154,9 @@ class GameSession(BaseModel):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
     answer_word = Column(String(5), nullable=False, index=True)  # The answer for this session
     game_mode = Column(Enum(GameMode), nullable=False, index=True)
-    guesses = Column(JSON, default=list, nullable=False)
+    guesses_json = Column('guesses', JSON, default=list, nullable=False)
+    # Compact encoding of guesses, see pack_guess; when set, guesses_json is empty
+    guesses_packed = Column(LargeBinary, nullable=True)
     completed = Column(Boolean, default=False, nullable=False, index=True)
     won = Column(Boolean, default=False, nullable=False, index=True)
     attempts_used = Column(Integer, default=0, nullable=False)
@@ -92,19 +164,36 @@ class GameSession(BaseModel):
     # Remove unique constraint on (user_id, daily_word_id)
     __table_args__ = (
         Index('ix_game_sessions_user_completed', 'user_id', 'completed'),
-        Index('ix_game_sessions_answer_word', 'answer_word'),
         Index('ix_game_sessions_user_created', 'user_id', 'created_at'),
+        Index('ix_game_sessions_user_id_id', 'user_id', 'id'),
     )
     
     # Relationships
     user = relationship("User", back_populates="game_sessions")
     
-    @validates('guesses')
-    def validate_guesses(self, key: str, guesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @property
+    def guesses(self) -> List[Dict[str, Any]]:
+        """Guesses made so far, decoded from packed storage if in use."""
+        return decode_guesses(self.guesses_json, self.guesses_packed)
+    
+    @guesses.setter
+    def guesses(self, guesses: List[Dict[str, Any]]) -> None:
+        """Replace the guesses, keeping the session's storage format.
+        
+        Args:
+            guesses: List of guess dictionaries
+        """
+        guesses = self.validate_guesses(guesses)
+        if self.guesses_packed is not None:
+            self.guesses_packed = b"".join(pack_guess(guess['word'], guess['feedback']) for guess in guesses)
+        else:
+            self.guesses_json = guesses
+    
+    @staticmethod
+    def validate_guesses(guesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Validate guesses format.
         
         Args:
-            key: Field name being validated
             guesses: List of guess dictionaries
             
         Returns:
@@ -156,19 +245,23 @@ class GameSession(BaseModel):
             word: The guessed word
             feedback: List of feedback for each letter ("correct", "present", "absent")
         """
-        if not self.guesses:
-            self.guesses = []
+        if self.guesses_packed is not None and word.isascii():
+            # Append in place of re-encoding the whole list
+            self.guesses_packed += pack_guess(word, feedback)
+            self.attempts_used = len(self.guesses_packed) // PACKED_GUESS_SIZE
+            return
         
-        guess_data = {
+        guesses = list(self.guesses)
+        guesses.append({
             "word": word.upper(),
             "feedback": feedback
-        }
+        })
         
-        # Create a new list to trigger SQLAlchemy update
-        new_guesses = self.guesses.copy()
-        new_guesses.append(guess_data)
-        self.guesses = new_guesses
-        self.attempts_used = len(self.guesses)
+        # Words outside A-Z cannot be packed, so the session falls back to JSON
+        self.guesses_packed = None
+        # Assign a new list to trigger SQLAlchemy update
+        self.guesses_json = guesses
+        self.attempts_used = len(guesses)
     
     def get_current_guess_count(self) -> int:
         """Get current number of guesses made.
@@ -176,7 +269,9 @@ class GameSession(BaseModel):
         Returns:
             Number of guesses made
         """
-        return len(self.guesses) if self.guesses else 0
+        if self.guesses_packed is not None:
+            return len(self.guesses_packed) // PACKED_GUESS_SIZE
+        return len(self.guesses_json) if self.guesses_json else 0
     
     def is_game_over(self) -> bool:
         """Check if game is over (won or max attempts reached).
@@ -286,9 +381,22 @@ class UserStats(BaseModel):
         Returns:
             Win percentage as a float (0-100)
         """
-        if self.games_played == 0:
+        return self.win_percentage(self.games_won, self.games_played)
+    
+    @staticmethod
+    def win_percentage(games_won: int, games_played: int) -> float:
+        """Calculate win percentage from raw column values.
+        
+        Args:
+            games_won: Number of games won
+            games_played: Number of games played
+            
+        Returns:
+            Win percentage as a float (0-100)
+        """
+        if not games_played:
             return 0.0
-        return round((self.games_won / self.games_played) * 100, 1)
+        return round((games_won / games_played) * 100, 1)
     
     def update_stats(self, won: bool, attempts_used: int) -> None:
         """Update statistics after a game.
@@ -318,15 +426,125 @@ class UserStats(BaseModel):
         Returns:
             Average number of guesses for won games
         """
-        if self.games_won == 0:
+        return self.average_guesses(self.guess_distribution, self.games_won)
+    
+    @staticmethod
+    def average_guesses(guess_distribution: Optional[Dict[str, int]], games_won: int) -> float:
+        """Calculate average guesses for won games from raw column values.
+        
+        Args:
+            guess_distribution: Dictionary mapping attempt number to count
+            games_won: Number of games won
+            
+        Returns:
+            Average number of guesses for won games
+        """
+        if not games_won or not guess_distribution:
             return 0.0
         
         total_guesses = 0
-        for attempts, count in self.guess_distribution.items():
+        for attempts, count in guess_distribution.items():
             total_guesses += int(attempts) * count
         
-        return round(total_guesses / self.games_won, 1)
+        return round(total_guesses / games_won, 1)
     
     def __repr__(self) -> str:
         """String representation of user stats."""
-        return f"<UserStats(user_id={self.user_id}, mode={self.game_mode.value}, win_rate={self.get_win_percentage()}%)>" 
\ No newline at end of file
+        return f"<UserStats(user_id={self.user_id}, mode={self.game_mode.value}, win_rate={self.get_win_percentage()}%)>" 
+
+
+class GlobalStats(BaseModel):
+    """Running totals of all players' statistics for a game mode."""
+    
+    __tablename__ = "global_stats"
+    
+    game_mode = Column(Enum(GameMode), nullable=False, unique=True)
+    total_players = Column(Integer, default=0, nullable=False)
+    total_games = Column(Integer, default=0, nullable=False)
+    total_wins = Column(Integer, default=0, nullable=False)
+    
+    # Global guess distribution, one counter per attempt count
+    dist_1 = Column(Integer, default=0, nullable=False)
+    dist_2 = Column(Integer, default=0, nullable=False)
+    dist_3 = Column(Integer, default=0, nullable=False)
+    dist_4 = Column(Integer, default=0, nullable=False)
+    dist_5 = Column(Integer, default=0, nullable=False)
+    dist_6 = Column(Integer, default=0, nullable=False)
+    
+    def get_guess_distribution(self) -> Dict[str, int]:
+        """Get the global guess distribution.
+        
+        Returns:
+            Dictionary mapping attempt number to count of won games
+        """
+        return {str(i): getattr(self, f'dist_{i}') or 0 for i in range(1, 7)}
+    
+    def __repr__(self) -> str:
+        """String representation of global stats."""
+        return f"<GlobalStats(mode={self.game_mode.value}, players={self.total_players}, games={self.total_games})>"
+
+
+class UserAnswerHistory(BaseModel):
+    """Bitset of answer words a user has already been given in a game mode."""
+    
+    __tablename__ = "user_answer_history"
+    
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
+    game_mode = Column(Enum(GameMode), nullable=False)
+    lexicon_version = Column(String(64), nullable=True)  # Answer pool the bit positions refer to
+    seen = Column(LargeBinary, default=b"", nullable=False)
+    seen_count = Column(Integer, default=0, nullable=False)
+    
+    # Unique constraint: one history record per user per game mode
+    __table_args__ = (
+        UniqueConstraint('user_id', 'game_mode', name='uix_user_answer_history_user_mode'),
+    )
+    
+    # Relationships
+    user = relationship("User", back_populates="answer_history")
+    
+    def has_seen(self, position: int) -> bool:
+        """Check if the answer at a pool position has been played.
+        
+        Args:
+            position: Index of the answer in the answer pool
+            
+        Returns:
+            True if the answer has been played, False otherwise
+        """
+        seen = self.seen or b""
+        byte_index = position >> 3
+        return byte_index < len(seen) and bool(seen[byte_index] >> (position & 7) & 1)
+    
+    def mark_seen(self, position: int) -> None:
+        """Mark the answer at a pool position as played.
+        
+        Args:
+            position: Index of the answer in the answer pool
+        """
+        if self.has_seen(position):
+            return
+        
+        seen = bytearray(self.seen or b"")
+        byte_index = position >> 3
+        if byte_index >= len(seen):
+            seen.extend(bytes(byte_index + 1 - len(seen)))
+        seen[byte_index] |= 1 << (position & 7)
+        
+        # Assign new bytes to trigger SQLAlchemy update
+        self.seen = bytes(seen)
+        self.seen_count = (self.seen_count or 0) + 1
+    
+    def reset(self, lexicon_version: Optional[str] = None) -> None:
+        """Forget all played answers.
+        
+        Args:
+            lexicon_version: Answer pool version the new bitset refers to
+        """
+        self.seen = b""
+        self.seen_count = 0
+        self.lexicon_version = lexicon_version
+    
+    def __repr__(self) -> str:
+        """String representation of answer history."""
+        return f"<UserAnswerHistory(user_id={self.user_id}, mode={self.game_mode.value}, seen={self.seen_count})>"
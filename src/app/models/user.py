@@ -24,6 +24,7 @@ class User(BaseModel):
     # Relationships
     game_sessions = relationship("GameSession", back_populates="user", cascade="all, delete-orphan")
     user_stats = relationship("UserStats", back_populates="user", cascade="all, delete-orphan")
+    answer_history = relationship("UserAnswerHistory", back_populates="user", cascade="all, delete-orphan")
     
     @validates('email')
     def validate_email(self, key: str, address: str) -> str:
@@ -2,12 +2,14 @@
 
 from .base_repository import BaseRepository
 from .user_repository import UserRepository
-from .game_repository import WordListRepository, GameSessionRepository, UserStatsRepository
+from .game_repository import WordListRepository, GameSessionRepository, UserStatsRepository, GlobalStatsRepository, UserAnswerHistoryRepository
 
 __all__ = [
     "BaseRepository", 
     "UserRepository",
     "WordListRepository", 
     "GameSessionRepository", 
-    "UserStatsRepository"
+    "UserStatsRepository",
+    "GlobalStatsRepository",
+    "UserAnswerHistoryRepository"
 ] 
\ No newline at end of file
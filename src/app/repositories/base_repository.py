@@ -6,7 +6,7 @@ from typing import Type, TypeVar, Generic, Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-from ..database import get_db_session
+from ..database import get_db_session, in_unit_of_work
 from ..models.base import BaseModel
 
 T = TypeVar('T', bound=BaseModel)
@@ -26,6 +26,30 @@ class BaseRepository(Generic[T]):
         self.model_class = model_class
         self.session = get_db_session()
     
+    def _save(self) -> None:
+        """Commit pending changes, or only flush them inside a unit of work."""
+        if in_unit_of_work(self.session):
+            self.session.flush()
+        else:
+            self.session.commit()
+    
+    def _rollback(self, error: Exception) -> None:
+        """Roll back after a failed operation.
+        
+        Inside a unit of work the error is re-raised instead, so the whole
+        unit is rolled back at its boundary rather than committing a partial
+        transaction.
+        
+        Args:
+            error: Exception that caused the failure
+            
+        Raises:
+            Exception: The original error, when inside a unit of work
+        """
+        if in_unit_of_work(self.session):
+            raise error
+        self.session.rollback()
+    
     def get_by_id(self, id: int) -> Optional[T]:
         """Get model instance by ID.
         
@@ -41,7 +65,7 @@ class BaseRepository(Generic[T]):
             ).first()
         except SQLAlchemyError as e:
             logger.error(f"Error getting {self.model_class.__name__} by ID {id}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return None
     
     def get_all(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[T]:
@@ -65,7 +89,7 @@ class BaseRepository(Generic[T]):
             return query.all()
         except SQLAlchemyError as e:
             logger.error(f"Error getting all {self.model_class.__name__}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return []
     
     def create(self, data: Dict[str, Any]) -> Optional[T]:
@@ -80,12 +104,13 @@ class BaseRepository(Generic[T]):
         try:
             instance = self.model_class(**data)
             self.session.add(instance)
-            self.session.commit()
-            self.session.refresh(instance)
+            self._save()
+            if not in_unit_of_work(self.session):
+                self.session.refresh(instance)
             return instance
         except SQLAlchemyError as e:
             logger.error(f"Error creating {self.model_class.__name__}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return None
     
     def update(self, id: int, data: Dict[str, Any]) -> Optional[T]:
@@ -104,12 +129,13 @@ class BaseRepository(Generic[T]):
                 return None
             
             instance.update_from_dict(data)
-            self.session.commit()
-            self.session.refresh(instance)
+            self._save()
+            if not in_unit_of_work(self.session):
+                self.session.refresh(instance)
             return instance
         except SQLAlchemyError as e:
             logger.error(f"Error updating {self.model_class.__name__} {id}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return None
     
     def delete(self, id: int) -> bool:
@@ -127,11 +153,11 @@ class BaseRepository(Generic[T]):
                 return False
             
             self.session.delete(instance)
-            self.session.commit()
+            self._save()
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error deleting {self.model_class.__name__} {id}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return False
     
     def count(self) -> int:
@@ -2,16 +2,25 @@
 
 import logging
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Iterable, Iterator
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, or_, delete, desc, func, insert, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
 
 from .base_repository import BaseRepository
-from ..models.game import GameMode, WordList, GameSession, UserStats
+from ..models.game import GameMode, WordList, GameSession, UserStats, GlobalStats, UserAnswerHistory
+from ..models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Rows per statement when syncing word lists; keeps bound parameters under SQLite's limit
+WORD_SYNC_BATCH_SIZE = 500
+
+# Rows fetched per round trip when streaming a user's sessions
+SESSION_EXPORT_BATCH_SIZE = 500
+
 
 class WordListRepository(BaseRepository[WordList]):
     """Repository for WordList model with specific query methods."""
@@ -39,7 +48,7 @@ class WordListRepository(BaseRepository[WordList]):
             ).first()
         except SQLAlchemyError as e:
             logger.error(f"Error getting word {word} for mode {game_mode}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return None
     
     def is_valid_word(self, word: str, game_mode: GameMode) -> bool:
@@ -110,9 +119,125 @@ class WordListRepository(BaseRepository[WordList]):
             return query.all()
         except SQLAlchemyError as e:
             logger.error(f"Error getting answer words for mode {game_mode}: {e}")
-            self.session.rollback()
+            self._rollback(e)
+            return []
+
+    def get_words_by_mode(self, game_mode: GameMode) -> List[Tuple[str, bool]]:
+        """Get every word for a game mode as lightweight tuples.
+
+        Args:
+            game_mode: Game mode to get words for
+
+        Returns:
+            List of (word, is_answer) tuples ordered by frequency rank
+        """
+        try:
+            rows = self.session.query(WordList.word, WordList.is_answer).filter(
+                WordList.game_mode == game_mode
+            ).order_by(WordList.frequency_rank.asc().nullslast(), WordList.word.asc()).all()
+            return [(word, is_answer) for word, is_answer in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting words for mode {game_mode}: {e}")
+            self._rollback(e)
             return []
 
+    def get_word_list_version(self, game_mode: GameMode) -> Optional[str]:
+        """Get a cheap version stamp for a game mode's word list.
+
+        The stamp changes whenever words are inserted, deleted or updated.
+
+        Args:
+            game_mode: Game mode to get the version for
+
+        Returns:
+            Version stamp string, or None if it could not be read
+        """
+        try:
+            count, max_id, last_updated = self.session.query(
+                func.count(WordList.id),
+                func.max(WordList.id),
+                func.max(WordList.updated_at)
+            ).filter(WordList.game_mode == game_mode).one()
+            return f"{count}:{max_id or 0}:{last_updated.isoformat() if last_updated else ''}"
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting word list version for mode {game_mode}: {e}")
+            self._rollback(e)
+            return None
+
+    def sync_words(self, game_mode: GameMode, words: Iterable[Tuple[str, bool, int]],
+                   delete_missing: bool = False) -> Optional[Dict[str, int]]:
+        """Make a game mode's word list match the given words.
+        
+        The existing rows are read once and diffed against the new list, then
+        only the differences are written in batched statements: multi-row
+        inserts (ON CONFLICT DO NOTHING where supported, so concurrent loads
+        stay idempotent), primary-key updates and id-list deletes. Unchanged
+        words are not touched, so a repeated load writes nothing and only
+        changed rows are locked.
+        
+        Args:
+            game_mode: Game mode to sync
+            words: (word, is_answer, frequency_rank) tuples
+            delete_missing: Delete words not in the new list
+            
+        Returns:
+            Counts of inserted, updated, deleted and unchanged words, or None on error
+        """
+        try:
+            wanted = {}
+            for word, is_answer, frequency_rank in words:
+                wanted.setdefault(word.upper(), (is_answer, frequency_rank))
+            
+            existing = {
+                word: (word_id, is_answer, frequency_rank)
+                for word_id, word, is_answer, frequency_rank in self.session.query(
+                    WordList.id, WordList.word, WordList.is_answer, WordList.frequency_rank
+                ).filter(WordList.game_mode == game_mode)
+            }
+            
+            inserts = [
+                {'word': word, 'game_mode': game_mode, 'is_answer': is_answer, 'frequency_rank': frequency_rank}
+                for word, (is_answer, frequency_rank) in wanted.items() if word not in existing
+            ]
+            updates = [
+                {'id': existing[word][0], 'is_answer': is_answer, 'frequency_rank': frequency_rank}
+                for word, (is_answer, frequency_rank) in wanted.items()
+                if word in existing and existing[word][1:] != (is_answer, frequency_rank)
+            ]
+            deletes = [word_id for word, (word_id, _, _) in existing.items() if word not in wanted] if delete_missing else []
+            
+            statement = self._insert_ignoring_conflicts()
+            for start in range(0, len(inserts), WORD_SYNC_BATCH_SIZE):
+                self.session.execute(statement, inserts[start:start + WORD_SYNC_BATCH_SIZE])
+            for start in range(0, len(updates), WORD_SYNC_BATCH_SIZE):
+                self.session.execute(update(WordList), updates[start:start + WORD_SYNC_BATCH_SIZE])
+            for start in range(0, len(deletes), WORD_SYNC_BATCH_SIZE):
+                self.session.execute(
+                    delete(WordList).where(WordList.id.in_(deletes[start:start + WORD_SYNC_BATCH_SIZE])),
+                    execution_options={'synchronize_session': False}
+                )
+            self._save()
+            
+            return {
+                'inserted': len(inserts),
+                'updated': len(updates),
+                'deleted': len(deletes),
+                'unchanged': len(wanted) - len(inserts) - len(updates)
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"Error syncing word list for mode {game_mode}: {e}")
+            self._rollback(e)
+            return None
+    
+    def _insert_ignoring_conflicts(self):
+        """Build a multi-row word list INSERT that skips words already present."""
+        dialect = self.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            return postgresql.insert(WordList).on_conflict_do_nothing(index_elements=['word', 'game_mode'])
+        if dialect == 'sqlite':
+            return sqlite.insert(WordList).on_conflict_do_nothing(index_elements=['word', 'game_mode'])
+        return insert(WordList)
+
 
 class GameSessionRepository(BaseRepository[GameSession]):
     """Repository for GameSession model with specific query methods (unlimited play)."""
@@ -121,19 +246,94 @@ class GameSessionRepository(BaseRepository[GameSession]):
         """Initialize game session repository."""
         super().__init__(GameSession)
     
-    def create_new_session(self, user_id: int, answer_word: str, game_mode: GameMode) -> GameSession:
-        """Create a new game session for a user with a random answer word."""
-        new_session = GameSession(
-            user_id=user_id,
-            answer_word=answer_word,
-            game_mode=game_mode,
-            guesses=[],
-            completed=False,
-            won=False,
-            attempts_used=0
-        )
-        return self.create(new_session)
+    def create_new_session(self, user_id: int, answer_word: str, game_mode: GameMode,
+                           packed: bool = False) -> GameSession:
+        """Create a new game session for a user with a random answer word.
+        
+        Args:
+            user_id: User ID
+            answer_word: Answer for the session
+            game_mode: Game mode
+            packed: Store guesses in the compact guesses_packed column
+            
+        Returns:
+            Created GameSession, None on error
+        """
+        return self.create({
+            'user_id': user_id,
+            'answer_word': answer_word,
+            'game_mode': game_mode,
+            'guesses': [],
+            'guesses_packed': b"" if packed else None,
+            'completed': False,
+            'won': False,
+            'attempts_used': 0
+        })
     
+    def get_for_update(self, session_id: int) -> Optional[GameSession]:
+        """Get a game session and lock its row until the transaction ends.
+        
+        Uses SELECT ... FOR UPDATE where the database supports row locks. SQLite
+        has no row locks, so a no-op UPDATE on the row takes the database write
+        lock instead, serialising concurrent writers.
+        
+        Args:
+            session_id: Game session ID
+            
+        Returns:
+            Locked GameSession with freshly loaded state, None if not found
+        """
+        try:
+            query = self.session.query(GameSession).filter(GameSession.id == session_id)
+            if self.session.get_bind().dialect.name == 'sqlite':
+                self.session.execute(
+                    text("UPDATE game_sessions SET attempts_used = attempts_used WHERE id = :id"),
+                    {'id': session_id}
+                )
+            else:
+                query = query.with_for_update()
+            return query.populate_existing().first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error locking game session {session_id}: {e}")
+            self._rollback(e)
+            return None
+    
+    def update_guesses_if_current(self, session_id: int, expected_attempts: int, guesses_packed: bytes,
+                                  completed: bool, won: bool) -> bool:
+        """Write a session's new guesses if nobody has changed it since it was read.
+
+        attempts_used acts as the version: the UPDATE only matches while the
+        row still has expected_attempts guesses and is in progress, so a
+        stale copy can never overwrite a newer guess.
+
+        Args:
+            session_id: Game session ID
+            expected_attempts: attempts_used of the copy the guess was applied to
+            guesses_packed: New packed guesses, one guess longer
+            completed: Whether the game is now over
+            won: Whether the game was won
+
+        Returns:
+            True if the row was updated, False if it had changed
+            
+        Raises:
+            SQLAlchemyError: If the update fails; the caller's unit of work rolls back
+        """
+        result = self.session.execute(
+            update(GameSession).where(
+                GameSession.id == session_id,
+                GameSession.attempts_used == expected_attempts,
+                GameSession.completed.is_(False)
+            ).values(
+                guesses_packed=guesses_packed,
+                attempts_used=expected_attempts + 1,
+                completed=completed,
+                won=won
+            ),
+            execution_options={'synchronize_session': False}
+        )
+        return result.rowcount == 1
+
     def get_user_sessions_by_mode(self, user_id: int, game_mode: GameMode, limit: int = 10) -> List[GameSession]:
         """Get user's game sessions for a specific mode."""
         try:
@@ -146,7 +346,114 @@ class GameSessionRepository(BaseRepository[GameSession]):
             return query.all()
         except Exception as e:
             logger.error(f"Error getting user sessions for user {user_id}, mode {game_mode}: {e}")
-            self.session.rollback()
+            self._rollback(e)
+            return []
+    
+    def get_user_sessions_page(self, user_id: int, limit: int, game_mode: Optional[GameMode] = None,
+                               after: Optional[int] = None, before: Optional[int] = None,
+                               won: Optional[bool] = None,
+                               since: Optional[datetime] = None) -> List[GameSession]:
+        """Get a page of a user's sessions, newest first, by keyset position.
+
+        Sessions are paged by id, which grows with creation time, and the page
+        starts from a boundary id instead of an OFFSET. The query seeks the
+        (user_id, id) index ix_game_sessions_user_id_id to the boundary and
+        reads rows in index order, so without filters any page costs the same
+        as the first. Mode, result and period filters are checked on the rows
+        the index yields. Paging on created_at is avoided because SQLite
+        stores server-side timestamps in a different text format from bound
+        datetimes, so comparisons with a boundary are unreliable.
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of sessions to return
+            game_mode: Only sessions in this mode (all modes if None)
+            after: ID of a row; return rows older than it
+            before: ID of a row; return rows newer than it
+            won: Only won (True) or lost (False) completed sessions
+            since: Only sessions created at or after this time
+
+        Returns:
+            Sessions ordered newest first
+        """
+        try:
+            query = self.session.query(GameSession).filter(GameSession.user_id == user_id)
+            if game_mode is not None:
+                query = query.filter(GameSession.game_mode == game_mode)
+            if won is True:
+                query = query.filter(GameSession.won.is_(True))
+            elif won is False:
+                query = query.filter(GameSession.completed.is_(True), GameSession.won.is_(False))
+            if since is not None:
+                query = query.filter(GameSession.created_at >= since)
+
+            if before is not None:
+                query = query.filter(GameSession.id > before).order_by(GameSession.id)
+                return list(reversed(query.limit(limit).all()))
+
+            if after is not None:
+                query = query.filter(GameSession.id < after)
+            return query.order_by(GameSession.id.desc()).limit(limit).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting session page for user {user_id}: {e}")
+            self._rollback(e)
+            return []
+
+    def iter_user_sessions(self, user_id: int, game_mode: Optional[GameMode] = None,
+                           batch_size: int = SESSION_EXPORT_BATCH_SIZE) -> Iterator[Row]:
+        """Stream a user's sessions, oldest first, without loading them all.
+        
+        Plain column rows are fetched batch_size at a time from a server-side
+        cursor and are not added to the identity map, so memory use stays
+        constant however many games the user has played.
+        
+        Args:
+            user_id: User ID
+            game_mode: Only sessions in this mode (all modes if None)
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            Rows with id, game_mode, created_at, completed, won, attempts_used,
+            answer_word, guesses_json and guesses_packed
+            
+        Raises:
+            SQLAlchemyError: If reading fails part way, so a truncated stream
+                is never mistaken for the complete history
+        """
+        query = self.session.query(
+            GameSession.id, GameSession.game_mode, GameSession.created_at, GameSession.completed,
+            GameSession.won, GameSession.attempts_used, GameSession.answer_word,
+            GameSession.guesses_json, GameSession.guesses_packed
+        ).filter(GameSession.user_id == user_id)
+        if game_mode is not None:
+            query = query.filter(GameSession.game_mode == game_mode)
+        
+        try:
+            yield from query.order_by(GameSession.created_at, GameSession.id).yield_per(batch_size)
+        except SQLAlchemyError as e:
+            logger.error(f"Error streaming sessions for user {user_id}: {e}")
+            self._rollback(e)
+            raise
+    
+    def get_played_answer_words(self, user_id: int, game_mode: GameMode) -> List[str]:
+        """Get the distinct answer words a user has been given in a game mode.
+        
+        Args:
+            user_id: User ID
+            game_mode: Game mode
+            
+        Returns:
+            Distinct answer words
+        """
+        try:
+            rows = self.session.query(GameSession.answer_word).filter(
+                GameSession.user_id == user_id,
+                GameSession.game_mode == game_mode
+            ).distinct().all()
+            return [answer_word for answer_word, in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting played answers for user {user_id}, mode {game_mode}: {e}")
+            self._rollback(e)
             return []
 
 
@@ -157,26 +464,30 @@ class UserStatsRepository(BaseRepository[UserStats]):
         """Initialize user stats repository."""
         super().__init__(UserStats)
     
-    def get_by_user_and_mode(self, user_id: int, game_mode: GameMode) -> Optional[UserStats]:
+    def get_by_user_and_mode(self, user_id: int, game_mode: GameMode, for_update: bool = False) -> Optional[UserStats]:
         """Get user stats by user ID and game mode.
         
         Args:
             user_id: User ID
             game_mode: Game mode
+            for_update: Lock the row until the transaction ends
             
         Returns:
             UserStats if found, None otherwise
         """
         try:
-            return self.session.query(UserStats).filter(
+            query = self.session.query(UserStats).filter(
                 and_(
                     UserStats.user_id == user_id,
                     UserStats.game_mode == game_mode
                 )
-            ).first()
+            )
+            if for_update:
+                query = query.with_for_update().populate_existing()
+            return query.first()
         except SQLAlchemyError as e:
             logger.error(f"Error getting user stats for user {user_id}, mode {game_mode}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return None
     
     def get_leaderboard_by_wins(self, game_mode: GameMode, limit: int = 10) -> List[UserStats]:
@@ -195,7 +506,7 @@ class UserStatsRepository(BaseRepository[UserStats]):
             ).order_by(desc(UserStats.games_won)).limit(limit).all()
         except SQLAlchemyError as e:
             logger.error(f"Error getting wins leaderboard for mode {game_mode}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return []
     
     def get_leaderboard_by_streak(self, game_mode: GameMode, limit: int = 10) -> List[UserStats]:
@@ -214,7 +525,7 @@ class UserStatsRepository(BaseRepository[UserStats]):
             ).order_by(desc(UserStats.current_streak)).limit(limit).all()
         except SQLAlchemyError as e:
             logger.error(f"Error getting streak leaderboard for mode {game_mode}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return []
     
     def get_leaderboard_by_win_percentage(self, game_mode: GameMode, min_games: int = 5, limit: int = 10) -> List[UserStats]:
@@ -240,9 +551,109 @@ class UserStatsRepository(BaseRepository[UserStats]):
             ).limit(limit).all()
         except SQLAlchemyError as e:
             logger.error(f"Error getting win percentage leaderboard for mode {game_mode}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return []
     
+    def get_leaderboard_rows(self, game_mode: GameMode, metric: str, limit: int = 10,
+                             min_games: int = 5) -> List[Row]:
+        """Get leaderboard rows with usernames in a single query.
+        
+        Args:
+            game_mode: Game mode to get leaderboard for
+            metric: Metric to rank by ('win_percentage', 'total_wins', 'current_streak')
+            limit: Number of top users to return
+            min_games: Minimum games played to qualify for the win percentage board
+            
+        Returns:
+            Rows of (user_id, username, games_played, games_won, current_streak,
+            max_streak, guess_distribution) in rank order
+        """
+        try:
+            query = self.session.query(
+                UserStats.user_id,
+                User.username,
+                UserStats.games_played,
+                UserStats.games_won,
+                UserStats.current_streak,
+                UserStats.max_streak,
+                UserStats.guess_distribution
+            ).join(User, User.id == UserStats.user_id).filter(UserStats.game_mode == game_mode)
+            
+            if metric == 'win_percentage':
+                query = query.filter(UserStats.games_played >= min_games).order_by(
+                    desc(UserStats.games_won * 100.0 / UserStats.games_played)
+                )
+            elif metric == 'total_wins':
+                query = query.order_by(desc(UserStats.games_won))
+            elif metric == 'current_streak':
+                query = query.order_by(desc(UserStats.current_streak))
+            else:
+                raise ValueError(f"Unknown leaderboard metric: {metric}")
+            
+            return query.order_by(UserStats.id).limit(limit).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting {metric} leaderboard for mode {game_mode}: {e}")
+            self._rollback(e)
+            return []
+    
+    def get_rank_counts(self, stats: UserStats, metrics: Iterable[str],
+                        min_games: int = 5) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Count the players ranked ahead of a user with one indexed COUNT per metric.
+        
+        Uses the same ordering as get_leaderboard_rows, including the stats id
+        tie-break. Total wins and streaks are counted as a range on their
+        (game_mode, column) index starting at the user's value, so only the
+        players at or above the user are visited. Win percentages have no
+        index; they are compared by cross-multiplying integer counts, so ties
+        are exact, over the qualifying range of the games played index.
+        
+        Args:
+            stats: The user's stats row
+            metrics: Metrics to rank by ('win_percentage', 'total_wins', 'current_streak')
+            min_games: Minimum games played to qualify for win percentage ranking
+            
+        Returns:
+            Dictionary mapping each metric to (players ahead, ranked players),
+            None on error
+        """
+        def count(*conditions):
+            return self.session.query(func.count()).select_from(UserStats).filter(
+                UserStats.game_mode == stats.game_mode, *conditions
+            ).scalar()
+        
+        def ahead(column, value):
+            # The >= bound lets the index seek to the user's value
+            return and_(column >= value, or_(column > value, UserStats.id < stats.id))
+        
+        columns = {'total_wins': UserStats.games_won, 'current_streak': UserStats.current_streak}
+        
+        try:
+            counts = {}
+            total_players = None
+            for metric in metrics:
+                if metric == 'win_percentage':
+                    qualifies = UserStats.games_played >= min_games
+                    counts[metric] = (
+                        count(qualifies, or_(
+                            UserStats.games_won * stats.games_played > stats.games_won * UserStats.games_played,
+                            and_(
+                                UserStats.games_won * stats.games_played == stats.games_won * UserStats.games_played,
+                                UserStats.id < stats.id
+                            )
+                        )),
+                        count(qualifies)
+                    )
+                    continue
+                if total_players is None:
+                    total_players = count()
+                column = columns[metric]
+                counts[metric] = (count(ahead(column, getattr(stats, column.key))), total_players)
+            return counts
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting ranks for user {stats.user_id}, mode {stats.game_mode}: {e}")
+            self._rollback(e)
+            return None
+    
     def stats_exist(self, user_id: int, game_mode: GameMode) -> bool:
         """Check if stats exist for user and game mode.
         
@@ -262,4 +673,204 @@ class UserStatsRepository(BaseRepository[UserStats]):
             ).count() > 0
         except SQLAlchemyError as e:
             logger.error(f"Error checking stats existence for user {user_id}, mode {game_mode}: {e}")
-            return False 
\ No newline at end of file
+            return False 
+
+
+class GlobalStatsRepository(BaseRepository[GlobalStats]):
+    """Repository for GlobalStats aggregates."""
+    
+    def __init__(self):
+        """Initialize global stats repository."""
+        super().__init__(GlobalStats)
+    
+    def get_by_mode(self, game_mode: GameMode) -> Optional[GlobalStats]:
+        """Get global stats for a game mode.
+        
+        Args:
+            game_mode: Game mode
+            
+        Returns:
+            GlobalStats if found, None otherwise
+        """
+        try:
+            return self.session.query(GlobalStats).filter(GlobalStats.game_mode == game_mode).first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting global stats for mode {game_mode}: {e}")
+            self._rollback(e)
+            return None
+    
+    def record_game(self, game_mode: GameMode, won: bool, attempts_used: int, new_player: bool = False) -> bool:
+        """Add a finished game to the global totals with an atomic increment.
+        
+        The counters are updated in SQL rather than read and written back, so
+        concurrent games never lose updates. Where the dialect supports it the
+        mode's row is created by an INSERT ... ON CONFLICT DO UPDATE, so two
+        first games for a mode cannot both try to insert it.
+        
+        Args:
+            game_mode: Game mode
+            won: Whether the game was won
+            attempts_used: Number of attempts used
+            new_player: Whether this is the player's first game in the mode
+            
+        Returns:
+            True if recorded, False otherwise
+        """
+        increments = {'total_games': 1, 'total_players': int(new_player), 'total_wins': int(won)}
+        if won and 1 <= attempts_used <= 6:
+            increments[f'dist_{attempts_used}'] = 1
+        values = {name: getattr(GlobalStats, name) + amount for name, amount in increments.items()}
+        
+        try:
+            upsert = self._upsert()
+            if upsert is not None:
+                self.session.execute(
+                    upsert.values(game_mode=game_mode, **increments).on_conflict_do_update(
+                        index_elements=['game_mode'], set_={**values, 'updated_at': func.now()}
+                    )
+                )
+            else:
+                result = self.session.execute(
+                    update(GlobalStats)
+                    .where(GlobalStats.game_mode == game_mode)
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
+                    self.session.add(GlobalStats(game_mode=game_mode, **increments))
+            self._save()
+            return True
+        except SQLAlchemyError as e:
+            logger.error(f"Error recording game in global stats for mode {game_mode}: {e}")
+            self._rollback(e)
+            return False
+    
+    def _upsert(self):
+        """Build a global stats INSERT supporting ON CONFLICT, or None if the dialect lacks it."""
+        dialect = self.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            return postgresql.insert(GlobalStats)
+        if dialect == 'sqlite':
+            return sqlite.insert(GlobalStats)
+        return None
+    
+    def rebuild(self, game_mode: GameMode) -> Optional[GlobalStats]:
+        """Recalculate global stats for a game mode from all UserStats rows.
+        
+        Args:
+            game_mode: Game mode
+            
+        Returns:
+            Rebuilt GlobalStats, None on error
+        """
+        try:
+            total_players, total_games, total_wins = self.session.query(
+                func.count(UserStats.id),
+                func.coalesce(func.sum(UserStats.games_played), 0),
+                func.coalesce(func.sum(UserStats.games_won), 0)
+            ).filter(UserStats.game_mode == game_mode).one()
+            
+            distribution = {i: 0 for i in range(1, 7)}
+            rows = self.session.query(UserStats.guess_distribution).filter(
+                UserStats.game_mode == game_mode
+            ).yield_per(1000)
+            for guess_distribution, in rows:
+                for attempts, count in (guess_distribution or {}).items():
+                    if attempts.isdigit() and int(attempts) in distribution:
+                        distribution[int(attempts)] += count
+            
+            values = {
+                'total_players': total_players,
+                'total_games': total_games,
+                'total_wins': total_wins,
+                **{f'dist_{i}': count for i, count in distribution.items()}
+            }
+            
+            stats = self.get_by_mode(game_mode)
+            if stats is None:
+                stats = GlobalStats(game_mode=game_mode)
+                self.session.add(stats)
+            stats.update_from_dict(values)
+            self._save()
+            return stats
+        except SQLAlchemyError as e:
+            logger.error(f"Error rebuilding global stats for mode {game_mode}: {e}")
+            self._rollback(e)
+            return None
+
+
+class UserAnswerHistoryRepository(BaseRepository[UserAnswerHistory]):
+    """Repository for UserAnswerHistory model with specific query methods."""
+    
+    def __init__(self):
+        """Initialize user answer history repository."""
+        super().__init__(UserAnswerHistory)
+    
+    def get_by_user_and_mode(self, user_id: int, game_mode: GameMode) -> Optional[UserAnswerHistory]:
+        """Get answer history by user ID and game mode.
+        
+        Args:
+            user_id: User ID
+            game_mode: Game mode
+            
+        Returns:
+            UserAnswerHistory if found, None otherwise
+        """
+        try:
+            return self.session.query(UserAnswerHistory).filter(
+                and_(
+                    UserAnswerHistory.user_id == user_id,
+                    UserAnswerHistory.game_mode == game_mode
+                )
+            ).first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting answer history for user {user_id}, mode {game_mode}: {e}")
+            self._rollback(e)
+            return None
+    
+    def get_or_create_for_update(self, user_id: int, game_mode: GameMode) -> Optional[UserAnswerHistory]:
+        """Get answer history, creating it if missing, and lock its row until the transaction ends.
+        
+        The row is created with INSERT ... ON CONFLICT DO NOTHING where the
+        database supports it, so concurrent first games cannot both insert it,
+        then reread with populate_existing so the bitset reflects every
+        committed game. On SQLite the INSERT already takes the database write
+        lock; elsewhere the reread uses SELECT ... FOR UPDATE. Without upsert
+        support a missing history is added to the session and persisted with
+        the next commit.
+        
+        Args:
+            user_id: User ID
+            game_mode: Game mode
+            
+        Returns:
+            Locked UserAnswerHistory with freshly loaded state, None on error
+        """
+        try:
+            dialect = self.session.get_bind().dialect.name
+            if dialect in ('postgresql', 'sqlite'):
+                dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+                self.session.execute(
+                    dialect_insert(UserAnswerHistory)
+                    .values(user_id=user_id, game_mode=game_mode, seen=b"", seen_count=0)
+                    .on_conflict_do_nothing(index_elements=['user_id', 'game_mode'])
+                )
+            
+            query = self.session.query(UserAnswerHistory).filter(
+                and_(
+                    UserAnswerHistory.user_id == user_id,
+                    UserAnswerHistory.game_mode == game_mode
+                )
+            )
+            if dialect != 'sqlite':
+                query = query.with_for_update()
+            history = query.populate_existing().first()
+            
+            if history is None:
+                history = UserAnswerHistory(user_id=user_id, game_mode=game_mode, seen=b"", seen_count=0)
+                self.session.add(history)
+            return history
+        except SQLAlchemyError as e:
+            logger.error(f"Error locking answer history for user {user_id}, mode {game_mode}: {e}")
+            self._rollback(e)
+            return None
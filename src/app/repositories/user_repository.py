@@ -26,7 +26,7 @@ class UserRepository(BaseRepository[User]):
             ).first()
         except SQLAlchemyError as e:
             logger.error(f"Error getting user by email {email}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return None
     
     def get_by_username(self, username: str) -> Optional[User]:
@@ -37,7 +37,7 @@ class UserRepository(BaseRepository[User]):
             ).first()
         except SQLAlchemyError as e:
             logger.error(f"Error getting user by username {username}: {e}")
-            self.session.rollback()
+            self._rollback(e)
             return None
     
     def email_exists(self, email: str) -> bool:
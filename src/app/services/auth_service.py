@@ -3,6 +3,7 @@
 import logging
 from typing import Dict, Any, Optional
 
+from ..database import unit_of_work
 from ..models.user import User
 from ..repositories.user_repository import UserRepository
 
@@ -52,19 +53,17 @@ class AuthService:
             )
             user.set_password(password)
             
-            # Save user to database
-            created_user = self.user_repo.create({
-                'username': user.username,
-                'email': user.email,
-                'password_hash': user.password_hash,
-                'email_verified': False,
-                'is_active': True
-            })
-            
-            if not created_user:
-                raise ValueError("Failed to create user account")
+            # Save user to database in a single transaction
+            with unit_of_work():
+                created_user = self.user_repo.create({
+                    'username': user.username,
+                    'email': user.email,
+                    'password_hash': user.password_hash,
+                    'email_verified': False,
+                    'is_active': True
+                })
+                logger.info(f"New user registered: {created_user.username}")
             
-            logger.info(f"New user registered: {created_user.username}")
             return created_user
             
         except ValueError as e:
@@ -1,12 +1,12 @@
 """Daily puzzle service for managing daily word puzzles."""
 
 import logging
-import random
 from datetime import date, datetime, timezone
 from typing import Optional
 
 from ..models.game import GameMode, DailyWord, WordList
 from ..repositories.game_repository import DailyWordRepository, WordListRepository
+from .lexicon import lexicon
 
 logger = logging.getLogger(__name__)
 
@@ -187,23 +187,13 @@ class DailyPuzzleService:
             Random answer word if available, None otherwise
         """
         try:
-            answer_words = self.word_list_repo.get_answer_words_by_mode(game_mode)
-            if not answer_words:
+            selected = lexicon.random_answer(game_mode)
+            if not selected:
                 logger.warning(f"No answer words available for mode {game_mode}")
                 return None
             
-            # Select a random word, preferring higher frequency ranks (lower numbers)
-            # Filter out words that are None or empty
-            valid_words = [w for w in answer_words if w.word]
-            
-            if not valid_words:
-                logger.warning(f"No valid answer words for mode {game_mode}")
-                return None
-            
-            # For now, just select randomly. Later we could implement more sophisticated selection
-            selected = random.choice(valid_words)
-            logger.debug(f"Selected random word {selected.word} for mode {game_mode}")
-            return selected.word
+            logger.debug(f"Selected random word {selected} for mode {game_mode}")
+            return selected
             
         except Exception as e:
             logger.error(f"Error selecting random answer word for mode {game_mode}: {e}")
@@ -0,0 +1,540 @@
+"""Precomputed guess x answer feedback tables for fast Wordle scoring.
+
+Tables can be held in memory or persisted to a versioned binary file that every
+worker process maps read-only, so the pages are shared through the OS page cache.
+
+File layout (little-endian):
+    header   magic, format version, guess count, answer count, word list digest
+    guesses  5 ASCII bytes per guess word, in row order
+    answers  5 ASCII bytes per answer word, in column order
+    codes    one feedback code byte per (guess, answer) cell, row-major
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from flask import Flask
+
+from ..models.game import GameMode
+from ..repositories.game_repository import WordListRepository
+
+logger = logging.getLogger(__name__)
+
+# Feedback states indexed by their base-3 digit
+FEEDBACK_STATES = ("absent", "present", "correct")
+
+# Weight of each letter position in a base-3 feedback code
+POSITION_WEIGHTS = (1, 3, 9, 27, 81)
+
+# Binary table file format
+TABLE_FILE_MAGIC = b"WFBT"
+TABLE_FILE_VERSION = 1
+_HEADER = struct.Struct("<4sHHII32s")
+WORD_LENGTH = 5
+
+# Default location for table files, next to the word list files
+DEFAULT_TABLE_DIR = Path(__file__).resolve().parents[3] / "data"
+
+# Decoded feedback for every possible code (3^5 = 243 patterns)
+_DECODED_FEEDBACK = tuple(
+    tuple(FEEDBACK_STATES[(code // weight) % 3] for weight in POSITION_WEIGHTS)
+    for code in range(3 ** 5)
+)
+
+
+def encode_feedback(feedback: Sequence[str]) -> int:
+    """Encode a feedback list as a single base-3 code.
+
+    Args:
+        feedback: Feedback strings for each letter position
+
+    Returns:
+        Integer code between 0 and 242
+    """
+    return sum(
+        FEEDBACK_STATES.index(state) * weight
+        for state, weight in zip(feedback, POSITION_WEIGHTS)
+    )
+
+
+def decode_feedback(code: int) -> List[str]:
+    """Decode a base-3 feedback code back into feedback strings.
+
+    Args:
+        code: Integer code between 0 and 242
+
+    Returns:
+        Feedback strings for each letter position
+    """
+    return list(_DECODED_FEEDBACK[code])
+
+
+def _letter_group_code(letter: str, positions: Tuple[int, ...], answer: str) -> int:
+    """Score every occurrence of one guess letter against an answer.
+
+    Wordle feedback for a letter only depends on where that letter sits in the
+    guess and in the answer, so each letter group can be scored independently
+    and the partial codes summed.
+
+    Args:
+        letter: Guess letter being scored
+        positions: Positions of the letter in the guess, in ascending order
+        answer: Answer word to score against
+
+    Returns:
+        Partial feedback code for the given positions
+    """
+    greens = sum(1 for position in positions if answer[position] == letter)
+    remaining = answer.count(letter) - greens
+
+    code = 0
+    for position in positions:
+        if answer[position] == letter:
+            code += 2 * POSITION_WEIGHTS[position]
+        elif remaining > 0:
+            code += POSITION_WEIGHTS[position]
+            remaining -= 1
+
+    return code
+
+
+def _letter_groups(guess: str) -> List[Tuple[str, Tuple[int, ...]]]:
+    """Group guess positions by letter.
+
+    Args:
+        guess: Guess word
+
+    Returns:
+        List of (letter, positions) pairs
+    """
+    groups: Dict[str, List[int]] = {}
+    for position, letter in enumerate(guess):
+        groups.setdefault(letter, []).append(position)
+    return [(letter, tuple(positions)) for letter, positions in groups.items()]
+
+
+def compute_feedback_code(guess: str, answer: str) -> int:
+    """Compute the feedback code for a single guess/answer pair.
+
+    Args:
+        guess: Normalized 5-letter guess
+        answer: Normalized 5-letter answer
+
+    Returns:
+        Integer code between 0 and 242
+    """
+    return sum(
+        _letter_group_code(letter, positions, answer)
+        for letter, positions in _letter_groups(guess)
+    )
+
+
+def build_feedback_codes(guesses: Sequence[str], answers: Sequence[str]) -> bytes:
+    """Build the row-major guess x answer feedback matrix.
+
+    Each letter group is scored once against every answer and packed into a
+    big integer holding one byte per answer. A row is then the sum of its
+    letter groups; codes never exceed 242 so bytes never carry into each other.
+
+    Args:
+        guesses: Normalized guess words (matrix rows)
+        answers: Normalized answer words (matrix columns)
+
+    Returns:
+        Bytes of length len(guesses) * len(answers)
+    """
+    answer_count = len(answers)
+    group_vectors: Dict[Tuple[str, Tuple[int, ...]], int] = {}
+    codes = bytearray(len(guesses) * answer_count)
+
+    for row, guess in enumerate(guesses):
+        row_vector = 0
+        for group in _letter_groups(guess):
+            vector = group_vectors.get(group)
+            if vector is None:
+                letter, positions = group
+                column_codes = bytes(
+                    _letter_group_code(letter, positions, answer) for answer in answers
+                )
+                vector = int.from_bytes(column_codes, 'little')
+                group_vectors[group] = vector
+            row_vector += vector
+
+        start = row * answer_count
+        codes[start:start + answer_count] = row_vector.to_bytes(answer_count, 'little')
+
+    return bytes(codes)
+
+
+class FeedbackTable:
+    """Immutable feedback matrix for a single game mode."""
+
+    __slots__ = ('game_mode', 'guess_index', 'answer_index', 'answer_count', 'codes', 'digest', '_mmap')
+
+    def __init__(self, game_mode: GameMode, guesses: Sequence[str], answers: Sequence[str],
+                 codes: Sequence[int], digest: Optional[bytes] = None):
+        """Initialize feedback table.
+
+        Args:
+            game_mode: Game mode the table belongs to
+            guesses: Guess words in row order
+            answers: Answer words in column order
+            codes: Row-major feedback codes (bytes or a view over a mapped file)
+            digest: Digest of the word lists the table was built from
+
+        Raises:
+            ValueError: If the code matrix does not match the word lists
+        """
+        if len(codes) != len(guesses) * len(answers):
+            raise ValueError("Feedback code matrix does not match word list sizes")
+
+        self.game_mode = game_mode
+        self.guess_index = {word: row for row, word in enumerate(guesses)}
+        self.answer_index = {word: col for col, word in enumerate(answers)}
+        self.answer_count = len(answers)
+        self.codes = codes
+        self.digest = digest if digest is not None else word_list_digest(guesses, answers)
+        self._mmap = None
+
+    @classmethod
+    def build(cls, game_mode: GameMode, guesses: Sequence[str], answers: Sequence[str]) -> 'FeedbackTable':
+        """Build a feedback table from word lists.
+
+        Args:
+            game_mode: Game mode the table belongs to
+            guesses: Valid guess words
+            answers: Answer words
+
+        Returns:
+            Populated FeedbackTable
+        """
+        guesses = [word.upper() for word in guesses]
+        answers = [word.upper() for word in answers]
+        return cls(game_mode, guesses, answers, build_feedback_codes(guesses, answers))
+
+    @classmethod
+    def open(cls, game_mode: GameMode, path: Path,
+             expected_digest: Optional[bytes] = None) -> Optional['FeedbackTable']:
+        """Map a table file read-only.
+
+        Args:
+            game_mode: Game mode the table belongs to
+            path: Table file to map
+            expected_digest: Word list digest the file must have been built from
+
+        Returns:
+            Mapped FeedbackTable, or None if the file is missing, stale or invalid
+        """
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if len(mapped) < _HEADER.size:
+            mapped.close()
+            return None
+
+        magic, version, _, guess_count, answer_count, digest = _HEADER.unpack_from(mapped, 0)
+        words_end = _HEADER.size + (guess_count + answer_count) * WORD_LENGTH
+        codes_end = words_end + guess_count * answer_count
+        if (magic != TABLE_FILE_MAGIC or version != TABLE_FILE_VERSION or len(mapped) != codes_end
+                or (expected_digest is not None and digest != expected_digest)):
+            mapped.close()
+            return None
+
+        words = mapped[_HEADER.size:words_end].decode('ascii')
+        split = guess_count * WORD_LENGTH
+        guesses = [words[i:i + WORD_LENGTH] for i in range(0, split, WORD_LENGTH)]
+        answers = [words[i:i + WORD_LENGTH] for i in range(split, len(words), WORD_LENGTH)]
+
+        table = cls(game_mode, guesses, answers, memoryview(mapped)[words_end:codes_end], digest)
+        table._mmap = mapped
+        return table
+
+    def lookup(self, guess: str, answer: str) -> Optional[int]:
+        """Look up the feedback code for a guess/answer pair.
+
+        Args:
+            guess: Normalized guess word
+            answer: Normalized answer word
+
+        Returns:
+            Feedback code, or None if either word is not in the table
+        """
+        row = self.guess_index.get(guess)
+        if row is None:
+            return None
+
+        col = self.answer_index.get(answer)
+        if col is None:
+            return None
+
+        return self.codes[row * self.answer_count + col]
+
+    @property
+    def is_mapped(self) -> bool:
+        """Whether the codes are served from a memory-mapped file."""
+        return self._mmap is not None
+
+    def __len__(self) -> int:
+        """Number of cells in the table."""
+        return len(self.codes)
+
+
+def word_list_digest(guesses: Sequence[str], answers: Sequence[str]) -> bytes:
+    """Hash the word lists a feedback table is built from.
+
+    Args:
+        guesses: Guess words in row order
+        answers: Answer words in column order
+
+    Returns:
+        SHA-256 digest of the word list contents
+    """
+    content = "\n".join(guesses) + "\0" + "\n".join(answers)
+    return hashlib.sha256(content.upper().encode('ascii')).digest()
+
+
+def table_file_path(game_mode: GameMode, table_dir: Optional[Path] = None) -> Path:
+    """Get the table file path for a game mode.
+
+    Args:
+        game_mode: Game mode
+        table_dir: Directory holding table files (defaults to the data directory)
+
+    Returns:
+        Path of the binary table file
+    """
+    return Path(table_dir or DEFAULT_TABLE_DIR) / f"feedback_{game_mode.value}.bin"
+
+
+def write_table_file(path: Path, guesses: Sequence[str], answers: Sequence[str]) -> None:
+    """Build a feedback table and write it atomically to disk.
+
+    Args:
+        path: Destination table file
+        guesses: Guess words in row order
+        answers: Answer words in column order
+    """
+    guesses = [word.upper() for word in guesses]
+    answers = [word.upper() for word in answers]
+    header = _HEADER.pack(
+        TABLE_FILE_MAGIC, TABLE_FILE_VERSION, 0,
+        len(guesses), len(answers), word_list_digest(guesses, answers)
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write("".join(guesses).encode('ascii'))
+            f.write("".join(answers).encode('ascii'))
+            f.write(build_feedback_codes(guesses, answers))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+@contextmanager
+def _build_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock so only one worker builds a table file.
+
+    Args:
+        path: Table file being built
+    """
+    if fcntl is None:
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def open_or_build_table(game_mode: GameMode, path: Path, guesses: Sequence[str],
+                        answers: Sequence[str]) -> FeedbackTable:
+    """Map a table file, rebuilding it first if the word lists changed.
+
+    Concurrent workers serialise on a lock file; whoever gets it first rebuilds
+    and the rest map the fresh file.
+
+    Args:
+        game_mode: Game mode the table belongs to
+        path: Table file location
+        guesses: Current guess words in row order
+        answers: Current answer words in column order
+
+    Returns:
+        Mapped FeedbackTable matching the given word lists
+    """
+    digest = word_list_digest(guesses, answers)
+    table = FeedbackTable.open(game_mode, path, digest)
+    if table is not None:
+        return table
+
+    with _build_lock(path):
+        table = FeedbackTable.open(game_mode, path, digest)
+        if table is None:
+            logger.info(f"Building feedback table file {path}")
+            write_table_file(path, guesses, answers)
+            table = FeedbackTable.open(game_mode, path, digest)
+
+    if table is None:
+        raise RuntimeError(f"Failed to map feedback table file {path}")
+    return table
+
+
+class FeedbackEngine:
+    """Registry of precomputed feedback tables, one per game mode."""
+
+    def __init__(self):
+        """Initialize feedback engine with no tables loaded."""
+        self._tables: Dict[GameMode, FeedbackTable] = {}
+
+    def load(self, game_mode: GameMode, guesses: Sequence[str], answers: Sequence[str]) -> FeedbackTable:
+        """Build and register the feedback table for a game mode.
+
+        Args:
+            game_mode: Game mode to build the table for
+            guesses: Valid guess words
+            answers: Answer words
+
+        Returns:
+            Newly registered FeedbackTable
+        """
+        table = FeedbackTable.build(game_mode, guesses, answers)
+        self._tables[game_mode] = table
+        logger.info(f"Loaded feedback table for {game_mode.value}: {len(table)} cells")
+        return table
+
+    def load_mapped(self, game_mode: GameMode, guesses: Sequence[str], answers: Sequence[str],
+                    table_dir: Optional[Path] = None) -> FeedbackTable:
+        """Map and register the on-disk feedback table for a game mode.
+
+        Args:
+            game_mode: Game mode to load the table for
+            guesses: Valid guess words
+            answers: Answer words
+            table_dir: Directory holding table files
+
+        Returns:
+            Newly registered, memory-mapped FeedbackTable
+        """
+        guesses = [word.upper() for word in guesses]
+        answers = [word.upper() for word in answers]
+        table = open_or_build_table(game_mode, table_file_path(game_mode, table_dir), guesses, answers)
+        self._tables[game_mode] = table
+        logger.info(f"Mapped feedback table for {game_mode.value}: {len(table)} cells")
+        return table
+
+    def load_from_repository(self, game_mode: GameMode,
+                             word_repo: Optional[WordListRepository] = None,
+                             table_dir: Optional[Path] = None,
+                             mapped: bool = False) -> Optional[FeedbackTable]:
+        """Build the feedback table for a game mode from the word_list table.
+
+        Args:
+            game_mode: Game mode to build the table for
+            word_repo: Repository to read words from
+            table_dir: Directory holding table files when mapped
+            mapped: Whether to share the table through a memory-mapped file
+
+        Returns:
+            Newly registered FeedbackTable, or None if the mode has no words
+        """
+        word_repo = word_repo or WordListRepository()
+        words = word_repo.get_words_by_mode(game_mode)
+        if not words:
+            logger.warning(f"No words available to build feedback table for {game_mode.value}")
+            return None
+
+        guesses = [word for word, _ in words]
+        answers = [word for word, is_answer in words if is_answer]
+        if mapped:
+            return self.load_mapped(game_mode, guesses, answers, table_dir)
+        return self.load(game_mode, guesses, answers)
+
+    def get_table(self, game_mode: GameMode) -> Optional[FeedbackTable]:
+        """Get the loaded table for a game mode.
+
+        Args:
+            game_mode: Game mode
+
+        Returns:
+            FeedbackTable if loaded, None otherwise
+        """
+        return self._tables.get(game_mode)
+
+    def lookup(self, guess: str, answer: str, game_mode: GameMode) -> Optional[List[str]]:
+        """Look up feedback for a normalized guess/answer pair.
+
+        Args:
+            guess: Normalized guess word
+            answer: Normalized answer word
+            game_mode: Game mode the words belong to
+
+        Returns:
+            Feedback list, or None if the pair is not covered by a loaded table
+        """
+        table = self._tables.get(game_mode)
+        if table is None:
+            return None
+
+        code = table.lookup(guess, answer)
+        if code is None:
+            return None
+
+        return list(_DECODED_FEEDBACK[code])
+
+    def clear(self) -> None:
+        """Drop all loaded tables."""
+        self._tables.clear()
+
+
+# Global feedback engine instance
+feedback_engine = FeedbackEngine()
+
+
+def init_feedback_engine(app: Flask) -> None:
+    """Load feedback tables at startup when enabled.
+
+    Tables are memory-mapped from FEEDBACK_TABLE_DIR unless it is set to an
+    empty string, in which case each process builds its own in-memory copy.
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('FEEDBACK_TABLE_ENABLED', False):
+        return
+
+    table_dir = app.config.get('FEEDBACK_TABLE_DIR')
+    mapped = table_dir != ""
+
+    with app.app_context():
+        for game_mode in GameMode:
+            try:
+                feedback_engine.load_from_repository(game_mode, table_dir=table_dir or None, mapped=mapped)
+            except Exception as e:
+                app.logger.error(f"Failed to build feedback table for {game_mode.value}: {e}")
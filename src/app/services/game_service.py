@@ -1,16 +1,39 @@
 """Game service orchestrating all game logic."""
 
+import csv
+import io
+import json
 import logging
-from datetime import date
-from typing import Optional, Dict, Any, List
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, Iterator, List
 
-from ..models.game import GameMode, GameSession, UserStats
-from ..repositories.game_repository import GameSessionRepository, UserStatsRepository, WordListRepository
+from flask import current_app
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..database import unit_of_work, run_after_commit
+from ..models.game import (
+    GameMode, GameSession, UserAnswerHistory, decode_guesses, pack_guess, unpack_guesses
+)
+from ..repositories.game_repository import (
+    GameSessionRepository, UserStatsRepository, GlobalStatsRepository, WordListRepository,
+    UserAnswerHistoryRepository
+)
+from ..utils.pagination import NEXT, PREV, encode_cursor, decode_cursor
 from .guess_processing_service import GuessProcessingService
+from .statistics_service import StatisticsService
 from .word_validation_service import WordValidationService
+from .lexicon import lexicon, LexiconIndex
+from .hot_sessions import hot_sessions, HotSession
 
 logger = logging.getLogger(__name__)
 
+# Supported game history export formats
+EXPORT_FORMATS = ('ndjson', 'csv')
+
+# Column order of CSV game history exports
+EXPORT_CSV_FIELDS = ['session_id', 'game_mode', 'date', 'completed', 'won', 'attempts_used', 'target_word', 'guesses']
+
 
 class GameService:
     """Main service orchestrating all game logic (unlimited play)."""
@@ -19,32 +42,95 @@ class GameService:
         """Initialize game service with all dependencies."""
         self.session_repo = GameSessionRepository()
         self.stats_repo = UserStatsRepository()
+        self.global_stats_repo = GlobalStatsRepository()
         self.word_list_repo = WordListRepository()
+        self.answer_history_repo = UserAnswerHistoryRepository()
         self.guess_processor = GuessProcessingService()
         self.word_validator = WordValidationService()
+        self.stats_service = StatisticsService()
+        self.lexicon = lexicon
+        self.hot_sessions = hot_sessions
     
     def start_new_game(self, user_id: int, game_mode: GameMode) -> Dict[str, Any]:
         """Start a new game session for a user with a random answer word."""
-        # Select a random answer word
-        answer_words = self.word_list_repo.get_answer_words_by_mode(game_mode)
-        if not answer_words:
-            return {'success': False, 'error': 'No answer words available'}
-        import random
-        selected = random.choice(answer_words)
-        session = self.session_repo.create_new_session(user_id, selected.word, game_mode)
-        return {
-            'success': True,
-            'session': {
-                'id': session.id,
-                'answer_word': session.answer_word,
-                'game_mode': session.game_mode.value,
-                'guesses': session.guesses,
-                'completed': session.completed,
-                'won': session.won,
-                'attempts_used': session.attempts_used,
-                'max_attempts': 6
-            }
-        }
+        try:
+            with unit_of_work():
+                # Select a random answer word the user has not been given yet
+                answer_word = self._select_unseen_answer(user_id, game_mode)
+                if not answer_word:
+                    return {'success': False, 'error': 'No answer words available'}
+                # Committed together with the updated answer history
+                session = self.session_repo.create_new_session(
+                    user_id, answer_word, game_mode, packed=current_app.config.get('PACK_GUESSES', False)
+                )
+                snapshot = HotSession.from_session(session)
+                run_after_commit(lambda: self.hot_sessions.put(snapshot))
+                return {
+                    'success': True,
+                    'session': {
+                        'id': session.id,
+                        'answer_word': session.answer_word,
+                        'game_mode': session.game_mode.value,
+                        'guesses': session.guesses,
+                        'completed': session.completed,
+                        'won': session.won,
+                        'attempts_used': session.attempts_used,
+                        'max_attempts': 6
+                    }
+                }
+        except SQLAlchemyError as e:
+            logger.error(f"Error starting game for user {user_id}, mode {game_mode}: {e}")
+            return {'success': False, 'error': 'Failed to create game session'}
+    
+    def _select_unseen_answer(self, user_id: int, game_mode: GameMode) -> Optional[str]:
+        """Pick an answer the user has not seen and mark it in their answer history.
+        
+        The history bitset is indexed by position in the lexicon's answer pool.
+        It is rebuilt from past sessions when the pool changes, and cleared to
+        start a new cycle once every answer has been seen. The history row
+        stays locked until the caller's unit of work ends, so concurrent games
+        for the same user mark their answers one after another.
+        
+        Args:
+            user_id: User ID
+            game_mode: Game mode
+            
+        Returns:
+            Answer word, or None if the mode has no answers or the history
+            could not be read
+        """
+        index = self.lexicon.get_index(game_mode)
+        if not index.answers:
+            return None
+        
+        history = self.answer_history_repo.get_or_create_for_update(user_id, game_mode)
+        if history is None:
+            return None
+        if history.lexicon_version != index.version:
+            self._rebuild_answer_history(history, index)
+        
+        position = index.pick_unseen(history.seen)
+        if position is None:
+            history.reset(index.version)
+            position = index.pick_unseen(history.seen)
+        
+        history.mark_seen(position)
+        return index.answers[position]
+    
+    def _rebuild_answer_history(self, history: UserAnswerHistory, index: LexiconIndex) -> None:
+        """Re-map a user's played answers onto the positions of a new answer pool.
+        
+        Args:
+            history: Answer history to rebuild
+            index: Current lexicon index
+        """
+        history.reset(index.version)
+        for word in self.session_repo.get_played_answer_words(history.user_id, history.game_mode):
+            position = index.answer_positions.get(word)
+            if position is not None:
+                history.mark_seen(position)
+        if history.seen_count >= len(index.answers):
+            history.reset(index.version)
     
     def get_daily_puzzle(self, user_id: int, game_mode: GameMode, puzzle_date: Optional[date] = None) -> Dict[str, Any]:
         """Get or create daily puzzle and user session.
@@ -108,78 +194,49 @@ class GameService:
             }
     
     def process_guess(self, user_id: int, guess_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a user's guess and update game state (unlimited play)."""
+        """Process a user's guess and update game state (unlimited play).
+        
+        Sessions cached in hot_sessions are updated with a conditional write
+        and no read; otherwise, or if the cached copy turns out to be stale,
+        the session row is locked for the whole guess. Either way the session
+        and the user's stats are committed together, so concurrent or
+        repeated submissions for the same session are applied one at a time.
+        
+        Args:
+            user_id: User ID
+            guess_data: Dictionary with 'word' and 'session_id'
+            
+        Returns:
+            Dictionary with guess feedback and updated session state
+        """
+        word = guess_data.get('word', '').strip().upper()
+        session_id = guess_data.get('session_id')
+        if not word or not session_id:
+            return {
+                'success': False,
+                'error': 'Word and session_id are required'
+            }
+        # Validate word format
+        is_valid_format, format_error = self.word_validator.validate_word_format(word)
+        if not is_valid_format:
+            return {
+                'success': False,
+                'error': format_error
+            }
         try:
-            word = guess_data.get('word', '').strip().upper()
-            session_id = guess_data.get('session_id')
-            if not word or not session_id:
-                return {
-                    'success': False,
-                    'error': 'Word and session_id are required'
-                }
-            session = self.session_repo.get_by_id(session_id)
-            if not session or session.user_id != user_id:
-                return {
-                    'success': False,
-                    'error': 'Invalid session'
-                }
-            if session.is_game_over():
-                return {
-                    'success': False,
-                    'error': 'Game is already completed'
-                }
-            # Use answer_word and game_mode from session
-            answer_word = session.answer_word
-            game_mode = session.game_mode
-            # Validate word format
-            is_valid_format, format_error = self.word_validator.validate_word_format(word)
-            if not is_valid_format:
-                return {
-                    'success': False,
-                    'error': format_error
-                }
-            if not self.word_validator.is_valid_guess(word, game_mode):
-                return {
-                    'success': False,
-                    'error': 'Word not in word list'
-                }
-            feedback = self.guess_processor.process_guess(word, answer_word)
-            is_correct = self.guess_processor.is_winning_guess(feedback)
-            session.add_guess(word, feedback)
-            if is_correct or session.get_current_guess_count() >= 6:
-                session.completed = True
-                session.won = is_correct
-                self._update_user_stats(user_id, game_mode, session.won, session.attempts_used)
-            updated_session = self.session_repo.update(session.id, {
-                'guesses': session.guesses,
-                'completed': session.completed,
-                'won': session.won,
-                'attempts_used': session.attempts_used
-            })
-            if not updated_session:
-                return {
-                    'success': False,
-                    'error': 'Failed to update session'
-                }
-            result = {
-                'success': True,
-                'guess': {
-                    'word': word,
-                    'feedback': feedback,
-                    'is_correct': is_correct
-                },
-                'session': {
-                    'id': session.id,
-                    'guesses': session.guesses,
-                    'completed': session.completed,
-                    'won': session.won,
-                    'attempts_used': session.attempts_used,
-                    'attempts_remaining': 6 - session.attempts_used
-                }
+            with unit_of_work():
+                hot = self.hot_sessions.get(session_id)
+                if hot is not None and hot.user_id == user_id:
+                    result = self._apply_cached_guess(hot, word)
+                    if result is not None:
+                        return result
+                return self._apply_guess(user_id, session_id, word)
+        except SQLAlchemyError as e:
+            logger.error(f"Error saving guess for user {user_id}: {e}")
+            return {
+                'success': False,
+                'error': 'Failed to update session'
             }
-            if session.completed:
-                result['target_word'] = answer_word
-            return result
         except Exception as e:
             logger.error(f"Error processing guess for user {user_id}: {e}")
             return {
@@ -187,6 +244,143 @@ class GameService:
                 'error': 'Internal server error'
             }
     
+    def _apply_guess(self, user_id: int, session_id: int, word: str) -> Dict[str, Any]:
+        """Apply a well-formed guess to a locked game session.
+        
+        Must run inside a unit of work; the session row lock is held until it
+        commits.
+        
+        Args:
+            user_id: User ID
+            session_id: Session ID
+            word: Uppercase 5-letter guess
+            
+        Returns:
+            Dictionary with guess feedback and updated session state
+        """
+        session = self.session_repo.get_for_update(session_id)
+        if not session or session.user_id != user_id:
+            return {
+                'success': False,
+                'error': 'Invalid session'
+            }
+        if session.is_game_over():
+            return {
+                'success': False,
+                'error': 'Game is already completed'
+            }
+        # Use answer_word and game_mode from session
+        answer_word = session.answer_word
+        game_mode = session.game_mode
+        if not self.word_validator.is_valid_guess(word, game_mode):
+            return {
+                'success': False,
+                'error': 'Word not in word list'
+            }
+        feedback = self.guess_processor.process_guess(word, answer_word, game_mode)
+        is_correct = self.guess_processor.is_winning_guess(feedback)
+        session.add_guess(word, feedback)
+        if is_correct or session.get_current_guess_count() >= 6:
+            session.completed = True
+            session.won = is_correct
+            self._update_user_stats(user_id, game_mode, session.won, session.attempts_used)
+            run_after_commit(lambda: self.hot_sessions.discard(session_id))
+        else:
+            snapshot = HotSession.from_session(session)
+            run_after_commit(lambda: self.hot_sessions.put(snapshot))
+        # Build the response before committing so it needs no reload
+        return self._guess_result(
+            session_id, word, feedback, is_correct, session.guesses,
+            session.completed, session.won, session.attempts_used, answer_word
+        )
+    
+    def _apply_cached_guess(self, hot: HotSession, word: str) -> Optional[Dict[str, Any]]:
+        """Apply a well-formed guess to a cached session without reading its row.
+        
+        Must run inside a unit of work. The guess is written with an UPDATE
+        conditional on the cached attempts_used, so it only lands if the row
+        has not changed since the copy was cached.
+        
+        Args:
+            hot: Cached copy of the session, owned by the guessing user
+            word: Uppercase 5-letter guess
+            
+        Returns:
+            Dictionary with guess feedback and updated session state, or None
+            if the copy was stale or the guess cannot be packed
+        """
+        if not self.word_validator.is_valid_guess(word, hot.game_mode):
+            return {
+                'success': False,
+                'error': 'Word not in word list'
+            }
+        if not word.isascii():
+            return None
+        
+        feedback = self.guess_processor.process_guess(word, hot.answer_word, hot.game_mode)
+        is_correct = self.guess_processor.is_winning_guess(feedback)
+        attempts_used = hot.attempts_used + 1
+        completed = is_correct or attempts_used >= 6
+        guesses_packed = hot.guesses_packed + pack_guess(word, feedback)
+        
+        if not self.session_repo.update_guesses_if_current(
+            hot.id, hot.attempts_used, guesses_packed, completed, is_correct
+        ):
+            # Changed elsewhere since it was cached; reread it under lock
+            self.hot_sessions.discard(hot.id)
+            return None
+        
+        if completed:
+            self._update_user_stats(hot.user_id, hot.game_mode, is_correct, attempts_used)
+            run_after_commit(lambda: self.hot_sessions.discard(hot.id))
+        else:
+            snapshot = HotSession(hot.id, hot.user_id, hot.answer_word, hot.game_mode, guesses_packed, attempts_used)
+            run_after_commit(lambda: self.hot_sessions.put(snapshot))
+        
+        return self._guess_result(
+            hot.id, word, feedback, is_correct, unpack_guesses(guesses_packed),
+            completed, is_correct, attempts_used, hot.answer_word
+        )
+    
+    def _guess_result(self, session_id: int, word: str, feedback: List[str], is_correct: bool,
+                      guesses: List[Dict[str, Any]], completed: bool, won: bool, attempts_used: int,
+                      answer_word: str) -> Dict[str, Any]:
+        """Build the response for an applied guess.
+        
+        Args:
+            session_id: Session ID
+            word: Guessed word
+            feedback: Feedback for each letter
+            is_correct: Whether the guess was the answer
+            guesses: All guesses including this one
+            completed: Whether the game is over
+            won: Whether the game was won
+            attempts_used: Number of guesses made
+            answer_word: Answer, revealed once the game is over
+            
+        Returns:
+            Dictionary with guess feedback and updated session state
+        """
+        result = {
+            'success': True,
+            'guess': {
+                'word': word,
+                'feedback': feedback,
+                'is_correct': is_correct
+            },
+            'session': {
+                'id': session_id,
+                'guesses': guesses,
+                'completed': completed,
+                'won': won,
+                'attempts_used': attempts_used,
+                'attempts_remaining': 6 - attempts_used
+            }
+        }
+        if completed:
+            result['target_word'] = answer_word
+        return result
+    
     def get_game_session(self, user_id: int, session_id: int) -> Dict[str, Any]:
         """Get game session details.
         
@@ -205,23 +399,9 @@ class GameService:
                     'error': 'Session not found'
                 }
             
-            # Get daily word
-            daily_word = self.daily_word_repo.get_by_id(session.daily_word_id)
-            
             return {
                 'success': True,
-                'session': {
-                    'id': session.id,
-                    'guesses': session.guesses or [],
-                    'completed': session.completed,
-                    'won': session.won,
-                    'attempts_used': session.attempts_used,
-                    'daily_word': {
-                        'date': daily_word.date.isoformat() if daily_word else None,
-                        'game_mode': daily_word.game_mode.value if daily_word else None,
-                        'word': daily_word.word if (daily_word and session.completed) else None
-                    }
-                }
+                'session': self._session_summary(session)
             }
             
         except Exception as e:
@@ -266,41 +446,155 @@ class GameService:
                 'error': 'Validation error'
             }
     
-    def get_user_game_history(self, user_id: int, game_mode: GameMode, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get user's game history for a specific mode.
+    def get_user_game_history(self, user_id: int, game_mode: Optional[GameMode] = None, limit: int = 10,
+                              cursor: Optional[str] = None, won: Optional[bool] = None,
+                              days: Optional[int] = None) -> Dict[str, Any]:
+        """Get a page of user's game history, newest first.
+        
+        Pages are addressed by opaque cursors over the session id rather than
+        page numbers, so deep pages are read from the (user_id, id) index
+        instead of skipping an OFFSET.
         
         Args:
             user_id: User ID
-            game_mode: Game mode to get history for
+            game_mode: Game mode to get history for (all modes if None)
             limit: Maximum number of games to return
+            cursor: next_cursor or prev_cursor from a previous page
+            won: Only won (True) or lost (False) games
+            days: Only games from the last number of days
             
         Returns:
-            List of game session summaries
+            Dictionary with games and the next and previous page cursors
         """
         try:
-            sessions = self.session_repo.get_user_sessions_by_mode(user_id, game_mode, limit)
+            direction, boundary = NEXT, None
+            if cursor:
+                try:
+                    direction, boundary = decode_cursor(cursor)
+                except ValueError:
+                    return {
+                        'success': False,
+                        'error': 'Invalid cursor'
+                    }
             
-            history = []
-            for session in sessions:
-                daily_word = self.daily_word_repo.get_by_id(session.daily_word_id)
-                
-                session_data = {
-                    'session_id': session.id,
-                    'date': daily_word.date.isoformat() if daily_word else None,
-                    'completed': session.completed,
-                    'won': session.won,
-                    'attempts_used': session.attempts_used,
-                    'target_word': daily_word.word if (daily_word and session.completed) else None
-                }
-                
-                history.append(session_data)
+            since = datetime.utcnow() - timedelta(days=days) if days else None
+            
+            # Fetch one extra row to learn whether another page follows
+            sessions = self.session_repo.get_user_sessions_page(
+                user_id, limit + 1, game_mode,
+                after=boundary if direction == NEXT else None,
+                before=boundary if direction == PREV else None,
+                won=won, since=since
+            )
+            more = len(sessions) > limit
+            if direction == PREV:
+                sessions = sessions[1:] if more else sessions
+                has_newer, has_older = more, True
+            else:
+                sessions = sessions[:limit]
+                has_newer, has_older = boundary is not None, more
             
-            return history
+            first, last = (sessions[0], sessions[-1]) if sessions else (None, None)
+            return {
+                'success': True,
+                'games': [self._session_summary(session) for session in sessions],
+                'next_cursor': encode_cursor(NEXT, last.id) if last and has_older else None,
+                'prev_cursor': encode_cursor(PREV, first.id) if first and has_newer else None
+            }
             
         except Exception as e:
             logger.error(f"Error getting game history for user {user_id}, mode {game_mode}: {e}")
-            return []
+            return {
+                'success': False,
+                'error': 'Internal server error'
+            }
+    
+    def _session_summary(self, session: GameSession) -> Dict[str, Any]:
+        """Summarize a game session for API responses.
+        
+        Args:
+            session: Game session
+            
+        Returns:
+            Session summary, with the answer only once the game is over
+        """
+        return {
+            'session_id': session.id,
+            'game_mode': session.game_mode.value,
+            'date': session.created_at.isoformat() if session.created_at else None,
+            'guesses': session.guesses or [],
+            'completed': session.completed,
+            'won': session.won,
+            'attempts_used': session.attempts_used,
+            'max_attempts': 6,
+            'target_word': session.answer_word if session.completed else None
+        }
+    
+    def export_game_history(self, user_id: int, export_format: str,
+                            game_mode: Optional[GameMode] = None) -> Iterator[str]:
+        """Serialize a user's full game history one line at a time.
+        
+        Sessions are streamed from the database in batches and each is
+        written out as soon as it is read, so memory use does not grow with
+        the number of games.
+        
+        Args:
+            user_id: User ID
+            export_format: 'ndjson' or 'csv'
+            game_mode: Only games in this mode (all modes if None)
+        
+        Yields:
+            NDJSON lines, or a CSV header row followed by CSV rows
+        
+        Raises:
+            ValueError: If the export format is not supported
+            SQLAlchemyError: If reading fails part way; the stream is cut
+                short with an error rather than ending as if complete
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+        
+        rows = self.session_repo.iter_user_sessions(user_id, game_mode)
+        
+        if export_format == 'ndjson':
+            for row in rows:
+                yield json.dumps(self._export_record(row), separators=(',', ':')) + '\n'
+            return
+        
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            record = self._export_record(row)
+            record['guesses'] = ' '.join(guess['word'] for guess in record['guesses'])
+            writer.writerow(record)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        # Only the header was written if the user has no games
+        if buffer.tell():
+            yield buffer.getvalue()
     
+    def _export_record(self, row: Row) -> Dict[str, Any]:
+        """Convert a streamed session row to an export record.
+        
+        Args:
+            row: Session row from GameSessionRepository.iter_user_sessions
+        
+        Returns:
+            Export record with the answer only once the game is over
+        """
+        return {
+            'session_id': row.id,
+            'game_mode': row.game_mode.value,
+            'date': row.created_at.isoformat() if row.created_at else None,
+            'completed': row.completed,
+            'won': row.won,
+            'attempts_used': row.attempts_used,
+            'target_word': row.answer_word if row.completed else None,
+            'guesses': decode_guesses(row.guesses_json, row.guesses_packed)
+        }
+
     def _get_or_create_session(self, user_id: int, daily_word_id: int) -> Optional[GameSession]:
         """Get existing session or create new one.
         
@@ -336,41 +630,32 @@ class GameService:
     def _update_user_stats(self, user_id: int, game_mode: GameMode, won: bool, attempts_used: int) -> None:
         """Update user statistics after game completion.
         
+        Must run inside the caller's unit of work so the user's stats and the
+        global aggregates are committed together with the finished game session.
+        Cached statistics are invalidated once that transaction commits.
+        
         Args:
             user_id: User ID
             game_mode: Game mode
             won: Whether the game was won
             attempts_used: Number of attempts used
         """
-        try:
-            # Get or create user stats
-            stats = self.stats_repo.get_by_user_and_mode(user_id, game_mode)
-            if not stats:
-                stats = UserStats(
-                    user_id=user_id,
-                    game_mode=game_mode,
-                    games_played=0,
-                    games_won=0,
-                    current_streak=0,
-                    max_streak=0,
-                    guess_distribution={"1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0}
-                )
-                stats = self.stats_repo.create(stats)
-            
-            if stats:
-                # Update stats
-                stats.update_stats(won, attempts_used)
-                
-                # Save updated stats
-                self.stats_repo.update(stats.id, {
-                    'games_played': stats.games_played,
-                    'games_won': stats.games_won,
-                    'current_streak': stats.current_streak,
-                    'max_streak': stats.max_streak,
-                    'guess_distribution': stats.guess_distribution
-                })
-                
-                logger.info(f"Updated stats for user {user_id}, mode {game_mode}: {stats.games_played} played, {stats.games_won} won")
-            
-        except Exception as e:
-            logger.error(f"Error updating user stats for user {user_id}, mode {game_mode}: {e}")
\ No newline at end of file
+        # Get or create user stats
+        stats = self.stats_repo.get_by_user_and_mode(user_id, game_mode, for_update=True)
+        new_player = stats is None
+        if new_player:
+            stats = self.stats_repo.create({
+                'user_id': user_id,
+                'game_mode': game_mode,
+                'games_played': 0,
+                'games_won': 0,
+                'current_streak': 0,
+                'max_streak': 0,
+                'guess_distribution': {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0}
+            })
+        
+        stats.update_stats(won, attempts_used)
+        self.global_stats_repo.record_game(game_mode, won, attempts_used, new_player=new_player)
+        run_after_commit(lambda: self.stats_service.invalidate_cached_stats(user_id, game_mode))
+        
+        logger.info(f"Updated stats for user {user_id}, mode {game_mode}: {stats.games_played} played, {stats.games_won} won")
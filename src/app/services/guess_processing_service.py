@@ -1,9 +1,12 @@
 """Guess processing service for generating Wordle feedback."""
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from collections import Counter
 
+from ..models.game import GameMode
+from .feedback_engine import FeedbackEngine, feedback_engine as default_feedback_engine
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,11 +18,15 @@ class GuessProcessingService:
     PRESENT = "present"     # Letter is in the word but wrong position (yellow)
     ABSENT = "absent"       # Letter is not in the word (gray)
     
-    def __init__(self):
-        """Initialize guess processing service."""
-        pass
+    def __init__(self, feedback_engine: Optional[FeedbackEngine] = None):
+        """Initialize guess processing service.
+        
+        Args:
+            feedback_engine: Precomputed feedback tables (defaults to the shared engine)
+        """
+        self.feedback_engine = feedback_engine or default_feedback_engine
     
-    def process_guess(self, guess: str, target_word: str) -> List[str]:
+    def process_guess(self, guess: str, target_word: str, game_mode: Optional[GameMode] = None) -> List[str]:
         """Process a guess against the target word and generate feedback.
         
         This implements the standard Wordle feedback algorithm:
@@ -27,9 +34,13 @@ class GuessProcessingService:
         - Yellow (present): Letter is in the word but wrong position
         - Gray (absent): Letter is not in the word
         
+        When a game mode is given and its precomputed feedback table covers both
+        words, feedback is a single table lookup; otherwise it is computed below.
+        
         Args:
             guess: The guessed word (5 letters)
             target_word: The target word to compare against (5 letters)
+            game_mode: Game mode whose feedback table should be consulted
             
         Returns:
             List of feedback strings for each letter position
@@ -48,6 +59,11 @@ class GuessProcessingService:
             guess = guess.upper().strip()
             target = target_word.upper().strip()
             
+            if game_mode is not None:
+                feedback = self.feedback_engine.lookup(guess, target, game_mode)
+                if feedback is not None:
+                    return feedback
+            
             logger.debug(f"Processing guess '{guess}' against target '{target}'")
             
             # Initialize feedback array
@@ -0,0 +1,161 @@
+"""Write-through cache of in-progress game sessions.
+
+A player usually sends several guesses within a minute, so the state needed
+to apply a guess is kept in memory between requests instead of being reread
+and locked each time. The database stays the source of truth:
+
+* Every guess is written through before the request returns, using an
+  UPDATE that only matches while the row still has the number of guesses
+  the cached copy had (attempts_used is the version). A stale copy can
+  therefore never overwrite a newer guess.
+* No worker owns a session. Each worker keeps its own copies; when another
+  worker, thread or request has written the session first, the conditional
+  UPDATE matches nothing, the copy is dropped and the guess is applied
+  through the locking path, which rereads the row.
+* Copies are only stored or replaced after the unit of work commits, so a
+  rolled-back guess never leaves a copy ahead of the database.
+* Only sessions in progress with packed guesses are cached; finished games
+  are dropped.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from flask import Flask
+
+from ..models.game import GameMode, GameSession, unpack_guesses
+from ..utils.cache_backends import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of cached sessions per worker
+DEFAULT_HOT_SESSION_CACHE_SIZE = 10000
+
+# Seconds an idle session stays cached
+HOT_SESSION_TTL = 600
+
+# Byte budget for cached sessions; entries are a few hundred bytes each
+HOT_SESSION_MAX_BYTES = 16 * 1024 * 1024
+
+
+class HotSession:
+    """Immutable snapshot of the fields needed to apply a guess."""
+
+    __slots__ = ('id', 'user_id', 'answer_word', 'game_mode', 'guesses_packed', 'attempts_used')
+
+    def __init__(self, session_id: int, user_id: int, answer_word: str, game_mode: GameMode,
+                 guesses_packed: bytes, attempts_used: int):
+        """Initialize snapshot.
+
+        Args:
+            session_id: Game session ID
+            user_id: Owner of the session
+            answer_word: Answer for the session
+            game_mode: Game mode
+            guesses_packed: Packed guesses as committed
+            attempts_used: Number of guesses as committed
+        """
+        self.id = session_id
+        self.user_id = user_id
+        self.answer_word = answer_word
+        self.game_mode = game_mode
+        self.guesses_packed = guesses_packed
+        self.attempts_used = attempts_used
+
+    @classmethod
+    def from_session(cls, session: GameSession) -> 'HotSession':
+        """Snapshot a game session."""
+        return cls(session.id, session.user_id, session.answer_word, session.game_mode,
+                   session.guesses_packed, session.attempts_used)
+
+    @property
+    def guesses(self) -> List[Dict[str, Any]]:
+        """Guesses made so far."""
+        return unpack_guesses(self.guesses_packed)
+
+
+class HotSessionCache:
+    """Bounded per-worker cache of in-progress game sessions, keyed by session id."""
+
+    def __init__(self, max_entries: int = DEFAULT_HOT_SESSION_CACHE_SIZE, ttl: int = HOT_SESSION_TTL):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached sessions; 0 disables caching
+            ttl: Seconds an idle session stays cached
+        """
+        self.ttl = ttl
+        self.enabled = max_entries > 0
+        self._cache = LRUCache(max_entries=max(max_entries, 1), max_bytes=HOT_SESSION_MAX_BYTES)
+
+    @staticmethod
+    def _key(session_id: int) -> str:
+        """Cache key for a session."""
+        return f"session:{session_id}"
+
+    def get(self, session_id: int) -> Optional[HotSession]:
+        """Get the cached copy of a session.
+
+        Args:
+            session_id: Game session ID
+
+        Returns:
+            Cached HotSession, or None if not cached
+        """
+        if not self.enabled:
+            return None
+        return self._cache.get(self._key(session_id))
+
+    def put(self, session: HotSession) -> None:
+        """Cache a committed session, or drop it if it cannot be cached.
+
+        Args:
+            session: Snapshot of the session as committed
+        """
+        if not self.enabled:
+            return
+        if session.guesses_packed is None or session.attempts_used >= 6:
+            self.discard(session.id)
+            return
+        self._cache.set(self._key(session.id), session, self.ttl)
+
+    def discard(self, session_id: int) -> None:
+        """Drop the cached copy of a session.
+
+        Args:
+            session_id: Game session ID
+        """
+        self._cache.delete(self._key(session_id))
+
+    def configure(self, max_entries: int) -> None:
+        """Resize the cache and drop all cached sessions.
+
+        Args:
+            max_entries: Maximum number of cached sessions; 0 disables caching
+        """
+        self.enabled = max_entries > 0
+        self._cache.configure(max_entries=max(max_entries, 1))
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        stats = self._cache.stats()
+        stats['enabled'] = self.enabled
+        return stats
+
+    def __len__(self) -> int:
+        """Number of cached sessions."""
+        return len(self._cache)
+
+
+# Global hot session cache
+hot_sessions = HotSessionCache()
+
+
+def init_hot_sessions(app: Flask) -> None:
+    """Configure the global hot session cache from application settings.
+
+    Args:
+        app: Flask application instance
+    """
+    hot_sessions.configure(app.config.get('HOT_SESSION_CACHE_SIZE', DEFAULT_HOT_SESSION_CACHE_SIZE))
@@ -0,0 +1,276 @@
+"""In-process lexicon index for O(1) word membership checks."""
+
+import logging
+import random
+import threading
+import time
+from typing import AbstractSet, Dict, Iterable, Optional, Tuple
+
+from flask import Flask
+
+from ..models.game import GameMode
+from ..repositories.game_repository import WordListRepository
+
+logger = logging.getLogger(__name__)
+
+# Seconds between word list version checks against the database
+DEFAULT_REFRESH_INTERVAL = 60.0
+
+# Random draws to try before scanning the pool for a non-excluded answer
+MAX_EXCLUSION_DRAWS = 8
+
+
+class LexiconIndex:
+    """Immutable snapshot of one game mode's word list."""
+
+    __slots__ = ('game_mode', 'version', 'words', 'answer_words', 'answers', 'answer_positions')
+
+    def __init__(self, game_mode: GameMode, version: Optional[str], words: Iterable[Tuple[str, bool]]):
+        """Initialize lexicon index.
+
+        Args:
+            game_mode: Game mode the index belongs to
+            version: Word list version stamp the snapshot was taken at
+            words: (word, is_answer) tuples, answers in selection order
+        """
+        words = [(word.upper(), is_answer) for word, is_answer in words]
+
+        self.game_mode = game_mode
+        self.version = version
+        self.words = frozenset(word for word, _ in words)
+        self.answers = tuple(word for word, is_answer in words if is_answer)
+        self.answer_words = frozenset(self.answers)
+        self.answer_positions = {word: position for position, word in enumerate(self.answers)}
+
+    def is_valid_guess(self, word: str) -> bool:
+        """Check if a normalized word can be guessed.
+
+        Args:
+            word: Uppercase 5-letter word
+
+        Returns:
+            True if the word is in the word list
+        """
+        return word in self.words
+
+    def is_answer_word(self, word: str) -> bool:
+        """Check if a normalized word can be an answer.
+
+        Args:
+            word: Uppercase 5-letter word
+
+        Returns:
+            True if the word is an answer word
+        """
+        return word in self.answer_words
+
+    def pick_answer(self, exclude: Optional[AbstractSet[str]] = None) -> Optional[str]:
+        """Pick a random answer word in constant time.
+
+        Excluded words are skipped by redrawing; only when most of the pool is
+        excluded does it fall back to scanning for the remaining answers.
+
+        Args:
+            exclude: Answer words to avoid, e.g. recently played answers
+
+        Returns:
+            Random answer word, or None if the mode has no answers
+        """
+        answers = self.answers
+        if not answers:
+            return None
+
+        if not exclude:
+            return random.choice(answers)
+
+        for _ in range(MAX_EXCLUSION_DRAWS):
+            word = random.choice(answers)
+            if word not in exclude:
+                return word
+
+        remaining = [word for word in answers if word not in exclude]
+        return random.choice(remaining or answers)
+
+    def pick_unseen(self, seen: bytes) -> Optional[int]:
+        """Pick the position of a random answer whose bit is clear in a seen-bitset.
+
+        Random positions are tried first, which almost always succeeds while
+        most of the pool is unseen; otherwise the bitset is scanned a byte at a
+        time for the k-th clear bit, so the cost stays proportional to the pool
+        size rather than to the number of games played.
+
+        Args:
+            seen: Little-endian bitset where bit i marks answers[i] as seen
+
+        Returns:
+            Position in answers, or None if every answer has been seen
+        """
+        count = len(self.answers)
+        if not count:
+            return None
+
+        for _ in range(MAX_EXCLUSION_DRAWS):
+            position = random.randrange(count)
+            byte_index = position >> 3
+            if byte_index >= len(seen) or not seen[byte_index] >> (position & 7) & 1:
+                return position
+
+        byte_count = (count + 7) >> 3
+        seen = seen[:byte_count].ljust(byte_count, b"\x00")
+        free_bits = ~int.from_bytes(seen, 'little') & ((1 << count) - 1)
+        remaining = free_bits.bit_count()
+        if not remaining:
+            return None
+
+        k = random.randrange(remaining)
+        last_byte_mask = (1 << (count - ((byte_count - 1) << 3))) - 1
+        for byte_index, byte in enumerate(seen):
+            free = ~byte & (last_byte_mask if byte_index == byte_count - 1 else 0xFF)
+            free_count = free.bit_count()
+            if k < free_count:
+                for bit in range(8):
+                    if free >> bit & 1:
+                        if not k:
+                            return (byte_index << 3) + bit
+                        k -= 1
+            k -= free_count
+        return None
+
+    def __len__(self) -> int:
+        """Number of words in the index."""
+        return len(self.words)
+
+
+class Lexicon:
+    """Registry of lexicon indexes, reloaded when the word list version changes.
+
+    Each mode's index is loaded once and swapped atomically for a new snapshot
+    whenever the word list version stamp in the database changes, which is
+    checked at most once per refresh interval.
+    """
+
+    def __init__(self, refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+        """Initialize lexicon with no indexes loaded.
+
+        Args:
+            refresh_interval: Seconds between version checks
+        """
+        self.refresh_interval = refresh_interval
+        self._indexes: Dict[GameMode, LexiconIndex] = {}
+        self._next_check: Dict[GameMode, float] = {}
+        self._lock = threading.Lock()
+
+    def get_index(self, game_mode: GameMode, word_repo: Optional[WordListRepository] = None) -> LexiconIndex:
+        """Get the current index for a game mode, loading or refreshing it if due.
+
+        Args:
+            game_mode: Game mode
+            word_repo: Repository to read words from
+
+        Returns:
+            Current LexiconIndex for the mode
+        """
+        index = self._indexes.get(game_mode)
+        if index is not None and time.monotonic() < self._next_check.get(game_mode, 0.0):
+            return index
+
+        with self._lock:
+            index = self._indexes.get(game_mode)
+            if index is not None and time.monotonic() < self._next_check.get(game_mode, 0.0):
+                return index
+            return self._refresh(game_mode, word_repo or WordListRepository())
+
+    def _refresh(self, game_mode: GameMode, word_repo: WordListRepository) -> LexiconIndex:
+        """Reload an index if its version stamp changed.
+
+        Args:
+            game_mode: Game mode
+            word_repo: Repository to read words from
+
+        Returns:
+            Current LexiconIndex for the mode
+        """
+        current = self._indexes.get(game_mode)
+        version = word_repo.get_word_list_version(game_mode)
+
+        if version is None:
+            # Keep serving the last good snapshot if the database is unavailable
+            if current is not None:
+                return current
+            return LexiconIndex(game_mode, None, [])
+
+        if current is None or current.version != version:
+            current = LexiconIndex(game_mode, version, word_repo.get_words_by_mode(game_mode))
+            self._indexes[game_mode] = current
+            logger.info(f"Loaded lexicon for {game_mode.value}: {len(current)} words (version {version})")
+
+        self._next_check[game_mode] = time.monotonic() + self.refresh_interval
+        return current
+
+    def is_valid_guess(self, word: str, game_mode: GameMode) -> bool:
+        """Check if a normalized word can be guessed in a game mode.
+
+        Args:
+            word: Uppercase 5-letter word
+            game_mode: Game mode
+
+        Returns:
+            True if the word is in the word list
+        """
+        return self.get_index(game_mode).is_valid_guess(word)
+
+    def is_answer_word(self, word: str, game_mode: GameMode) -> bool:
+        """Check if a normalized word can be an answer in a game mode.
+
+        Args:
+            word: Uppercase 5-letter word
+            game_mode: Game mode
+
+        Returns:
+            True if the word is an answer word
+        """
+        return self.get_index(game_mode).is_answer_word(word)
+
+    def random_answer(self, game_mode: GameMode, exclude: Optional[AbstractSet[str]] = None) -> Optional[str]:
+        """Pick a random answer word for a game mode.
+
+        Args:
+            game_mode: Game mode
+            exclude: Answer words to avoid
+
+        Returns:
+            Random answer word, or None if the mode has no answers
+        """
+        return self.get_index(game_mode).pick_answer(exclude)
+
+    def invalidate(self, game_mode: Optional[GameMode] = None) -> None:
+        """Force a version check on next access.
+
+        Args:
+            game_mode: Game mode to invalidate (all modes if None)
+        """
+        with self._lock:
+            if game_mode is None:
+                self._next_check.clear()
+            else:
+                self._next_check.pop(game_mode, None)
+
+    def clear(self) -> None:
+        """Drop all loaded indexes."""
+        with self._lock:
+            self._indexes.clear()
+            self._next_check.clear()
+
+
+# Global lexicon instance
+lexicon = Lexicon()
+
+
+def init_lexicon(app: Flask) -> None:
+    """Configure the global lexicon from application settings.
+
+    Args:
+        app: Flask application instance
+    """
+    lexicon.refresh_interval = app.config.get('LEXICON_REFRESH_SECONDS', DEFAULT_REFRESH_INTERVAL)
+    lexicon.clear()
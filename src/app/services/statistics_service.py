@@ -4,11 +4,34 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from ..models.game import GameMode, UserStats
-from ..repositories.game_repository import UserStatsRepository, GameSessionRepository
+from ..repositories.game_repository import UserStatsRepository, GameSessionRepository, GlobalStatsRepository
 from ..repositories.user_repository import UserRepository
+from ..utils.caching import app_cache, get_or_compute, invalidate_tags, leaderboard_tag, mode_tag, user_tag
 
 logger = logging.getLogger(__name__)
 
+# Metrics players can be ranked by
+LEADERBOARD_METRICS = ('win_percentage', 'total_wins', 'current_streak')
+
+# Minimum games played to be ranked by win percentage
+LEADERBOARD_MIN_GAMES = 5
+
+# Read-through cache lifetimes in seconds
+USER_STATS_CACHE_TTL = 600
+LEADERBOARD_CACHE_TTL = 300
+GLOBAL_STATS_CACHE_TTL = 300
+
+# User stats lifetime when each worker has its own cache; invalidating a
+# user's stats only reaches the worker that recorded the game, so the others
+# may serve the old stats until they expire
+USER_STATS_LOCAL_CACHE_TTL = 5
+
+# Seconds an expired leaderboard may be served while it is recomputed
+LEADERBOARD_STALE_TTL = 60
+
+# Leaderboard entries cached per mode and metric; smaller limits are sliced from them
+LEADERBOARD_CACHE_SIZE = 50
+
 
 class StatisticsService:
     """Service for managing user statistics and leaderboards."""
@@ -16,6 +39,7 @@ class StatisticsService:
     def __init__(self):
         """Initialize statistics service."""
         self.stats_repo = UserStatsRepository()
+        self.global_stats_repo = GlobalStatsRepository()
         self.session_repo = GameSessionRepository()
         self.user_repo = UserRepository()
     
@@ -30,30 +54,12 @@ class StatisticsService:
             Dictionary with user statistics
         """
         try:
-            stats = self.stats_repo.get_by_user_and_mode(user_id, game_mode)
-            
-            if not stats:
-                # Return default stats if none exist
-                return self._get_default_stats(game_mode)
-            
-            # Calculate additional metrics
-            win_percentage = stats.get_win_percentage()
-            average_guesses = stats.get_average_guesses()
-            
-            return {
-                'user_id': user_id,
-                'game_mode': game_mode.value,
-                'games_played': stats.games_played,
-                'games_won': stats.games_won,
-                'win_percentage': win_percentage,
-                'current_streak': stats.current_streak,
-                'max_streak': stats.max_streak,
-                'average_guesses': average_guesses,
-                'guess_distribution': stats.guess_distribution,
-                'total_guesses': self._calculate_total_guesses(stats.guess_distribution),
-                'last_updated': stats.updated_at.isoformat() if stats.updated_at else None
-            }
-            
+            return get_or_compute(
+                f"user_stats:{user_id}:{game_mode.value}",
+                lambda: self._compute_user_stats(user_id, game_mode),
+                ttl=self._user_stats_ttl(),
+                tags=(user_tag(user_id),)
+            )
         except Exception as e:
             logger.error(f"Error getting user stats for user {user_id}, mode {game_mode}: {e}")
             return self._get_default_stats(game_mode)
@@ -68,26 +74,12 @@ class StatisticsService:
             Dictionary with stats for all game modes
         """
         try:
-            stats = {}
-            
-            for mode in GameMode:
-                stats[mode.value] = self.get_user_stats(user_id, mode)
-            
-            # Calculate combined stats
-            total_games = sum(s['games_played'] for s in stats.values())
-            total_wins = sum(s['games_won'] for s in stats.values())
-            overall_win_percentage = (total_wins / total_games * 100) if total_games > 0 else 0.0
-            
-            return {
-                'user_id': user_id,
-                'modes': stats,
-                'overall': {
-                    'total_games_played': total_games,
-                    'total_games_won': total_wins,
-                    'overall_win_percentage': round(overall_win_percentage, 1)
-                }
-            }
-            
+            return get_or_compute(
+                f"user_stats:{user_id}:all",
+                lambda: self._compute_user_all_stats(user_id),
+                ttl=self._user_stats_ttl(),
+                tags=(user_tag(user_id),)
+            )
         except Exception as e:
             logger.error(f"Error getting all stats for user {user_id}: {e}")
             return {
@@ -111,37 +103,23 @@ class StatisticsService:
         Returns:
             List of user statistics ordered by the specified metric
         """
+        if metric not in LEADERBOARD_METRICS:
+            logger.warning(f"Unknown leaderboard metric: {metric}")
+            return []
+        
         try:
-            if metric == 'win_percentage':
-                stats_list = self.stats_repo.get_leaderboard_by_win_percentage(game_mode, min_games=5, limit=limit)
-            elif metric == 'total_wins':
-                stats_list = self.stats_repo.get_leaderboard_by_wins(game_mode, limit=limit)
-            elif metric == 'current_streak':
-                stats_list = self.stats_repo.get_leaderboard_by_streak(game_mode, limit=limit)
-            else:
-                logger.warning(f"Unknown leaderboard metric: {metric}")
-                return []
-            
-            leaderboard = []
-            for rank, stats in enumerate(stats_list, 1):
-                # Get user info
-                user = self.user_repo.get_by_id(stats.user_id)
-                
-                entry = {
-                    'rank': rank,
-                    'user_id': stats.user_id,
-                    'username': user.username if user else 'Unknown',
-                    'games_played': stats.games_played,
-                    'games_won': stats.games_won,
-                    'win_percentage': stats.get_win_percentage(),
-                    'current_streak': stats.current_streak,
-                    'max_streak': stats.max_streak,
-                    'average_guesses': stats.get_average_guesses()
-                }
-                
-                leaderboard.append(entry)
-            
-            return leaderboard
+            if limit > LEADERBOARD_CACHE_SIZE:
+                return self._compute_leaderboard(game_mode, metric, limit)
+            
+            # One cached board per mode and metric serves every smaller limit
+            leaderboard = get_or_compute(
+                f"leaderboard:{game_mode.value}:{metric}:{LEADERBOARD_CACHE_SIZE}",
+                lambda: self._compute_leaderboard(game_mode, metric, LEADERBOARD_CACHE_SIZE),
+                ttl=LEADERBOARD_CACHE_TTL,
+                stale_ttl=LEADERBOARD_STALE_TTL,
+                tags=(mode_tag(game_mode.value), leaderboard_tag(game_mode.value))
+            )
+            return leaderboard[:limit]
             
         except Exception as e:
             logger.error(f"Error getting leaderboard for mode {game_mode}, metric {metric}: {e}")
@@ -157,60 +135,12 @@ class StatisticsService:
             Dictionary with global statistics
         """
         try:
-            # This would require aggregate queries in the repository
-            # For now, we'll implement a basic version
-            
-            # Get all stats for the mode (this is not efficient for large datasets)
-            all_stats = self.stats_repo.session.query(UserStats).filter(
-                UserStats.game_mode == game_mode
-            ).all()
-            
-            if not all_stats:
-                return {
-                    'game_mode': game_mode.value,
-                    'total_players': 0,
-                    'total_games': 0,
-                    'total_wins': 0,
-                    'global_win_percentage': 0.0,
-                    'average_attempts': 0.0,
-                    'guess_distribution_percentage': {str(i): 0.0 for i in range(1, 7)}
-                }
-            
-            # Calculate aggregates
-            total_players = len(all_stats)
-            total_games = sum(s.games_played for s in all_stats)
-            total_wins = sum(s.games_won for s in all_stats)
-            global_win_percentage = (total_wins / total_games * 100) if total_games > 0 else 0.0
-            
-            # Calculate global guess distribution
-            global_distribution = {str(i): 0 for i in range(1, 7)}
-            total_won_games = 0
-            
-            for stats in all_stats:
-                for attempts, count in stats.guess_distribution.items():
-                    if attempts in global_distribution:
-                        global_distribution[attempts] += count
-                        total_won_games += count
-            
-            # Convert to percentages
-            distribution_percentage = {}
-            for attempts, count in global_distribution.items():
-                distribution_percentage[attempts] = (count / total_won_games * 100) if total_won_games > 0 else 0.0
-            
-            # Calculate average attempts for won games
-            total_attempts = sum(int(attempts) * count for attempts, count in global_distribution.items())
-            average_attempts = total_attempts / total_won_games if total_won_games > 0 else 0.0
-            
-            return {
-                'game_mode': game_mode.value,
-                'total_players': total_players,
-                'total_games': total_games,
-                'total_wins': total_wins,
-                'global_win_percentage': round(global_win_percentage, 1),
-                'average_attempts': round(average_attempts, 2),
-                'guess_distribution_percentage': {k: round(v, 1) for k, v in distribution_percentage.items()}
-            }
-            
+            return get_or_compute(
+                f"global_stats:{game_mode.value}",
+                lambda: self._compute_global_statistics(game_mode),
+                ttl=GLOBAL_STATS_CACHE_TTL,
+                tags=(mode_tag(game_mode.value),)
+            )
         except Exception as e:
             logger.error(f"Error getting global statistics for mode {game_mode}: {e}")
             return {
@@ -229,46 +159,73 @@ class StatisticsService:
         Returns:
             Dictionary with user's rank information
         """
+        ranks = self.get_user_ranks(user_id, game_mode, [metric])
+        if 'error' in ranks:
+            return {
+                'user_id': user_id,
+                'game_mode': game_mode.value,
+                'metric': metric,
+                'error': 'Failed to calculate rank'
+            }
+        
+        return {
+            'user_id': user_id,
+            'game_mode': game_mode.value,
+            'metric': metric,
+            **ranks['ranks'][metric]
+        }
+    
+    def get_user_ranks(self, user_id: int, game_mode: GameMode, metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get user's rank in several metrics for a game mode with indexed counting queries.
+        
+        Args:
+            user_id: User ID
+            game_mode: Game mode
+            metrics: Metrics to rank by (defaults to all leaderboard metrics)
+            
+        Returns:
+            Dictionary with rank, total players and percentile per metric
+        """
+        metrics = metrics or list(LEADERBOARD_METRICS)
         try:
-            # Get user's stats
             user_stats = self.stats_repo.get_by_user_and_mode(user_id, game_mode)
             if not user_stats:
                 return {
                     'user_id': user_id,
                     'game_mode': game_mode.value,
-                    'metric': metric,
-                    'rank': None,
-                    'total_players': 0,
-                    'percentile': 0.0
+                    'ranks': {
+                        metric: {'rank': None, 'total_players': 0, 'percentile': 0.0}
+                        for metric in metrics
+                    }
                 }
             
-            # Get leaderboard to find user's rank
-            leaderboard = self.get_leaderboard(game_mode, metric, limit=1000)  # Get more entries
-            
-            user_rank = None
-            for entry in leaderboard:
-                if entry['user_id'] == user_id:
-                    user_rank = entry['rank']
-                    break
-            
-            total_players = len(leaderboard)
-            percentile = ((total_players - user_rank + 1) / total_players * 100) if user_rank else 0.0
+            counts = self.stats_repo.get_rank_counts(user_stats, metrics, min_games=LEADERBOARD_MIN_GAMES)
+            if counts is None:
+                raise RuntimeError("rank query failed")
+            
+            ranks = {}
+            for metric in metrics:
+                ahead, total_players = counts[metric]
+                ranked = metric != 'win_percentage' or user_stats.games_played >= LEADERBOARD_MIN_GAMES
+                user_rank = ahead + 1 if ranked else None
+                percentile = ((total_players - user_rank + 1) / total_players * 100) if user_rank else 0.0
+                ranks[metric] = {
+                    'rank': user_rank,
+                    'total_players': total_players,
+                    'percentile': round(percentile, 1)
+                }
             
             return {
                 'user_id': user_id,
                 'game_mode': game_mode.value,
-                'metric': metric,
-                'rank': user_rank,
-                'total_players': total_players,
-                'percentile': round(percentile, 1)
+                'ranks': ranks
             }
             
         except Exception as e:
-            logger.error(f"Error getting user rank for user {user_id}, mode {game_mode}, metric {metric}: {e}")
+            logger.error(f"Error getting user ranks for user {user_id}, mode {game_mode}, metrics {metrics}: {e}")
             return {
                 'user_id': user_id,
                 'game_mode': game_mode.value,
-                'metric': metric,
                 'error': 'Failed to calculate rank'
             }
     
@@ -337,6 +294,159 @@ class StatisticsService:
                 'error': 'Failed to analyze streaks'
             }
     
+    def invalidate_cached_stats(self, user_id: int, game_mode: GameMode) -> None:
+        """Drop cached statistics affected by a finished game.
+        
+        Bumps the user's tag and the mode's tag, which covers the user's own
+        stats plus every leaderboard and global aggregate for the mode.
+        
+        Args:
+            user_id: User whose game finished
+            game_mode: Game mode of the finished game
+        """
+        invalidate_tags(user_tag(user_id), mode_tag(game_mode.value))
+    
+    def _user_stats_ttl(self) -> int:
+        """Cache lifetime for a user's stats, short unless the cache is shared."""
+        return USER_STATS_CACHE_TTL if app_cache.shared else USER_STATS_LOCAL_CACHE_TTL
+    
+    def _compute_user_stats(self, user_id: int, game_mode: GameMode) -> Dict[str, Any]:
+        """Build a user's statistics for a game mode from the database.
+        
+        Args:
+            user_id: User ID
+            game_mode: Game mode
+            
+        Returns:
+            Dictionary with user statistics
+        """
+        stats = self.stats_repo.get_by_user_and_mode(user_id, game_mode)
+        
+        if not stats:
+            # Return default stats if none exist
+            return self._get_default_stats(game_mode)
+        
+        return {
+            'user_id': user_id,
+            'game_mode': game_mode.value,
+            'games_played': stats.games_played,
+            'games_won': stats.games_won,
+            'win_percentage': stats.get_win_percentage(),
+            'current_streak': stats.current_streak,
+            'max_streak': stats.max_streak,
+            'average_guesses': stats.get_average_guesses(),
+            'guess_distribution': stats.guess_distribution,
+            'total_guesses': self._calculate_total_guesses(stats.guess_distribution),
+            'last_updated': stats.updated_at.isoformat() if stats.updated_at else None
+        }
+    
+    def _compute_user_all_stats(self, user_id: int) -> Dict[str, Any]:
+        """Combine a user's statistics across all game modes.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Dictionary with stats for all game modes
+        """
+        stats = {}
+        
+        for mode in GameMode:
+            stats[mode.value] = self.get_user_stats(user_id, mode)
+        
+        # Calculate combined stats
+        total_games = sum(s['games_played'] for s in stats.values())
+        total_wins = sum(s['games_won'] for s in stats.values())
+        overall_win_percentage = (total_wins / total_games * 100) if total_games > 0 else 0.0
+        
+        return {
+            'user_id': user_id,
+            'modes': stats,
+            'overall': {
+                'total_games_played': total_games,
+                'total_games_won': total_wins,
+                'overall_win_percentage': round(overall_win_percentage, 1)
+            }
+        }
+    
+    def _compute_leaderboard(self, game_mode: GameMode, metric: str, limit: int) -> List[Dict[str, Any]]:
+        """Build a leaderboard from the database.
+        
+        Args:
+            game_mode: Game mode
+            metric: Metric to rank by
+            limit: Number of top users to return
+            
+        Returns:
+            List of leaderboard entries
+        """
+        rows = self.stats_repo.get_leaderboard_rows(game_mode, metric, limit=limit, min_games=LEADERBOARD_MIN_GAMES)
+        
+        return [
+            {
+                'rank': rank,
+                'user_id': row.user_id,
+                'username': row.username,
+                'games_played': row.games_played,
+                'games_won': row.games_won,
+                'win_percentage': UserStats.win_percentage(row.games_won, row.games_played),
+                'current_streak': row.current_streak,
+                'max_streak': row.max_streak,
+                'average_guesses': UserStats.average_guesses(row.guess_distribution, row.games_won)
+            }
+            for rank, row in enumerate(rows, 1)
+        ]
+    
+    def _compute_global_statistics(self, game_mode: GameMode) -> Dict[str, Any]:
+        """Build global statistics for a game mode from the aggregate row.
+        
+        Args:
+            game_mode: Game mode
+            
+        Returns:
+            Dictionary with global statistics
+        """
+        # Totals are maintained incrementally as games finish
+        global_stats = self.global_stats_repo.get_by_mode(game_mode)
+
+        if not global_stats or not global_stats.total_players:
+            return {
+                'game_mode': game_mode.value,
+                'total_players': 0,
+                'total_games': 0,
+                'total_wins': 0,
+                'global_win_percentage': 0.0,
+                'average_attempts': 0.0,
+                'guess_distribution_percentage': {str(i): 0.0 for i in range(1, 7)}
+            }
+
+        total_players = global_stats.total_players
+        total_games = global_stats.total_games
+        total_wins = global_stats.total_wins
+        global_win_percentage = (total_wins / total_games * 100) if total_games > 0 else 0.0
+
+        global_distribution = global_stats.get_guess_distribution()
+        total_won_games = sum(global_distribution.values())
+
+        # Convert to percentages
+        distribution_percentage = {}
+        for attempts, count in global_distribution.items():
+            distribution_percentage[attempts] = (count / total_won_games * 100) if total_won_games > 0 else 0.0
+
+        # Calculate average attempts for won games
+        total_attempts = sum(int(attempts) * count for attempts, count in global_distribution.items())
+        average_attempts = total_attempts / total_won_games if total_won_games > 0 else 0.0
+
+        return {
+            'game_mode': game_mode.value,
+            'total_players': total_players,
+            'total_games': total_games,
+            'total_wins': total_wins,
+            'global_win_percentage': round(global_win_percentage, 1),
+            'average_attempts': round(average_attempts, 2),
+            'guess_distribution_percentage': {k: round(v, 1) for k, v in distribution_percentage.items()}
+        }
+    
     def _get_default_stats(self, game_mode: GameMode) -> Dict[str, Any]:
         """Get default statistics structure for a user with no games.
         
@@ -5,6 +5,7 @@ from typing import Optional
 
 from ..models.game import GameMode, WordList
 from ..repositories.game_repository import WordListRepository
+from .lexicon import Lexicon, lexicon as default_lexicon
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +13,14 @@ logger = logging.getLogger(__name__)
 class WordValidationService:
     """Service for validating words and managing word lists."""
     
-    def __init__(self):
-        """Initialize word validation service."""
+    def __init__(self, lexicon: Optional[Lexicon] = None):
+        """Initialize word validation service.
+        
+        Args:
+            lexicon: In-process word list index (defaults to the shared lexicon)
+        """
         self.word_repo = WordListRepository()
+        self.lexicon = lexicon or default_lexicon
     
     def is_valid_guess(self, word: str, game_mode: GameMode) -> bool:
         """Check if a word is valid for guessing in the given game mode.
@@ -35,7 +41,7 @@ class WordValidationService:
                 return False
             
             normalized_word = word.upper().strip()
-            is_valid = self.word_repo.is_valid_word(normalized_word, game_mode)
+            is_valid = self.lexicon.is_valid_guess(normalized_word, game_mode)
             
             logger.debug(f"Word validation: {normalized_word} in {game_mode.value} = {is_valid}")
             return is_valid
@@ -62,7 +68,7 @@ class WordValidationService:
                 return False
             
             normalized_word = word.upper().strip()
-            is_answer = self.word_repo.is_answer_word(normalized_word, game_mode)
+            is_answer = self.lexicon.is_answer_word(normalized_word, game_mode)
             
             logger.debug(f"Answer word check: {normalized_word} in {game_mode.value} = {is_answer}")
             return is_answer
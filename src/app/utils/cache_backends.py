@@ -0,0 +1,565 @@
+"""Cache backends: in-process LRU and a SQLite store shared between workers."""
+
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default bounds for the cache
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Sets between bound checks in the shared backend
+SQLITE_EVICTION_INTERVAL = 100
+
+# Container nesting followed when estimating entry sizes
+SIZEOF_MAX_DEPTH = 6
+
+# Items measured per container; larger containers are extrapolated from them
+SIZEOF_SAMPLE_ITEMS = 32
+
+
+def key_namespace(key: str) -> str:
+    """Get the namespace of a cache key, the part before the first ':'."""
+    return key.split(':', 1)[0]
+
+
+def approximate_sizeof(value: Any, depth: int = SIZEOF_MAX_DEPTH) -> int:
+    """Approximate the memory held by a value and the objects it contains.
+    
+    Containers are followed a few levels deep and only a sample of their
+    items is measured, so the cost is bounded however large the value is.
+    Objects shared with other values are counted again, which overestimates.
+    
+    Args:
+        value: Value to measure
+        depth: Remaining container levels to follow
+        
+    Returns:
+        Approximate size in bytes
+    """
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    
+    if isinstance(value, dict):
+        items = list(islice(value.items(), SIZEOF_SAMPLE_ITEMS))
+        measured = sum(approximate_sizeof(k, depth - 1) + approximate_sizeof(v, depth - 1) for k, v in items)
+        count = len(value)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(islice(value, SIZEOF_SAMPLE_ITEMS))
+        measured = sum(approximate_sizeof(item, depth - 1) for item in items)
+        count = len(value)
+    elif hasattr(value, '__dict__'):
+        return size + approximate_sizeof(vars(value), depth - 1)
+    else:
+        return size
+    
+    if not items:
+        return size
+    return size + measured * count // len(items)
+
+
+def estimate_size(key: str, value: Any) -> int:
+    """Estimate the memory held by a cache entry.
+    
+    Args:
+        key: Cache key
+        value: Cached value
+        
+    Returns:
+        Approximate size in bytes
+    """
+    return sys.getsizeof(key) + approximate_sizeof(value)
+
+
+def _namespace_summary(counters: Dict[str, int]) -> Dict[str, Any]:
+    """Format one namespace's counters for stats output."""
+    lookups = counters['hits'] + counters['misses']
+    return {
+        **counters,
+        'hit_ratio': round(counters['hits'] / lookups, 4) if lookups else 0.0
+    }
+
+
+def _new_namespace_counters() -> Dict[str, int]:
+    """Zeroed counters for a cache key namespace."""
+    return {'entries': 0, 'size_bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+class CacheBackend(ABC):
+    """Interface for cache storage backends."""
+    
+    # Whether all worker processes read and write the same entries
+    shared = False
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache, or None if missing or expired."""
+    
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        """Set value in cache with TTL in seconds."""
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete key from cache."""
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Clear all cache entries."""
+    
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Remove all expired entries and return how many were removed."""
+    
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Get backend counters for monitoring."""
+    
+    def configure(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """Change the backend bounds.
+        
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum estimated size of all entries in bytes
+        """
+    
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class LRUCache(CacheBackend):
+    """Bounded, thread-safe in-memory cache with LRU eviction and per-key TTL.
+    
+    Entries live in an OrderedDict kept in recency order, so lookups, inserts
+    and evictions are all O(1). The cache is bounded by both entry count and
+    an estimated byte budget; expired entries are dropped when read or when
+    they reach the LRU end. Sizes and per-namespace counters are kept up to
+    date on every change, so stats() never walks the entries.
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum estimated size of all entries in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, size)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._namespaces: Dict[str, Dict[str, int]] = {}
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        with self._lock:
+            namespace = self._namespace(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                namespace['misses'] += 1
+                return None
+            
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                namespace['misses'] += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            namespace['hits'] += 1
+            return value
+    
+    def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        """Set value in cache with TTL."""
+        size = estimate_size(key, value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            
+            self._entries[key] = (value, time.monotonic() + ttl, size)
+            self.size_bytes += size
+            namespace = self._namespace(key)
+            namespace['entries'] += 1
+            namespace['size_bytes'] += size
+            self._evict()
+    
+    def delete(self, key: str) -> None:
+        """Delete key from cache."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+    
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            for namespace in self._namespaces.values():
+                namespace['entries'] = namespace['size_bytes'] = 0
+    
+    def purge_expired(self) -> int:
+        """Remove all expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired_keys = [key for key, (_, expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired_keys:
+                self._remove(key)
+            self.expirations += len(expired_keys)
+            return len(expired_keys)
+    
+    def configure(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """Change the cache bounds, evicting entries if needed.
+        
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum estimated size of all entries in bytes
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+        
+        Returns:
+            Dictionary with size, bounds and hit/miss/eviction counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'memory',
+                'total_entries': len(self._entries),
+                'cache_size_bytes': self.size_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'namespaces': {
+                    name: _namespace_summary(counters) for name, counters in self._namespaces.items()
+                }
+            }
+    
+    def __len__(self) -> int:
+        """Number of entries, including expired ones not yet purged."""
+        return len(self._entries)
+    
+    def _namespace(self, key: str) -> Dict[str, int]:
+        """Get the counters for a key's namespace. Caller holds the lock."""
+        name = key_namespace(key)
+        counters = self._namespaces.get(name)
+        if counters is None:
+            counters = self._namespaces[name] = _new_namespace_counters()
+        return counters
+    
+    def _release(self, key: str, size: int) -> Dict[str, int]:
+        """Release a removed entry's size. Caller holds the lock."""
+        self.size_bytes -= size
+        namespace = self._namespace(key)
+        namespace['entries'] -= 1
+        namespace['size_bytes'] -= size
+        return namespace
+    
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its size. Caller holds the lock."""
+        _, _, size = self._entries.pop(key)
+        self._release(key, size)
+    
+    def _evict(self) -> None:
+        """Evict least recently used entries until within bounds. Caller holds the lock."""
+        while self._entries and (len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes):
+            key, (_, _, size) = self._entries.popitem(last=False)
+            self._release(key, size)['evictions'] += 1
+            self.evictions += 1
+
+
+class SQLiteCache(CacheBackend):
+    """Cache stored in a SQLite database file shared by all worker processes.
+    
+    Every worker reads and writes the same WAL-mode database, so a delete or
+    clear in one worker is visible to the others on their next read. Values
+    are pickled; expiry uses wall-clock time so it is consistent across
+    processes. Bounds are enforced every SQLITE_EVICTION_INTERVAL sets by
+    dropping the entries closest to expiry.
+    """
+    
+    shared = True
+    
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize cache.
+        
+        Args:
+            path: Path of the shared database file
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total size of stored values in bytes
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sets_since_eviction = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._namespaces: Dict[str, Dict[str, int]] = {}
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at)")
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening a new one after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    def _count(self, name: str, amount: int = 1, key: Optional[str] = None) -> None:
+        """Increment a per-process counter, and the key's namespace counter if given."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+            if key is not None:
+                namespace = self._namespaces.setdefault(key_namespace(key), _new_namespace_counters())
+                namespace[name] += amount
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        try:
+            row = self._connection().execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading cache key {key}: {e}")
+            self._count('misses', key=key)
+            return None
+        
+        if row is None:
+            self._count('misses', key=key)
+            return None
+        
+        value, expires_at = row
+        if expires_at <= time.time():
+            self._count('expirations')
+            self._count('misses', key=key)
+            return None
+        
+        try:
+            result = pickle.loads(value)
+        except Exception as e:
+            logger.error(f"Error decoding cache key {key}: {e}")
+            self._count('misses', key=key)
+            return None
+        
+        self._count('hits', key=key)
+        return result
+    
+    def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        """Set value in cache with TTL."""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.error(f"Error encoding cache key {key}: {e}")
+            return
+        
+        size = len(key) + len(payload)
+        if size > self.max_bytes:
+            return
+        
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, size) VALUES (?, ?, ?, ?)",
+                (key, payload, time.time() + ttl, size)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error writing cache key {key}: {e}")
+            return
+        
+        with self._lock:
+            self._sets_since_eviction += 1
+            due = self._sets_since_eviction >= SQLITE_EVICTION_INTERVAL
+            if due:
+                self._sets_since_eviction = 0
+        if due:
+            self._evict()
+    
+    def delete(self, key: str) -> None:
+        """Delete key from cache."""
+        try:
+            self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting cache key {key}: {e}")
+    
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        try:
+            self._connection().execute("DELETE FROM cache_entries")
+        except sqlite3.Error as e:
+            logger.error(f"Error clearing cache: {e}")
+    
+    def purge_expired(self) -> int:
+        """Remove all expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        try:
+            removed = self._connection().execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error purging expired cache entries: {e}")
+            return 0
+        self._count('expirations', removed)
+        return removed
+    
+    def configure(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """Change the cache bounds, evicting entries if needed."""
+        if max_entries is not None:
+            self.max_entries = max_entries
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self._evict()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+        
+        Entry counts and sizes cover all workers and are read with one
+        aggregate query over the bounded table; hit, miss and eviction
+        counters are for this process.
+        
+        Returns:
+            Dictionary with size, bounds and hit/miss/eviction counters
+        """
+        try:
+            rows = self._connection().execute(
+                "SELECT CASE WHEN instr(key, ':') > 0 THEN substr(key, 1, instr(key, ':') - 1) ELSE key END, "
+                "COUNT(*), SUM(size) FROM cache_entries GROUP BY 1"
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading cache stats: {e}")
+            rows = []
+        
+        with self._lock:
+            namespaces = {name: dict(counters) for name, counters in self._namespaces.items()}
+        for name, count, size in rows:
+            namespace = namespaces.setdefault(name, _new_namespace_counters())
+            namespace['entries'] = count
+            namespace['size_bytes'] = size
+        entries = sum(count for _, count, _ in rows)
+        size = sum(size for _, _, size in rows)
+        
+        lookups = self.hits + self.misses
+        return {
+            'backend': 'sqlite',
+            'total_entries': entries,
+            'cache_size_bytes': size,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'namespaces': {name: _namespace_summary(counters) for name, counters in namespaces.items()}
+        }
+    
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    def _evict(self) -> None:
+        """Drop expired entries, then the entries closest to expiry until within bounds."""
+        self.purge_expired()
+        try:
+            conn = self._connection()
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()
+            excess = entries - self.max_entries
+            if excess > 0:
+                keys = [row[0] for row in conn.execute(
+                    "SELECT key FROM cache_entries ORDER BY expires_at LIMIT ?", (excess,)
+                )]
+                conn.executemany("DELETE FROM cache_entries WHERE key = ?", [(key,) for key in keys])
+                for key in keys:
+                    self._count('evictions', key=key)
+            while size > self.max_bytes:
+                row = conn.execute(
+                    "SELECT key, size FROM cache_entries ORDER BY expires_at LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (row[0],))
+                size -= row[1]
+                self._count('evictions', key=row[0])
+        except sqlite3.Error as e:
+            logger.error(f"Error evicting cache entries: {e}")
+
+
+def create_cache_backend(url: str, max_entries: int = DEFAULT_MAX_ENTRIES,
+                         max_bytes: int = DEFAULT_MAX_BYTES) -> CacheBackend:
+    """Create a cache backend from a URL.
+    
+    Args:
+        url: 'memory://' for a per-process LRU cache, or 'sqlite:///path/to/file'
+            for a cache shared by all workers on the host
+        max_entries: Maximum number of entries
+        max_bytes: Maximum size of all entries in bytes
+        
+    Returns:
+        Configured cache backend
+        
+    Raises:
+        ValueError: If the URL scheme is not supported
+    """
+    if not url or url.startswith('memory://'):
+        return LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+    if url.startswith('sqlite:///'):
+        return SQLiteCache(url[len('sqlite:///'):], max_entries=max_entries, max_bytes=max_bytes)
+    raise ValueError(f"Unsupported cache backend URL: {url}")
@@ -2,74 +2,95 @@
 
 import json
 import hashlib
+import logging
+import math
+import random
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Optional, Dict, Callable
+from typing import Any, Optional, Dict, Callable, Iterable, Iterator
 from functools import wraps
-from flask import current_app, g
+from flask import Flask, current_app, g, has_app_context
 import time
 
+from .cache_backends import (
+    CacheBackend, LRUCache, create_cache_backend, key_namespace, DEFAULT_MAX_ENTRIES, DEFAULT_MAX_BYTES
+)
 
-class SimpleCache:
-    """Simple in-memory cache with TTL support."""
+logger = logging.getLogger(__name__)
+
+
+class Cache:
+    """Application cache delegating to a swappable backend.
     
-    def __init__(self):
-        """Initialize cache."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._last_cleanup = time.time()
+    Modules hold on to the global app_cache; init_cache can then switch the
+    storage (for example to a store shared by all workers) without callers
+    noticing.
+    """
     
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
-        self._cleanup_if_needed()
+    def __init__(self, backend: CacheBackend):
+        """Initialize cache.
         
-        if key in self._cache:
-            entry = self._cache[key]
-            if entry['expires_at'] > time.time():
-                entry['last_accessed'] = time.time()
-                return entry['value']
-            else:
-                del self._cache[key]
+        Args:
+            backend: Storage backend
+        """
+        self.backend = backend
+    
+    @property
+    def shared(self) -> bool:
+        """Whether invalidations reach every worker process."""
+        return self.backend.shared
+    
+    def use(self, backend: CacheBackend) -> None:
+        """Switch to a different storage backend.
         
-        return None
+        Args:
+            backend: New storage backend
+        """
+        old_backend, self.backend = self.backend, backend
+        if old_backend is not backend:
+            old_backend.close()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        return self.backend.get(key)
     
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
         """Set value in cache with TTL."""
-        self._cleanup_if_needed()
-        
-        self._cache[key] = {
-            'value': value,
-            'expires_at': time.time() + ttl,
-            'last_accessed': time.time()
-        }
+        self.backend.set(key, value, ttl)
     
     def delete(self, key: str) -> None:
         """Delete key from cache."""
-        self._cache.pop(key, None)
+        self.backend.delete(key)
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
+        self.backend.clear()
     
-    def _cleanup_if_needed(self) -> None:
-        """Clean up expired entries periodically."""
-        current_time = time.time()
-        
-        # Only cleanup every 5 minutes
-        if current_time - self._last_cleanup < 300:
-            return
-        
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry['expires_at'] < current_time
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
-        
-        self._last_cleanup = current_time
+    def purge_expired(self) -> int:
+        """Remove expired entries."""
+        return self.backend.purge_expired()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        return self.backend.stats()
 
 
 # Global cache instance
-app_cache = SimpleCache()
+app_cache = Cache(LRUCache())
+
+
+def init_cache(app: Flask) -> None:
+    """Configure the global cache backend from application settings.
+    
+    Args:
+        app: Flask application instance
+    """
+    app_cache.use(create_cache_backend(
+        app.config.get('CACHE_URL', 'memory://'),
+        max_entries=app.config.get('CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES),
+        max_bytes=app.config.get('CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)
+    ))
 
 
 def cache_key(*args, **kwargs) -> str:
@@ -78,33 +99,314 @@ def cache_key(*args, **kwargs) -> str:
     return hashlib.md5(key_data.encode()).hexdigest()
 
 
-def cached(ttl: int = 300, key_prefix: str = ""):
-    """Decorator for caching function results."""
+class KeyLocks:
+    """Per-key locks used to let a single thread recompute a cache entry."""
+    
+    def __init__(self):
+        """Initialize with no locks."""
+        self._locks: Dict[str, list] = {}
+        self._guard = threading.Lock()
+    
+    @contextmanager
+    def hold(self, key: str, blocking: bool = True) -> Iterator[bool]:
+        """Acquire the lock for a key.
+        
+        Args:
+            key: Cache key
+            blocking: Wait for the lock if another thread holds it
+            
+        Yields:
+            True if the lock was acquired
+        """
+        with self._guard:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        acquired = entry[0].acquire(blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                entry[0].release()
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+    
+    def is_held(self, key: str) -> bool:
+        """Check if some thread holds or waits for the lock of a key."""
+        with self._guard:
+            return key in self._locks
+
+
+# Locks coalescing recomputation of the same key within this process
+_key_locks = KeyLocks()
+
+# Seconds a tag generation is kept; it is reissued from the clock if it is lost
+TAG_GENERATION_TTL = 30 * 86400
+
+
+def user_tag(user_id: int) -> str:
+    """Tag for entries derived from one user's data."""
+    return f"user:{user_id}"
+
+
+def mode_tag(game_mode: str) -> str:
+    """Tag for entries aggregated over a whole game mode."""
+    return f"mode:{game_mode}"
+
+
+def leaderboard_tag(game_mode: str) -> str:
+    """Tag for a game mode's leaderboards."""
+    return f"leaderboard:{game_mode}"
+
+
+def get_tag_generation(tag: str) -> int:
+    """Get the current generation of a tag, issuing one if it has none.
+    
+    New generations start from the clock rather than zero, so a counter that
+    was evicted can never come back at a value older entries were stored under.
+    
+    Args:
+        tag: Tag name
+        
+    Returns:
+        Current generation
+    """
+    generation = app_cache.get(f"tag:{tag}")
+    if generation is None:
+        generation = time.time_ns()
+        app_cache.set(f"tag:{tag}", generation, TAG_GENERATION_TTL)
+    return generation
+
+
+def invalidate_tags(*tags: str) -> None:
+    """Invalidate every entry carrying any of the tags.
+    
+    Each tag's generation is bumped, which changes the key of every entry
+    tagged with it; the old entries are never read again and age out of the
+    backend. The cost is one counter write per tag, however many entries
+    carry it.
+    
+    Args:
+        tags: Tag names
+    """
+    for tag in tags:
+        generation = app_cache.get(f"tag:{tag}")
+        app_cache.set(f"tag:{tag}", generation + 1 if generation is not None else time.time_ns(), TAG_GENERATION_TTL)
+
+
+def tagged_key(key: str, tags: Iterable[str] = ()) -> str:
+    """Fold the current generations of an entry's tags into its key.
+    
+    Args:
+        key: Cache key
+        tags: Tags the entry carries
+        
+    Returns:
+        Key that changes whenever one of the tags is invalidated
+    """
+    generations = [str(get_tag_generation(tag)) for tag in tags]
+    if not generations:
+        return key
+    return f"{key}@{'.'.join(generations)}"
+
+
+# Stampede protection counters
+stampede_stats = {'recomputes': 0, 'coalesced': 0, 'early_refreshes': 0, 'stale_served': 0}
+
+# Read-through counters per key namespace: {namespace: {'hits', 'computes', 'compute_seconds'}}
+read_through_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    """Increment a stampede protection counter."""
+    with _stats_lock:
+        stampede_stats[name] += 1
+
+
+def _record_read(key: str, computed: bool, seconds: float = 0.0) -> None:
+    """Record a read-through lookup for the key's namespace."""
+    namespace = key_namespace(key)
+    with _stats_lock:
+        counters = read_through_stats.setdefault(namespace, {'hits': 0, 'computes': 0, 'compute_seconds': 0.0})
+        if computed:
+            counters['computes'] += 1
+            counters['compute_seconds'] += seconds
+        else:
+            counters['hits'] += 1
+
+
+def get_read_through_stats() -> Dict[str, Dict[str, Any]]:
+    """Summarise how much work read-through caching has saved.
+    
+    Every hit is a computation (typically a database query) that did not
+    run; the time saved is estimated from the average compute time.
+    
+    Returns:
+        Dictionary of per-namespace hits, computes, hit ratio and estimated seconds saved
+    """
+    with _stats_lock:
+        summary = {}
+        for namespace, counters in read_through_stats.items():
+            hits, computes = counters['hits'], counters['computes']
+            average = counters['compute_seconds'] / computes if computes else 0.0
+            summary[namespace] = {
+                'hits': hits,
+                'computes': computes,
+                'hit_ratio': round(hits / (hits + computes), 4) if hits + computes else 0.0,
+                'avg_compute_ms': round(average * 1000, 3),
+                'estimated_seconds_saved': round(hits * average, 3)
+            }
+        return summary
+
+
+def _should_refresh_early(expires_at: float, delta: float, beta: float, now: float) -> bool:
+    """Decide whether to recompute an entry before it expires (XFetch).
+    
+    The chance rises as expiry approaches and is higher for entries that
+    were slow to compute, spreading recomputation out before the deadline.
+    
+    Args:
+        expires_at: Wall-clock time the entry expires
+        delta: Seconds the entry took to compute
+        beta: Eagerness; 0 disables early refresh
+        now: Current wall-clock time
+        
+    Returns:
+        True if the caller should recompute now
+    """
+    if beta <= 0 or delta <= 0:
+        return False
+    return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+def _compute_and_store(key: str, compute: Callable[[], Any], ttl: int, stale_ttl: int) -> Any:
+    """Compute a value and store it with its expiry and compute time."""
+    started = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - started
+    app_cache.set(key, (value, time.time() + ttl, delta), ttl + stale_ttl)
+    _count('recomputes')
+    _record_read(key, computed=True, seconds=delta)
+    return value
+
+
+def _refresh_in_background(key: str, compute: Callable[[], Any], ttl: int, stale_ttl: int) -> None:
+    """Recompute an entry in a background thread unless another thread already is."""
+    app = current_app._get_current_object() if has_app_context() else None
+    
+    def refresh():
+        with _key_locks.hold(key, blocking=False) as acquired:
+            if not acquired:
+                return
+            try:
+                if app is not None:
+                    with app.app_context():
+                        _compute_and_store(key, compute, ttl, stale_ttl)
+                else:
+                    _compute_and_store(key, compute, ttl, stale_ttl)
+            except Exception as e:
+                logger.error(f"Error refreshing cache key {key}: {e}")
+    
+    threading.Thread(target=refresh, name=f"cache-refresh:{key}", daemon=True).start()
+
+
+def get_or_compute(key: str, compute: Callable[[], Any], ttl: int = 300, stale_ttl: int = 0,
+                   beta: float = 1.0, tags: Iterable[str] = ()) -> Any:
+    """Read-through cache lookup with stampede protection.
+    
+    Only one thread per process recomputes a missing entry; the others wait
+    for it and reuse its result. Entries may be refreshed probabilistically
+    shortly before they expire, and with stale_ttl an expired entry is served
+    for that long while a background thread recomputes it.
+    
+    Args:
+        key: Cache key
+        compute: Function producing the value on a miss
+        ttl: Seconds the value is fresh
+        stale_ttl: Seconds an expired value may still be served while it is refreshed
+        beta: Early refresh eagerness (0 disables it)
+        tags: Tags the entry carries, see invalidate_tags
+        
+    Returns:
+        Cached or freshly computed value
+    """
+    key = tagged_key(key, tags)
+    envelope = app_cache.get(key)
+    now = time.time()
+    
+    if envelope is not None:
+        value, expires_at, delta = envelope
+        if now < expires_at:
+            if not _should_refresh_early(expires_at, delta, beta, now):
+                _record_read(key, computed=False)
+                return value
+            # Refresh early if nobody else is; otherwise the current value is still good
+            with _key_locks.hold(key, blocking=False) as acquired:
+                if not acquired:
+                    _record_read(key, computed=False)
+                    return value
+                _count('early_refreshes')
+                return _compute_and_store(key, compute, ttl, stale_ttl)
+        
+        if now < expires_at + stale_ttl:
+            if not _key_locks.is_held(key):
+                _refresh_in_background(key, compute, ttl, stale_ttl)
+            _count('stale_served')
+            _record_read(key, computed=False)
+            return value
+    
+    with _key_locks.hold(key):
+        # Another thread may have filled the entry while this one waited
+        envelope = app_cache.get(key)
+        if envelope is not None and time.time() < envelope[1]:
+            _count('coalesced')
+            _record_read(key, computed=False)
+            return envelope[0]
+        return _compute_and_store(key, compute, ttl, stale_ttl)
+
+
+def cached(ttl: int = 300, key_prefix: str = "", stale_ttl: int = 0, beta: float = 1.0,
+           tags: Iterable[str] = ()):
+    """Decorator for caching function results.
+    
+    Args:
+        ttl: Seconds a result is fresh
+        key_prefix: Prefix for the generated cache keys
+        stale_ttl: Seconds an expired result may be served while it is refreshed in the background
+        beta: Early refresh eagerness (0 disables it)
+        tags: Tags every result carries, see invalidate_tags
+    """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key
             func_key = f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
             
-            # Try to get from cache
-            cached_result = app_cache.get(func_key)
-            if cached_result is not None:
-                return cached_result
-            
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            app_cache.set(func_key, result, ttl)
-            
-            return result
+            return get_or_compute(func_key, lambda: func(*args, **kwargs), ttl, stale_ttl, beta, tags)
         
         return wrapper
     return decorator
 
 
+def get_cached_value(key: str, tags: Iterable[str] = ()) -> Optional[Any]:
+    """Get a value stored by set_cached_value or get_or_compute, ignoring expired values."""
+    envelope = app_cache.get(tagged_key(key, tags))
+    if envelope is None or time.time() >= envelope[1]:
+        return None
+    return envelope[0]
+
+
+def set_cached_value(key: str, value: Any, ttl: int = 300, tags: Iterable[str] = ()) -> None:
+    """Store a value in the format shared with get_or_compute."""
+    app_cache.set(tagged_key(key, tags), (value, time.time() + ttl, 0.0), ttl)
+
+
 def cache_daily_puzzle(game_mode: str, date: str):
     """Cache daily puzzle for better performance."""
     key = f"daily_puzzle:{game_mode}:{date}"
-    return app_cache.get(key)
+    return get_cached_value(key)
 
 
 def set_daily_puzzle_cache(game_mode: str, date: str, puzzle_data: Any):
@@ -116,7 +418,7 @@ def set_daily_puzzle_cache(game_mode: str, date: str, puzzle_data: Any):
     end_of_day = datetime(now.year, now.month, now.day, 23, 59, 59)
     ttl = int((end_of_day - now).total_seconds())
     
-    app_cache.set(key, puzzle_data, ttl)
+    set_cached_value(key, puzzle_data, ttl)
 
 
 def cache_user_stats(user_id: int, game_mode: str = None):
@@ -126,7 +428,7 @@ def cache_user_stats(user_id: int, game_mode: str = None):
     else:
         key = f"user_stats:{user_id}:all"
     
-    return app_cache.get(key)
+    return get_cached_value(key, tags=(user_tag(user_id),))
 
 
 def set_user_stats_cache(user_id: int, stats_data: Any, game_mode: str = None, ttl: int = 600):
@@ -136,39 +438,36 @@ def set_user_stats_cache(user_id: int, stats_data: Any, game_mode: str = None, t
     else:
         key = f"user_stats:{user_id}:all"
     
-    app_cache.set(key, stats_data, ttl)
+    set_cached_value(key, stats_data, ttl, tags=(user_tag(user_id),))
 
 
 def invalidate_user_stats_cache(user_id: int):
     """Invalidate user statistics cache after game completion."""
-    # Clear both specific mode and all stats caches
-    app_cache.delete(f"user_stats:{user_id}:classic")
-    app_cache.delete(f"user_stats:{user_id}:disney")
-    app_cache.delete(f"user_stats:{user_id}:all")
+    invalidate_tags(user_tag(user_id))
 
 
 def cache_leaderboard(game_mode: str, metric: str, limit: int = 10):
     """Cache leaderboard data."""
     key = f"leaderboard:{game_mode}:{metric}:{limit}"
-    return app_cache.get(key)
+    return get_cached_value(key, tags=(mode_tag(game_mode), leaderboard_tag(game_mode)))
 
 
 def set_leaderboard_cache(game_mode: str, metric: str, limit: int, leaderboard_data: Any, ttl: int = 300):
     """Set leaderboard cache."""
     key = f"leaderboard:{game_mode}:{metric}:{limit}"
-    app_cache.set(key, leaderboard_data, ttl)
+    set_cached_value(key, leaderboard_data, ttl, tags=(mode_tag(game_mode), leaderboard_tag(game_mode)))
 
 
 def cache_word_validation(word: str, game_mode: str):
     """Cache word validation results."""
     key = f"word_valid:{game_mode}:{word.upper()}"
-    return app_cache.get(key)
+    return get_cached_value(key)
 
 
 def set_word_validation_cache(word: str, game_mode: str, is_valid: bool, ttl: int = 86400):
     """Set word validation cache (cache for 24 hours)."""
     key = f"word_valid:{game_mode}:{word.upper()}"
-    app_cache.set(key, is_valid, ttl)
+    set_cached_value(key, is_valid, ttl)
 
 
 class CacheManager:
@@ -188,13 +487,13 @@ class CacheManager:
     @staticmethod
     def clear_expired():
         """Clear expired cache entries."""
-        app_cache._cleanup_if_needed()
+        return app_cache.purge_expired()
     
     @staticmethod
     def get_cache_stats():
         """Get cache statistics for monitoring."""
-        return {
-            'total_entries': len(app_cache._cache),
-            'last_cleanup': app_cache._last_cleanup,
-            'cache_size_bytes': len(str(app_cache._cache))
-        }
\ No newline at end of file
+        stats = app_cache.stats()
+        with _stats_lock:
+            stats['stampede'] = dict(stampede_stats)
+        stats['read_through'] = get_read_through_stats()
+        return stats
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import json
+from typing import Tuple
+
+# Cursor directions: towards older rows (next page) or newer rows (previous page)
+NEXT = 'n'
+PREV = 'p'
+
+
+def encode_cursor(direction: str, row_id: int) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor.
+
+    Args:
+        direction: NEXT to page past the row, PREV to page before it
+        row_id: ID of the boundary row
+
+    Returns:
+        Base64 cursor string
+    """
+    payload = json.dumps([direction, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Base64 cursor string
+
+    Returns:
+        Tuple of (direction, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        direction, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if direction not in (NEXT, PREV) or not isinstance(row_id, int) or isinstance(row_id, bool):
+            raise ValueError
+        return direction, row_id
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
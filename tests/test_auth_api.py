@@ -26,6 +26,21 @@ class TestAuthAPI:
         assert user_data['email'] == sample_user_data['email']
         assert 'password_hash' not in user_data  # Should not expose password
     
+    def test_register_does_not_reload_user(self, app, client, sample_user_data):
+        """Test the response is built from the inserted row without reading it back."""
+        statements = []
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+        with app.app_context():
+            db.event.listen(db.engine, 'before_cursor_execute', record)
+        
+        response = client.post('/api/auth/register', json=sample_user_data)
+        with app.app_context():
+            db.event.remove(db.engine, 'before_cursor_execute', record)
+        
+        assert response.status_code == 201
+        assert statements[-1].lstrip().startswith('INSERT INTO users')
+    
     def test_register_missing_fields(self, client):
         """Test registration with missing fields."""
         incomplete_data = [
@@ -0,0 +1,377 @@
+"""Tests for caching utilities."""
+
+import threading
+import time
+
+import pytest
+from src.app.utils import cache_backends
+from src.app.utils.cache_backends import LRUCache, SQLiteCache, approximate_sizeof, create_cache_backend
+from src.app.utils import caching
+from src.app.utils.caching import Cache, app_cache, cached, get_or_compute, invalidate_tags
+
+
+class TestLRUCache:
+    """Test LRUCache functionality."""
+
+    def test_get_and_set(self):
+        """Test values round-trip and misses return None."""
+        cache = LRUCache()
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test the entry bound evicts the least recently used key."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()['evictions'] == 1
+
+    def test_byte_budget(self):
+        """Test the byte budget bounds the cache and rejects oversized values."""
+        cache = LRUCache(max_bytes=1000)
+        for i in range(20):
+            cache.set(f"key{i}", "x" * 100)
+
+        assert cache.size_bytes <= 1000
+        assert len(cache) < 20
+        cache.set("big", "x" * 2000)
+        assert cache.get("big") is None
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test entries expire after their TTL."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_backends.time, 'monotonic', lambda: now[0])
+        cache = LRUCache()
+        cache.set("short", 1, ttl=10)
+        cache.set("long", 2, ttl=100)
+
+        now[0] += 50
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        assert cache.stats()['expirations'] == 1
+
+    def test_size_tracking(self):
+        """Test tracked size returns to zero as entries are removed."""
+        cache = LRUCache()
+        cache.set("a", "value")
+        cache.set("a", "other value")
+        cache.set("b", [1, 2, 3])
+        cache.delete("a")
+        cache.delete("b")
+
+        assert cache.size_bytes == 0
+        assert len(cache) == 0
+
+    def test_thread_safety(self):
+        """Test concurrent access keeps the cache consistent."""
+        cache = LRUCache(max_entries=50)
+
+        def worker(offset):
+            for i in range(2000):
+                cache.set(f"k{(i + offset) % 100}", i)
+                cache.get(f"k{i % 100}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats['total_entries'] <= 50
+        assert stats['hits'] + stats['misses'] == 16000
+        assert cache.size_bytes == sum(size for _, _, size in cache._entries.values())
+
+    def test_namespace_stats(self):
+        """Test entries, sizes, hits and evictions are tracked per key namespace."""
+        cache = LRUCache(max_entries=3)
+        cache.set("user_stats:1:all", {"games_played": 3})
+        cache.set("leaderboard:classic:total_wins:50", [{"rank": 1}])
+        cache.get("user_stats:1:all")
+        cache.get("user_stats:2:all")
+        cache.set("global_stats:classic", {})
+        cache.set("global_stats:disney", {})
+
+        namespaces = cache.stats()['namespaces']
+        assert namespaces['leaderboard']['entries'] == 0
+        assert namespaces['leaderboard']['evictions'] == 1
+        assert namespaces['user_stats']['entries'] == 1
+        assert namespaces['user_stats']['hits'] == 1
+        assert namespaces['user_stats']['hit_ratio'] == 0.5
+        assert namespaces['global_stats']['entries'] == 2
+        assert sum(n['size_bytes'] for n in namespaces.values()) == cache.size_bytes
+
+    def test_approximate_sizeof(self):
+        """Test nested values are measured and large containers are sampled."""
+        flat = {"1": 0, "2": 0}
+        nested = {"guess_distribution": {str(i): i for i in range(1, 7)}, "username": "x" * 500}
+
+        assert approximate_sizeof(nested) > 500 + approximate_sizeof(flat)
+        rows = [{"username": "player", "games_won": i} for i in range(10000)]
+        estimate = approximate_sizeof(rows)
+        exact = approximate_sizeof(rows, depth=0) + sum(approximate_sizeof(row) for row in rows)
+        assert abs(estimate - exact) < exact * 0.05
+
+
+class TestSQLiteCache:
+    """Test the SQLite cache shared between workers."""
+
+    def test_invalidation_visible_to_other_workers(self, tmp_path):
+        """Test writes and deletes through one handle are seen by another."""
+        path = str(tmp_path / "cache.db")
+        worker_a = SQLiteCache(path)
+        worker_b = SQLiteCache(path)
+
+        worker_a.set("user_stats:1:all", {"games_played": 3})
+        assert worker_b.get("user_stats:1:all") == {"games_played": 3}
+
+        worker_b.delete("user_stats:1:all")
+        assert worker_a.get("user_stats:1:all") is None
+
+    def test_ttl_expiry(self, tmp_path, monkeypatch):
+        """Test entries expire by wall-clock time."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_backends.time, 'time', lambda: now[0])
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("a", 1, ttl=10)
+
+        assert cache.get("a") == 1
+        now[0] += 11
+        assert cache.get("a") is None
+        assert cache.purge_expired() == 1
+
+    def test_entry_bound(self, tmp_path, monkeypatch):
+        """Test the entry bound is enforced periodically."""
+        monkeypatch.setattr(cache_backends, 'SQLITE_EVICTION_INTERVAL', 10)
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=5)
+        for i in range(20):
+            cache.set(f"k{i}", i, ttl=100 + i)
+
+        stats = cache.stats()
+        assert stats['total_entries'] <= 5
+        assert stats['evictions'] >= 15
+        assert cache.get("k19") == 19
+
+    def test_namespace_stats(self, tmp_path):
+        """Test per-namespace entry counts cover the shared store."""
+        path = str(tmp_path / "cache.db")
+        worker_a = SQLiteCache(path)
+        worker_b = SQLiteCache(path)
+        worker_a.set("user_stats:1:all", {"games_played": 3})
+        worker_b.set("user_stats:2:all", {"games_played": 4})
+        worker_b.set("global_stats:classic", {})
+        worker_a.get("user_stats:2:all")
+
+        namespaces = worker_a.stats()['namespaces']
+        assert namespaces['user_stats']['entries'] == 2
+        assert namespaces['user_stats']['hits'] == 1
+        assert namespaces['global_stats']['entries'] == 1
+        assert namespaces['global_stats']['hits'] == 0
+
+    def test_create_cache_backend(self, tmp_path):
+        """Test backends are selected by URL."""
+        assert isinstance(create_cache_backend("memory://"), LRUCache)
+        assert isinstance(create_cache_backend(f"sqlite:///{tmp_path}/cache.db"), SQLiteCache)
+        with pytest.raises(ValueError):
+            create_cache_backend("memcached://localhost")
+
+    def test_cache_switches_backend(self, tmp_path):
+        """Test the facade delegates to the current backend."""
+        cache = Cache(LRUCache())
+        cache.set("a", 1)
+        cache.use(SQLiteCache(str(tmp_path / "cache.db")))
+
+        assert cache.get("a") is None
+        cache.set("a", 2)
+        assert cache.get("a") == 2
+        assert cache.stats()['backend'] == 'sqlite'
+
+
+class TestCachedDecorator:
+    """Test the cached decorator."""
+
+    def test_caches_results(self):
+        """Test repeated calls reuse the cached result."""
+        calls = []
+
+        @cached(ttl=60, key_prefix="test")
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        app_cache.clear()
+        assert square(3) == 9
+        assert square(3) == 9
+        assert square(4) == 16
+        assert calls == [3, 4]
+
+    def test_caches_none_results(self):
+        """Test None results are cached rather than recomputed."""
+        calls = []
+
+        @cached(ttl=60, key_prefix="test")
+        def lookup(x):
+            calls.append(x)
+            return None
+
+        app_cache.clear()
+        assert lookup(1) is None
+        assert lookup(1) is None
+        assert calls == [1]
+
+
+class TestStampedeProtection:
+    """Test request coalescing, early refresh and stale-while-revalidate."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty cache."""
+        app_cache.clear()
+        yield
+        app_cache.clear()
+
+    def test_concurrent_misses_compute_once(self):
+        """Test concurrent callers of a missing key share one computation."""
+        calls = []
+        started = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return "leaderboard"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_compute("hot", compute, ttl=60, beta=0)))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["leaderboard"] * 10
+
+    def test_stale_while_revalidate(self, monkeypatch):
+        """Test an expired value is served while it is refreshed in the background."""
+        now = [1000.0]
+        monkeypatch.setattr(caching.time, 'time', lambda: now[0])
+        values = iter(["old", "new"])
+        refreshed = threading.Event()
+
+        def compute():
+            value = next(values)
+            if value == "new":
+                refreshed.set()
+            return value
+
+        assert get_or_compute("swr", compute, ttl=10, stale_ttl=60, beta=0) == "old"
+        now[0] += 20
+
+        assert get_or_compute("swr", compute, ttl=10, stale_ttl=60, beta=0) == "old"
+        assert refreshed.wait(2)
+        for _ in range(100):
+            if app_cache.get("swr")[0] == "new":
+                break
+            time.sleep(0.01)
+        assert get_or_compute("swr", compute, ttl=10, stale_ttl=60, beta=0) == "new"
+
+    def test_no_stale_value_past_window(self, monkeypatch):
+        """Test values older than the stale window are recomputed synchronously."""
+        now = [1000.0]
+        monkeypatch.setattr(caching.time, 'time', lambda: now[0])
+        values = iter(["old", "new"])
+
+        get_or_compute("swr", lambda: next(values), ttl=10, stale_ttl=5, beta=0)
+        now[0] += 16
+
+        assert get_or_compute("swr", lambda: next(values), ttl=10, stale_ttl=5, beta=0) == "new"
+
+    def test_early_refresh(self, monkeypatch):
+        """Test an entry near expiry is recomputed early when XFetch fires."""
+        values = iter(["first", "second"])
+        get_or_compute("early", lambda: next(values), ttl=60, beta=0)
+
+        monkeypatch.setattr(caching, '_should_refresh_early', lambda *args: True)
+        assert get_or_compute("early", lambda: next(values), ttl=60) == "second"
+
+    def test_should_refresh_early(self):
+        """Test XFetch only fires close to expiry for cheap entries."""
+        assert not caching._should_refresh_early(1060.0, 0.01, 1.0, 1000.0)
+        assert not caching._should_refresh_early(1000.5, 1.0, 0, 1000.0)
+
+    def test_read_through_stats(self, monkeypatch):
+        """Test hits and computes are counted per key namespace."""
+        monkeypatch.setattr(caching, 'read_through_stats', {})
+
+        for _ in range(3):
+            get_or_compute("user_stats:1:classic", lambda: {"games_played": 1}, ttl=60, beta=0)
+        get_or_compute("leaderboard:classic:total_wins:50", lambda: [], ttl=60, beta=0)
+
+        stats = caching.get_read_through_stats()
+        assert stats['user_stats']['hits'] == 2
+        assert stats['user_stats']['computes'] == 1
+        assert stats['user_stats']['hit_ratio'] == round(2 / 3, 4)
+        assert stats['leaderboard']['hits'] == 0
+        assert 'read_through' in caching.CacheManager.get_cache_stats()
+
+
+class TestTagInvalidation:
+    """Test generational tag invalidation."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty cache."""
+        app_cache.clear()
+        yield
+        app_cache.clear()
+
+    def lookup(self, key, tags, value):
+        """Read a tagged entry, computing the given value on a miss."""
+        return get_or_compute(key, lambda: value, ttl=60, beta=0, tags=tags)
+
+    def test_invalidates_every_tagged_entry(self):
+        """Test bumping a tag misses every entry carrying it and no others."""
+        self.lookup("user_stats:1:classic", ("user:1",), "stats-1")
+        self.lookup("leaderboard:classic:total_wins:50", ("mode:classic", "leaderboard:classic"), "board-1")
+        self.lookup("global_stats:classic", ("mode:classic",), "global-1")
+
+        invalidate_tags("mode:classic")
+
+        assert self.lookup("user_stats:1:classic", ("user:1",), "stats-2") == "stats-1"
+        assert self.lookup("leaderboard:classic:total_wins:50", ("mode:classic", "leaderboard:classic"), "board-2") == "board-2"
+        assert self.lookup("global_stats:classic", ("mode:classic",), "global-2") == "global-2"
+
+    def test_lost_generation_does_not_revive_entries(self):
+        """Test an evicted generation counter is reissued at a new value."""
+        self.lookup("user_stats:1:all", ("user:1",), "old")
+        invalidate_tags("user:1")
+        app_cache.delete("tag:user:1")
+
+        assert self.lookup("user_stats:1:all", ("user:1",), "new") == "new"
+
+    def test_invalidation_visible_to_other_workers(self, tmp_path):
+        """Test a tag bumped through a shared backend invalidates entries for every worker."""
+        path = str(tmp_path / "cache.db")
+        app_cache.use(SQLiteCache(path))
+        try:
+            self.lookup("user_stats:1:all", ("user:1",), "old")
+
+            other_worker = Cache(SQLiteCache(path))
+            other_worker.set("tag:user:1", other_worker.get("tag:user:1") + 1)
+
+            assert self.lookup("user_stats:1:all", ("user:1",), "new") == "new"
+        finally:
+            app_cache.use(LRUCache())
@@ -0,0 +1,135 @@
+"""Tests for the precomputed feedback engine."""
+
+import itertools
+
+import pytest
+from src.app.database import db
+from src.app.models import GameMode, WordList
+from src.app.services.feedback_engine import (
+    FeedbackEngine, FeedbackTable, compute_feedback_code, decode_feedback, encode_feedback,
+    table_file_path, word_list_digest
+)
+from src.app.services.guess_processing_service import GuessProcessingService
+
+
+WORDS = ["CRANE", "SPEED", "ERASE", "ABBEY", "KEBAB", "LLAMA", "EERIE", "GEESE", "ROBOT", "TOTAL"]
+
+
+class TestFeedbackEngine:
+    """Test FeedbackEngine functionality."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create a feedback engine with a small classic table."""
+        engine = FeedbackEngine()
+        engine.load(GameMode.CLASSIC, WORDS, WORDS[:6])
+        return engine
+
+    def test_encode_decode_roundtrip(self):
+        """Test every feedback pattern survives encoding."""
+        states = ["absent", "present", "correct"]
+        for feedback in itertools.product(states, repeat=5):
+            assert decode_feedback(encode_feedback(feedback)) == list(feedback)
+
+    def test_compute_feedback_code_matches_reference(self):
+        """Test the per-letter scoring matches the reference algorithm."""
+        processor = GuessProcessingService(feedback_engine=FeedbackEngine())
+        for guess, answer in itertools.product(WORDS, repeat=2):
+            expected = processor.process_guess(guess, answer)
+            assert decode_feedback(compute_feedback_code(guess, answer)) == expected
+
+    def test_table_matches_reference(self, engine):
+        """Test every table cell matches the reference algorithm."""
+        processor = GuessProcessingService(feedback_engine=FeedbackEngine())
+        for guess, answer in itertools.product(WORDS, WORDS[:6]):
+            expected = processor.process_guess(guess, answer)
+            assert engine.lookup(guess, answer, GameMode.CLASSIC) == expected
+
+    def test_lookup_unknown_words(self, engine):
+        """Test lookups outside the table return None."""
+        assert engine.lookup("ZZZZZ", "CRANE", GameMode.CLASSIC) is None
+        assert engine.lookup("CRANE", "ROBOT", GameMode.CLASSIC) is None
+        assert engine.lookup("CRANE", "CRANE", GameMode.DISNEY) is None
+
+    def test_table_size_mismatch(self):
+        """Test tables reject code matrices of the wrong size."""
+        with pytest.raises(ValueError):
+            FeedbackTable(GameMode.CLASSIC, ["CRANE"], ["CRANE"], b"")
+
+    def test_process_guess_uses_table(self, engine):
+        """Test process_guess answers from the table when it can."""
+        table = engine.get_table(GameMode.CLASSIC)
+        row = table.guess_index["CRANE"]
+        col = table.answer_index["SPEED"]
+        codes = bytearray(table.codes)
+        codes[row * table.answer_count + col] = encode_feedback(["correct"] * 5)
+        table.codes = bytes(codes)
+
+        processor = GuessProcessingService(feedback_engine=engine)
+        assert processor.process_guess("crane", "speed", GameMode.CLASSIC) == ["correct"] * 5
+        assert processor.process_guess("crane", "speed") != ["correct"] * 5
+
+    def test_process_guess_falls_back(self, engine):
+        """Test process_guess computes feedback for words outside the table."""
+        processor = GuessProcessingService(feedback_engine=engine)
+        feedback = processor.process_guess("HELLO", "CRANE", GameMode.CLASSIC)
+        assert feedback == ["absent", "present", "absent", "absent", "absent"]
+
+    def test_load_from_repository(self, app):
+        """Test tables are built from the word_list table."""
+        with app.app_context():
+            db.session.add_all([
+                WordList(word="CRANE", game_mode=GameMode.CLASSIC, is_answer=True, frequency_rank=1),
+                WordList(word="SPEED", game_mode=GameMode.CLASSIC, is_answer=True, frequency_rank=2),
+                WordList(word="EERIE", game_mode=GameMode.CLASSIC, is_answer=False, frequency_rank=3),
+            ])
+            db.session.commit()
+
+            engine = FeedbackEngine()
+            table = engine.load_from_repository(GameMode.CLASSIC)
+
+            assert set(table.guess_index) == {"CRANE", "SPEED", "EERIE"}
+            assert set(table.answer_index) == {"CRANE", "SPEED"}
+            assert engine.load_from_repository(GameMode.DISNEY) is None
+
+
+class TestFeedbackTableFile:
+    """Test memory-mapped feedback table files."""
+
+    def test_load_mapped_builds_file(self, tmp_path):
+        """Test the table file is written once and mapped."""
+        engine = FeedbackEngine()
+        table = engine.load_mapped(GameMode.CLASSIC, WORDS, WORDS[:6], table_dir=tmp_path)
+
+        path = table_file_path(GameMode.CLASSIC, tmp_path)
+        assert path.exists()
+        assert table.is_mapped
+        assert table.digest == word_list_digest(WORDS, WORDS[:6])
+
+        reference = FeedbackTable.build(GameMode.CLASSIC, WORDS, WORDS[:6])
+        assert bytes(table.codes) == reference.codes
+
+    def test_load_mapped_reuses_file(self, tmp_path):
+        """Test an up-to-date file is mapped without rebuilding."""
+        engine = FeedbackEngine()
+        engine.load_mapped(GameMode.CLASSIC, WORDS, WORDS[:6], table_dir=tmp_path)
+        mtime = table_file_path(GameMode.CLASSIC, tmp_path).stat().st_mtime_ns
+
+        engine.load_mapped(GameMode.CLASSIC, WORDS, WORDS[:6], table_dir=tmp_path)
+        assert table_file_path(GameMode.CLASSIC, tmp_path).stat().st_mtime_ns == mtime
+
+    def test_load_mapped_rebuilds_on_word_list_change(self, tmp_path):
+        """Test a stale file is rebuilt when the word lists change."""
+        engine = FeedbackEngine()
+        engine.load_mapped(GameMode.CLASSIC, WORDS, WORDS[:6], table_dir=tmp_path)
+
+        table = engine.load_mapped(GameMode.CLASSIC, WORDS, WORDS[:7], table_dir=tmp_path)
+        assert table.digest == word_list_digest(WORDS, WORDS[:7])
+        assert "EERIE" in table.answer_index
+
+    def test_open_rejects_invalid_file(self, tmp_path):
+        """Test corrupt files are treated as missing."""
+        path = tmp_path / "feedback_classic.bin"
+        path.write_bytes(b"not a feedback table")
+        assert FeedbackTable.open(GameMode.CLASSIC, path) is None
+        assert FeedbackTable.open(GameMode.CLASSIC, tmp_path / "missing.bin") is None
@@ -0,0 +1,199 @@
+"""Tests for keyset-paginated and exported game history."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Query
+from src.app.database import db
+from src.app.models import GameMode, GameSession
+from src.app.repositories.game_repository import GameSessionRepository
+from src.app.services.game_service import GameService
+from src.app.utils.pagination import NEXT, PREV, decode_cursor, encode_cursor
+
+
+def add_sessions(user_id, count, game_mode=GameMode.CLASSIC, start=datetime(2024, 1, 1), step=timedelta(0)):
+    """Insert completed sessions, every other one won, and return their IDs."""
+    sessions = [
+        GameSession(
+            user_id=user_id, answer_word="CRANE", game_mode=game_mode, guesses=[],
+            completed=True, won=i % 2 == 0, attempts_used=3, created_at=start + step * i
+        )
+        for i in range(count)
+    ]
+    db.session.add_all(sessions)
+    db.session.commit()
+    return [session.id for session in sessions]
+
+
+class TestGameHistory:
+    """Test GameService.get_user_game_history paging."""
+
+    @pytest.fixture
+    def user_id(self, app, created_user):
+        """ID of a persisted user."""
+        return created_user.id
+
+    def test_cursor_round_trip(self):
+        """Test cursors decode to the position they were made from."""
+        cursor = encode_cursor(NEXT, 42)
+
+        assert decode_cursor(cursor) == (NEXT, 42)
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_pages_through_ties(self, app, user_id):
+        """Test paging visits every session once when timestamps tie."""
+        ids = add_sessions(user_id, 7)
+        service = GameService()
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            result = service.get_user_game_history(user_id, GameMode.CLASSIC, limit=3, cursor=cursor)
+            seen += [game['session_id'] for game in result['games']]
+            pages += 1
+            cursor = result['next_cursor']
+            if not cursor:
+                break
+
+        assert seen == sorted(ids, reverse=True)
+        assert pages == 3
+
+    def test_pages_through_server_timestamps(self, app, user_id):
+        """Test paging sessions whose created_at was set by the database."""
+        repo = GameSessionRepository()
+        ids = [repo.create_new_session(user_id, "CRANE", GameMode.CLASSIC).id for _ in range(7)]
+        db.session.commit()
+        service = GameService()
+
+        seen, cursor, pages = [], None, 0
+        while pages < 5:
+            result = service.get_user_game_history(user_id, GameMode.CLASSIC, limit=3, cursor=cursor)
+            seen += [game['session_id'] for game in result['games']]
+            pages += 1
+            cursor = result['next_cursor']
+            if not cursor:
+                break
+
+        assert seen == sorted(ids, reverse=True)
+        assert pages == 3
+
+        back = service.get_user_game_history(user_id, GameMode.CLASSIC, limit=3, cursor=encode_cursor(PREV, ids[0]))
+        assert [game['session_id'] for game in back['games']] == sorted(ids[1:4], reverse=True)
+
+    def test_previous_page(self, app, user_id):
+        """Test the previous cursor returns the page before."""
+        add_sessions(user_id, 7, step=timedelta(minutes=1))
+        service = GameService()
+
+        first = service.get_user_game_history(user_id, limit=3)
+        second = service.get_user_game_history(user_id, limit=3, cursor=first['next_cursor'])
+        back = service.get_user_game_history(user_id, limit=3, cursor=second['prev_cursor'])
+
+        assert first['prev_cursor'] is None
+        assert back['games'] == first['games']
+        assert back['prev_cursor'] is None
+        assert back['next_cursor'] is not None
+
+    def test_filters(self, app, user_id):
+        """Test mode, result and period filters."""
+        now = datetime.utcnow()
+        add_sessions(user_id, 4, start=now - timedelta(days=10), step=timedelta(days=3))
+        add_sessions(user_id, 2, GameMode.DISNEY, start=now)
+        service = GameService()
+
+        assert len(service.get_user_game_history(user_id, limit=50)['games']) == 6
+        assert len(service.get_user_game_history(user_id, GameMode.DISNEY, limit=50)['games']) == 2
+        assert len(service.get_user_game_history(user_id, GameMode.CLASSIC, limit=50, won=False)['games']) == 2
+        assert len(service.get_user_game_history(user_id, GameMode.CLASSIC, limit=50, days=5)['games']) == 2
+
+    def test_invalid_cursor(self, app, user_id):
+        """Test malformed cursors are rejected."""
+        result = GameService().get_user_game_history(user_id, cursor="bogus")
+
+        assert result == {'success': False, 'error': 'Invalid cursor'}
+
+
+class TestGameHistoryApi:
+    """Test the game history endpoints."""
+
+    def test_history_pages(self, app, client, auth_headers):
+        """Test the history endpoint returns cursors for the next page."""
+        add_sessions(1, 12)
+
+        response = client.get('/api/game/history?limit=10', headers=auth_headers)
+        data = response.get_json()['data']
+        assert response.status_code == 200
+        assert data['count'] == 10
+        assert data['prev_cursor'] is None
+
+        response = client.get(f"/api/game/history/classic?cursor={data['next_cursor']}", headers=auth_headers)
+        data = response.get_json()['data']
+        assert data['count'] == 2
+        assert data['next_cursor'] is None
+        assert data['games'][0]['target_word'] == 'CRANE'
+
+    def test_history_rejects_bad_parameters(self, client, auth_headers):
+        """Test invalid modes and cursors return 400."""
+        assert client.get('/api/game/history?mode=arcade', headers=auth_headers).status_code == 400
+        assert client.get('/api/game/history?cursor=bogus', headers=auth_headers).status_code == 400
+
+
+class TestGameHistoryExport:
+    """Test the streaming game history export."""
+
+    def test_ndjson_export(self, app, client, auth_headers):
+        """Test every game is streamed as one JSON line, oldest first."""
+        ids = add_sessions(1, 5)
+        add_sessions(1, 2, GameMode.DISNEY)
+
+        response = client.get('/api/game/history/export', headers=auth_headers)
+        lines = response.get_data(as_text=True).splitlines()
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert len(lines) == 7
+        assert [json.loads(line)['session_id'] for line in lines[:5]] == ids
+
+    def test_csv_export(self, app, client, auth_headers):
+        """Test CSV exports have a header row and one row per game."""
+        add_sessions(1, 3)
+        add_sessions(1, 2, GameMode.DISNEY)
+
+        response = client.get('/api/game/history/export?format=csv&mode=disney', headers=auth_headers)
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+
+        assert response.mimetype == 'text/csv'
+        assert 'attachment' in response.headers['Content-Disposition']
+        assert len(rows) == 2
+        assert rows[0]['game_mode'] == 'disney'
+        assert rows[0]['target_word'] == 'CRANE'
+
+    def test_read_error_ends_stream_with_error(self, app, created_user, monkeypatch):
+        """Test a database error part way through an export is raised, not swallowed."""
+        add_sessions(created_user.id, 3)
+
+        def failing_batches(query, batch_size):
+            yield from query.limit(1).all()
+            raise OperationalError("SELECT", {}, Exception("connection lost"))
+        monkeypatch.setattr(Query, 'yield_per', failing_batches)
+
+        lines = GameService().export_game_history(created_user.id, 'ndjson')
+
+        assert json.loads(next(lines))['target_word'] == 'CRANE'
+        with pytest.raises(OperationalError):
+            next(lines)
+
+    def test_empty_csv_export(self, client, auth_headers):
+        """Test a user without games gets just the header row."""
+        response = client.get('/api/game/history/export?format=csv', headers=auth_headers)
+
+        assert response.get_data(as_text=True).startswith('session_id,game_mode')
+        assert len(response.get_data(as_text=True).splitlines()) == 1
+
+    def test_rejects_unknown_format(self, client, auth_headers):
+        """Test unsupported formats return 400."""
+        assert client.get('/api/game/history/export?format=xml', headers=auth_headers).status_code == 400
@@ -0,0 +1,188 @@
+"""Tests for GameService game flow."""
+
+import pytest
+from src.app.database import db
+from src.app.models import GameMode, GameSession, UserAnswerHistory, UserStats, WordList
+from src.app.services.game_service import GameService
+from src.app.services.lexicon import lexicon
+
+
+ANSWERS = ["CRANE", "SLATE", "PLANT"]
+
+
+class TestGameService:
+    """Test GameService functionality."""
+
+    @pytest.fixture
+    def game_service(self, app):
+        """Create GameService with a seeded word list."""
+        with app.app_context():
+            for rank, word in enumerate(ANSWERS, 1):
+                db.session.add(WordList(word=word, game_mode=GameMode.CLASSIC, is_answer=True, frequency_rank=rank))
+            db.session.add(WordList(word="AAHED", game_mode=GameMode.CLASSIC, is_answer=False, frequency_rank=4))
+            db.session.commit()
+            lexicon.clear()
+            yield GameService()
+
+    @pytest.fixture
+    def user_id(self, app, created_user):
+        """ID of a persisted user."""
+        return created_user.id
+
+    def test_start_new_game_picks_answer(self, game_service, app, user_id):
+        """Test new games use an answer word from the pool."""
+        with app.app_context():
+            result = game_service.start_new_game(user_id, GameMode.CLASSIC)
+
+            assert result['success'] is True
+            assert result['session']['answer_word'] in ANSWERS
+            assert result['session']['attempts_used'] == 0
+
+    def test_start_new_game_avoids_seen_answers(self, game_service, app, user_id):
+        """Test consecutive games cycle through unseen answers."""
+        with app.app_context():
+            answers = [
+                game_service.start_new_game(user_id, GameMode.CLASSIC)['session']['answer_word']
+                for _ in ANSWERS
+            ]
+
+            assert sorted(answers) == sorted(ANSWERS)
+
+    def test_start_new_game_without_answers(self, game_service, app, user_id):
+        """Test starting a game in a mode with no answers fails cleanly."""
+        with app.app_context():
+            result = game_service.start_new_game(user_id, GameMode.DISNEY)
+
+            assert result['success'] is False
+            assert db.session.query(GameSession).count() == 0
+
+    def test_start_new_game_records_answer_history(self, game_service, app, user_id):
+        """Test the seen-bitset is persisted with the new session."""
+        with app.app_context():
+            answer = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']['answer_word']
+            db.session.expire_all()
+
+            history = db.session.query(UserAnswerHistory).filter_by(user_id=user_id).one()
+            assert history.seen_count == 1
+            assert history.has_seen(ANSWERS.index(answer))
+            assert history.lexicon_version == lexicon.get_index(GameMode.CLASSIC).version
+
+    def test_start_new_game_rereads_answer_history(self, game_service, app, user_id):
+        """Test answers marked by a concurrent game are seen despite a stale loaded copy."""
+        with app.app_context():
+            first = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']['answer_word']
+            stale = db.session.query(UserAnswerHistory).filter_by(user_id=user_id).one()
+            remaining = [word for word in ANSWERS if word != first]
+
+            # Another worker marks a second answer without this session noticing
+            second = ANSWERS.index(remaining[0])
+            db.session.execute(
+                UserAnswerHistory.__table__.update()
+                .where(UserAnswerHistory.id == stale.id)
+                .values(seen=bytes([stale.seen[0] | 1 << second]), seen_count=2)
+            )
+            db.session.commit()
+
+            result = game_service.start_new_game(user_id, GameMode.CLASSIC)
+
+            assert result['session']['answer_word'] == remaining[1]
+            db.session.expire_all()
+            assert db.session.query(UserAnswerHistory).filter_by(user_id=user_id).one().seen_count == 3
+
+    def test_start_new_game_starts_new_cycle(self, game_service, app, user_id):
+        """Test the history resets once every answer has been seen."""
+        with app.app_context():
+            for _ in ANSWERS:
+                game_service.start_new_game(user_id, GameMode.CLASSIC)
+
+            result = game_service.start_new_game(user_id, GameMode.CLASSIC)
+
+            assert result['success'] is True
+            history = db.session.query(UserAnswerHistory).filter_by(user_id=user_id).one()
+            assert history.seen_count == 1
+
+    def test_answer_history_rebuilt_when_pool_changes(self, game_service, app, user_id):
+        """Test played answers are re-mapped onto a changed answer pool."""
+        with app.app_context():
+            first = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']['answer_word']
+
+            db.session.add(WordList(word="ABOUT", game_mode=GameMode.CLASSIC, is_answer=True, frequency_rank=1))
+            db.session.commit()
+            lexicon.invalidate()
+
+            answers = {first}
+            answers.update(
+                game_service.start_new_game(user_id, GameMode.CLASSIC)['session']['answer_word']
+                for _ in range(3)
+            )
+
+            assert answers == set(ANSWERS) | {"ABOUT"}
+
+    def test_process_guess_win_commits_session_and_stats(self, game_service, app, user_id):
+        """Test a winning guess persists the session and stats together."""
+        with app.app_context():
+            session = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']
+
+            result = game_service.process_guess(user_id, {'word': session['answer_word'], 'session_id': session['id']})
+
+            assert result['success'] is True
+            assert result['guess']['is_correct'] is True
+            assert result['target_word'] == session['answer_word']
+
+            db.session.expire_all()
+            stored = db.session.get(GameSession, session['id'])
+            stats = db.session.query(UserStats).filter_by(user_id=user_id, game_mode=GameMode.CLASSIC).one()
+            assert stored.completed and stored.won and stored.attempts_used == 1
+            assert stats.games_played == 1
+            assert stats.games_won == 1
+            assert stats.guess_distribution["1"] == 1
+
+    @pytest.mark.parametrize('packed', [True, False])
+    def test_guess_storage_follows_setting(self, game_service, app, user_id, packed):
+        """Test PACK_GUESSES selects the guess storage of new sessions."""
+        app.config['PACK_GUESSES'] = packed
+        with app.app_context():
+            session = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']
+            game_service.process_guess(user_id, {'word': 'AAHED', 'session_id': session['id']})
+
+            db.session.expire_all()
+            stored = db.session.get(GameSession, session['id'])
+            assert (stored.guesses_packed is not None) is packed
+            assert stored.guesses[0]['word'] == 'AAHED'
+            assert stored.attempts_used == 1
+
+    def test_process_guess_rejects_completed_game(self, game_service, app, user_id):
+        """Test a repeated winning submission is not applied twice."""
+        with app.app_context():
+            session = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']
+            guess = {'word': session['answer_word'], 'session_id': session['id']}
+
+            game_service.process_guess(user_id, guess)
+            result = game_service.process_guess(user_id, guess)
+
+            assert result == {'success': False, 'error': 'Game is already completed'}
+            stats = db.session.query(UserStats).filter_by(user_id=user_id, game_mode=GameMode.CLASSIC).one()
+            assert stats.games_played == 1
+
+    def test_process_guess_invalid_word_releases_lock(self, game_service, app, user_id):
+        """Test a rejected guess leaves the session unchanged and unlocked."""
+        with app.app_context():
+            session = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']
+
+            result = game_service.process_guess(user_id, {'word': 'ZZZZZ', 'session_id': session['id']})
+            assert result == {'success': False, 'error': 'Word not in word list'}
+
+            result = game_service.process_guess(user_id, {'word': 'AAHED', 'session_id': session['id']})
+            assert result['success'] is True
+            assert result['session']['attempts_used'] == 1
+
+    def test_process_guess_wrong_user(self, game_service, app, user_id):
+        """Test guesses on another user's session are rejected."""
+        with app.app_context():
+            session = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']
+
+            result = game_service.process_guess(user_id + 1, {'word': 'CRANE', 'session_id': session['id']})
+
+            assert result == {'success': False, 'error': 'Invalid session'}
+            assert db.session.get(GameSession, session['id']).attempts_used == 0
+
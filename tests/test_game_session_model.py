@@ -0,0 +1,85 @@
+"""Tests for GameSession guess storage."""
+
+import pytest
+from src.app.database import db
+from src.app.models import GameMode, GameSession
+from src.app.models.game import PACKED_GUESS_SIZE, pack_guess, unpack_guesses
+
+
+FEEDBACK = ["correct", "absent", "present", "absent", "correct"]
+
+
+def new_session(packed):
+    """Build a session using packed or JSON guess storage."""
+    return GameSession(
+        user_id=1, answer_word="CRANE", game_mode=GameMode.CLASSIC, guesses=[],
+        guesses_packed=b"" if packed else None
+    )
+
+
+class TestGuessPacking:
+    """Test the compact guess encoding."""
+
+    def test_round_trip(self):
+        """Test packed guesses decode to the API dict shape."""
+        data = pack_guess("slate", FEEDBACK) + pack_guess("CRANE", ["correct"] * 5)
+
+        assert len(data) == 2 * PACKED_GUESS_SIZE
+        assert unpack_guesses(data) == [
+            {"word": "SLATE", "feedback": FEEDBACK},
+            {"word": "CRANE", "feedback": ["correct"] * 5}
+        ]
+
+    def test_rejects_unpackable_guesses(self):
+        """Test words and feedback outside the encoding are rejected."""
+        with pytest.raises(ValueError):
+            pack_guess("ÉCLAT", FEEDBACK)
+        with pytest.raises(ValueError):
+            pack_guess("SLATE", ["unknown"] * 5)
+
+    def test_add_guess_appends_packed(self):
+        """Test packed sessions append without a JSON copy."""
+        session = new_session(packed=True)
+
+        session.add_guess("slate", FEEDBACK)
+        session.add_guess("crane", ["correct"] * 5)
+
+        assert session.guesses_json == []
+        assert len(session.guesses_packed) == 2 * PACKED_GUESS_SIZE
+        assert session.guesses[0] == {"word": "SLATE", "feedback": FEEDBACK}
+        assert session.attempts_used == session.get_current_guess_count() == 2
+
+    def test_add_guess_json(self):
+        """Test sessions without packing keep JSON guesses."""
+        session = new_session(packed=False)
+
+        session.add_guess("slate", FEEDBACK)
+
+        assert session.guesses_packed is None
+        assert session.guesses_json == [{"word": "SLATE", "feedback": FEEDBACK}]
+        assert session.attempts_used == 1
+
+    def test_unpackable_word_falls_back_to_json(self):
+        """Test a word outside A-Z moves the session to JSON storage."""
+        session = new_session(packed=True)
+        session.add_guess("slate", FEEDBACK)
+
+        session.add_guess("éclat", FEEDBACK)
+
+        assert session.guesses_packed is None
+        assert [guess["word"] for guess in session.guesses] == ["SLATE", "ÉCLAT"]
+
+    def test_packed_guesses_persist(self, app, created_user):
+        """Test packed guesses survive a database round trip."""
+        session = new_session(packed=True)
+        session.user_id = created_user.id
+        db.session.add(session)
+        db.session.commit()
+
+        session.add_guess("slate", FEEDBACK)
+        db.session.commit()
+        db.session.expire_all()
+
+        loaded = db.session.get(GameSession, session.id)
+        assert loaded.guesses == [{"word": "SLATE", "feedback": FEEDBACK}]
+        assert loaded.attempts_used == 1
@@ -0,0 +1,125 @@
+"""Tests for the write-through cache of in-progress game sessions."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from src.app.database import db
+from src.app.models import GameMode, GameSession, WordList
+from src.app.services.game_service import GameService
+from src.app.services.hot_sessions import HotSession, HotSessionCache, hot_sessions
+from src.app.services.lexicon import lexicon
+
+
+ANSWERS = ["CRANE", "SLATE", "PLANT"]
+
+
+class TestHotSessions:
+    """Test guesses applied through the hot session cache."""
+
+    @pytest.fixture
+    def game_service(self, app):
+        """Create GameService with a seeded word list."""
+        for rank, word in enumerate(ANSWERS, 1):
+            db.session.add(WordList(word=word, game_mode=GameMode.CLASSIC, is_answer=True, frequency_rank=rank))
+        db.session.add(WordList(word="AAHED", game_mode=GameMode.CLASSIC, is_answer=False, frequency_rank=4))
+        db.session.commit()
+        lexicon.clear()
+        return GameService()
+
+    @pytest.fixture
+    def session(self, game_service, created_user):
+        """A new game session for the created user."""
+        return game_service.start_new_game(created_user.id, GameMode.CLASSIC)['session']
+
+    def statements(self):
+        """Record SQL statements executed on the test engine."""
+        executed = []
+        event.listen(db.engine, 'before_cursor_execute', lambda conn, cursor, statement, *args: executed.append(statement))
+        return executed
+
+    def guess(self, game_service, user_id, session, word):
+        """Submit a guess for a session."""
+        return game_service.process_guess(user_id, {'word': word, 'session_id': session['id']})
+
+    def stored(self, session_id):
+        """Reload a session from the database."""
+        db.session.expire_all()
+        return db.session.get(GameSession, session_id)
+
+    def test_new_sessions_are_cached(self, session, created_user):
+        """Test started games are cached once committed."""
+        hot = hot_sessions.get(session['id'])
+
+        assert hot.user_id == created_user.id
+        assert hot.attempts_used == 0
+        assert hot.guesses_packed == b""
+
+    def test_guess_skips_session_read(self, game_service, session, created_user):
+        """Test a cached session is updated without reading its row first."""
+        executed = self.statements()
+
+        result = self.guess(game_service, created_user.id, session, 'AAHED')
+
+        assert result['success'] is True
+        assert result['session']['attempts_used'] == 1
+        assert not [sql for sql in executed if sql.lstrip().upper().startswith('SELECT') and 'game_sessions' in sql]
+        assert self.stored(session['id']).guesses[0]['word'] == 'AAHED'
+        assert hot_sessions.get(session['id']).attempts_used == 1
+
+    def test_stale_copy_falls_back_to_locked_path(self, game_service, session, created_user):
+        """Test a guess written elsewhere is not overwritten by a stale copy."""
+        stale = hot_sessions.get(session['id'])
+        self.guess(GameService(), created_user.id, session, 'AAHED')
+        hot_sessions.put(stale)
+
+        result = self.guess(game_service, created_user.id, session, 'AAHED')
+
+        assert result['success'] is True
+        assert result['session']['attempts_used'] == 2
+        assert len(self.stored(session['id']).guesses) == 2
+        assert hot_sessions.get(session['id']).attempts_used == 2
+
+    def test_completed_games_are_dropped(self, game_service, session, created_user):
+        """Test winning removes the session and a further guess is rejected."""
+        result = self.guess(game_service, created_user.id, session, session['answer_word'])
+
+        assert result['session']['won'] is True
+        assert result['target_word'] == session['answer_word']
+        assert hot_sessions.get(session['id']) is None
+        assert self.guess(game_service, created_user.id, session, 'AAHED')['error'] == 'Game is already completed'
+
+    def test_rolled_back_guess_keeps_cached_copy(self, game_service, session, created_user, monkeypatch):
+        """Test a failed write leaves the cache matching the database."""
+        def fail(*args):
+            raise SQLAlchemyError("stats unavailable")
+        monkeypatch.setattr(game_service, '_update_user_stats', fail)
+
+        result = self.guess(game_service, created_user.id, session, session['answer_word'])
+
+        assert result['success'] is False
+        assert hot_sessions.get(session['id']).attempts_used == 0
+        assert self.stored(session['id']).attempts_used == 0
+
+    def test_other_users_cannot_use_cached_session(self, game_service, session, created_user):
+        """Test the cached copy is only used by the session's owner."""
+        result = self.guess(game_service, created_user.id + 1, session, 'AAHED')
+
+        assert result == {'success': False, 'error': 'Invalid session'}
+        assert self.stored(session['id']).attempts_used == 0
+
+    def test_disabled_cache(self):
+        """Test a zero-sized cache stores nothing."""
+        cache = HotSessionCache(max_entries=0)
+
+        cache.put(HotSession(1, 1, "CRANE", GameMode.CLASSIC, b"", 0))
+
+        assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_json_sessions_are_not_cached(self):
+        """Test sessions without packed guesses are not cached."""
+        cache = HotSessionCache()
+
+        cache.put(HotSession(1, 1, "CRANE", GameMode.CLASSIC, None, 0))
+
+        assert cache.get(1) is None
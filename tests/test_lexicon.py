@@ -0,0 +1,130 @@
+"""Tests for the in-process lexicon index."""
+
+import pytest
+from src.app.database import db
+from src.app.models import GameMode, WordList
+from src.app.services.lexicon import Lexicon, LexiconIndex
+from src.app.services.word_validation_service import WordValidationService
+
+
+def add_words(words):
+    """Insert (word, mode, is_answer) rows into the word list."""
+    for rank, (word, mode, is_answer) in enumerate(words, 1):
+        db.session.add(WordList(word=word, game_mode=mode, is_answer=is_answer, frequency_rank=rank))
+    db.session.commit()
+
+
+class TestLexicon:
+    """Test Lexicon functionality."""
+
+    @pytest.fixture
+    def seeded_app(self, app):
+        """Application with a small word list."""
+        with app.app_context():
+            add_words([
+                ("CRANE", GameMode.CLASSIC, True),
+                ("SLATE", GameMode.CLASSIC, True),
+                ("AAHED", GameMode.CLASSIC, False),
+                ("ARIEL", GameMode.DISNEY, True),
+            ])
+            yield app
+
+    def test_index_membership(self):
+        """Test index membership for guesses and answers."""
+        index = LexiconIndex(GameMode.CLASSIC, "v1", [("crane", True), ("aahed", False)])
+
+        assert index.is_valid_guess("CRANE")
+        assert index.is_valid_guess("AAHED")
+        assert index.is_answer_word("CRANE")
+        assert not index.is_answer_word("AAHED")
+        assert index.answers == ("CRANE",)
+
+    def test_loads_each_mode(self, seeded_app):
+        """Test indexes are loaded per game mode."""
+        lexicon = Lexicon()
+
+        assert lexicon.is_valid_guess("AAHED", GameMode.CLASSIC)
+        assert lexicon.is_answer_word("SLATE", GameMode.CLASSIC)
+        assert not lexicon.is_answer_word("AAHED", GameMode.CLASSIC)
+        assert lexicon.is_answer_word("ARIEL", GameMode.DISNEY)
+        assert not lexicon.is_valid_guess("ARIEL", GameMode.CLASSIC)
+
+    def test_no_queries_within_refresh_interval(self, seeded_app):
+        """Test membership checks do not reread the word list."""
+        lexicon = Lexicon(refresh_interval=3600)
+        index = lexicon.get_index(GameMode.CLASSIC)
+
+        add_words([("PLANT", GameMode.CLASSIC, True)])
+
+        assert lexicon.get_index(GameMode.CLASSIC) is index
+        assert not lexicon.is_valid_guess("PLANT", GameMode.CLASSIC)
+
+    def test_reloads_when_version_changes(self, seeded_app):
+        """Test a new snapshot is swapped in after the word list changes."""
+        lexicon = Lexicon(refresh_interval=3600)
+        old_index = lexicon.get_index(GameMode.CLASSIC)
+
+        add_words([("PLANT", GameMode.CLASSIC, True)])
+        lexicon.invalidate(GameMode.CLASSIC)
+
+        new_index = lexicon.get_index(GameMode.CLASSIC)
+        assert new_index is not old_index
+        assert new_index.version != old_index.version
+        assert new_index.is_answer_word("PLANT")
+        assert not old_index.is_valid_guess("PLANT")
+
+    def test_keeps_snapshot_when_version_unchanged(self, seeded_app):
+        """Test an unchanged word list keeps the same snapshot."""
+        lexicon = Lexicon(refresh_interval=0)
+        index = lexicon.get_index(GameMode.CLASSIC)
+
+        assert lexicon.get_index(GameMode.CLASSIC) is index
+
+    def test_validation_service_uses_lexicon(self, seeded_app):
+        """Test WordValidationService answers from the lexicon."""
+        service = WordValidationService(lexicon=Lexicon())
+
+        assert service.is_valid_guess("crane", GameMode.CLASSIC)
+        assert not service.is_valid_guess("zzzzz", GameMode.CLASSIC)
+        assert service.is_answer_word("slate", GameMode.CLASSIC)
+        assert not service.is_answer_word("aahed", GameMode.CLASSIC)
+
+    def test_pick_answer(self):
+        """Test random answers come from the answer pool."""
+        index = LexiconIndex(GameMode.CLASSIC, "v1", [("crane", True), ("slate", True), ("aahed", False)])
+
+        for _ in range(20):
+            assert index.pick_answer() in {"CRANE", "SLATE"}
+
+    def test_pick_answer_with_exclusions(self):
+        """Test excluded answers are avoided while any remain."""
+        index = LexiconIndex(GameMode.CLASSIC, "v1", [("crane", True), ("slate", True), ("plant", True)])
+
+        for _ in range(20):
+            assert index.pick_answer(exclude={"CRANE", "SLATE"}) == "PLANT"
+        assert index.pick_answer(exclude={"CRANE", "SLATE", "PLANT"}) in {"CRANE", "SLATE", "PLANT"}
+
+    def test_pick_answer_empty_pool(self):
+        """Test an empty pool yields no answer."""
+        assert LexiconIndex(GameMode.DISNEY, "v1", []).pick_answer() is None
+
+    def test_pick_unseen(self):
+        """Test only positions with a clear bit are picked."""
+        words = [(f"W{i:04d}", True) for i in range(1000)]
+        index = LexiconIndex(GameMode.CLASSIC, "v1", words)
+
+        seen = bytearray(b"\xff" * 125)
+        seen[77] = 0b11101111
+        for _ in range(20):
+            assert index.pick_unseen(bytes(seen)) == 77 * 8 + 4
+
+        assert index.pick_unseen(b"\xff" * 125) is None
+        assert index.pick_unseen(b"") in range(1000)
+
+    def test_pick_unseen_ignores_bits_past_pool(self):
+        """Test bits beyond the pool size do not count as unseen answers."""
+        index = LexiconIndex(GameMode.CLASSIC, "v1", [("crane", True), ("slate", True), ("plant", True)])
+
+        assert index.pick_unseen(b"\x07") is None
+        assert index.pick_unseen(b"\x05") == 1
+
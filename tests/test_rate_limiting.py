@@ -0,0 +1,130 @@
+"""Tests for rate limiting configuration and storage."""
+
+from flask import Flask
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+from src.app.middleware import rate_limit_storage
+from src.app.middleware.rate_limit_storage import SQLiteStorage
+from src.app.middleware.rate_limiting import RateLimitConfig
+
+
+class TestSQLiteStorage:
+    """Test the SQLite rate limit storage shared between workers."""
+
+    def test_registered_scheme(self, tmp_path):
+        """Test sqlite URIs resolve to the shared storage."""
+        storage = storage_from_string(f"sqlite:///{tmp_path}/limits.db")
+
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.check()
+
+    def test_counters(self, tmp_path, monkeypatch):
+        """Test counters increment and restart after expiry."""
+        now = [1000.0]
+        monkeypatch.setattr(rate_limit_storage.time, 'time', lambda: now[0])
+        storage = SQLiteStorage(f"sqlite:///{tmp_path}/limits.db")
+
+        assert storage.incr("k", 10) == 1
+        assert storage.incr("k", 10, amount=2) == 3
+        assert storage.get("k") == 3
+        assert storage.get_expiry("k") == 1010.0
+
+        now[0] += 11
+        assert storage.get("k") == 0
+        assert storage.incr("k", 10) == 1
+
+    def test_limit_shared_between_workers(self, tmp_path):
+        """Test a limit holds across storages opened by different workers."""
+        path = f"sqlite:///{tmp_path}/limits.db"
+        limit = parse("5 per minute")
+        workers = [SlidingWindowCounterRateLimiter(SQLiteStorage(path)) for _ in range(3)]
+
+        allowed = [workers[i % 3].hit(limit, "user", "1") for i in range(9)]
+
+        assert allowed == [True] * 5 + [False] * 4
+        assert not workers[0].test(limit, "user", "1")
+        workers[1].clear(limit, "user", "1")
+        assert workers[2].hit(limit, "user", "1")
+
+    def test_sliding_window_weights_previous_window(self, tmp_path, monkeypatch):
+        """Test hits in the previous window count in proportion to its overlap."""
+        now = [600.0]
+        monkeypatch.setattr(rate_limit_storage.time, 'time', lambda: now[0])
+        storage = SQLiteStorage(f"sqlite:///{tmp_path}/limits.db")
+
+        for _ in range(10):
+            assert storage.acquire_sliding_window_entry("k", 10, 60)
+        assert not storage.acquire_sliding_window_entry("k", 10, 60)
+
+        # Halfway through the next window half of the previous hits still count
+        now[0] += 90
+        previous_count, previous_ttl, current_count, _ = storage.get_sliding_window("k", 60)
+        assert (previous_count, previous_ttl, current_count) == (10, 30.0, 0)
+        assert [storage.acquire_sliding_window_entry("k", 10, 60) for _ in range(6)] == [True] * 5 + [False]
+
+
+class TestRateLimitConfig:
+    """Test limiter configuration."""
+
+    def test_limiter_uses_configured_storage(self, tmp_path):
+        """Test the limiter honours the configured storage and strategy."""
+        app = Flask(__name__)
+        app.config['RATELIMIT_STORAGE_URL'] = f"sqlite:///{tmp_path}/limits.db"
+        limiter = RateLimitConfig.init_limiter(app)
+
+        with app.app_context():
+            assert isinstance(limiter.limiter.storage, SQLiteStorage)
+            assert isinstance(limiter.limiter, SlidingWindowCounterRateLimiter)
+
+
+class TestEndpointLimits:
+    """Test per-endpoint limits applied by endpoint name."""
+
+    def register(self, client, username):
+        """Register a user and return its access token."""
+        response = client.post('/api/auth/register', json={
+            'username': username, 'email': f"{username}@example.com", 'password': 'TestPass123'
+        })
+        assert response.status_code == 201
+        return response.get_json()['data']['access_token']
+
+    def test_auth_limited_per_ip(self, client):
+        """Test registrations are throttled per client IP."""
+        for i in range(5):
+            self.register(client, f"player{i}")
+
+        response = client.post('/api/auth/register', json={
+            'username': 'player5', 'email': 'player5@example.com', 'password': 'TestPass123'
+        })
+        assert response.status_code == 429
+        assert response.get_json()['success'] is False
+
+    def test_game_limited_per_user(self, client):
+        """Test guesses are throttled per player rather than per IP."""
+        first = {'Authorization': f"Bearer {self.register(client, 'alice')}"}
+        second = {'Authorization': f"Bearer {self.register(client, 'bob')}"}
+
+        statuses = [client.post('/api/game/guess', json={}, headers=first).status_code for _ in range(31)]
+
+        assert 429 not in statuses[:30]
+        assert statuses[30] == 429
+        assert client.post('/api/game/guess', json={}, headers=second).status_code != 429
+
+    def test_new_games_have_own_limit(self, client):
+        """Test starting games is throttled separately from guessing."""
+        headers = {'Authorization': f"Bearer {self.register(client, 'alice')}"}
+
+        statuses = [client.post('/api/game/new/classic', headers=headers).status_code for _ in range(31)]
+
+        assert 429 not in statuses[:30]
+        assert statuses[30] == 429
+        assert client.post('/api/game/guess', json={}, headers=headers).status_code != 429
+
+    def test_unknown_endpoints_skipped(self, app):
+        """Test limits for endpoints that do not exist are ignored."""
+        app.view_functions.pop('stats.get_leaderboard')
+
+        RateLimitConfig.apply_limits(app.extensions['limiter'], app)
+
+        assert 'stats.get_leaderboard' not in app.view_functions
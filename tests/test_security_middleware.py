@@ -0,0 +1,80 @@
+"""Tests for the security middleware."""
+
+import pytest
+from src.app.middleware.security import (
+    BOT_USER_AGENT_PATTERNS, SUSPICIOUS_REQUEST_SCANNER, SUSPICIOUS_URL_PATTERNS, SecurityMiddleware
+)
+
+
+def is_suspicious(app, url, user_agent=''):
+    """Run the suspicious-request check for a URL and User-Agent."""
+    with app.test_request_context(url, headers={'User-Agent': user_agent}):
+        return SecurityMiddleware()._is_suspicious_request()
+
+
+class TestSuspiciousRequestScanner:
+    """Test the precompiled suspicious-request scanner."""
+
+    @pytest.mark.parametrize('pattern', SUSPICIOUS_URL_PATTERNS)
+    def test_flags_each_url_pattern(self, app, pattern):
+        """Test every URL pattern is detected in the path or query string."""
+        assert is_suspicious(app, f"/api/game/modes?q=x{pattern}y")
+
+    def test_url_patterns_ignore_case(self, app):
+        """Test URL patterns match regardless of case."""
+        assert is_suspicious(app, "/api/game/modes?q=<IFRAME src=x>")
+        assert is_suspicious(app, "/api/game/modes?q=JavaScript:alert")
+
+    @pytest.mark.parametrize('pattern', BOT_USER_AGENT_PATTERNS)
+    def test_flags_bot_user_agents(self, app, pattern):
+        """Test automated clients are detected from the User-Agent."""
+        assert is_suspicious(app, "/api/game/modes", f"Mozilla/5.0 (compatible; Example{pattern.title()}/2.1)")
+
+    def test_user_agent_patterns_only_match_user_agent(self, app):
+        """Test bot indicators in the URL alone are not flagged."""
+        assert not is_suspicious(app, "/api/stats/leaderboard/classic?name=robot", "Mozilla/5.0")
+        assert not SUSPICIOUS_REQUEST_SCANNER.search("http://localhost/robot\x00Mozilla/5.0")
+
+    def test_normal_requests_pass(self, app):
+        """Test ordinary requests are not flagged, however many arrive."""
+        for _ in range(150):
+            assert not is_suspicious(app, "/api/game/status/classic?limit=10", "Mozilla/5.0 (X11; Linux x86_64)")
+
+
+class TestSecurityHeaders:
+    """Test prebuilt security headers."""
+
+    def test_api_headers(self, client):
+        """Test API responses get security, no-cache and CORS headers."""
+        response = client.get('/api/game/status/classic')
+
+        assert response.headers['X-Frame-Options'] == 'DENY'
+        assert response.headers['Content-Security-Policy'].startswith("default-src 'self'")
+        assert response.headers['Cache-Control'] == 'no-cache, no-store, must-revalidate'
+        assert response.headers.getlist('Access-Control-Allow-Origin') == ['http://127.0.0.1:8000']
+        assert 'X-Request-ID' in response.headers
+
+    def test_html_headers(self, client):
+        """Test page responses get security headers without CORS."""
+        response = client.get('/')
+
+        assert response.headers['X-Content-Type-Options'] == 'nosniff'
+        assert response.headers['Pragma'] == 'no-cache'
+        assert 'Access-Control-Allow-Origin' not in response.headers
+
+    def test_path_override(self, client):
+        """Test overridden paths may be cached."""
+        response = client.get('/api/game/modes')
+
+        assert response.headers['Cache-Control'] == 'public, max-age=3600'
+        assert 'Pragma' not in response.headers
+        assert response.headers['X-Frame-Options'] == 'DENY'
+
+    def test_route_classes(self, app):
+        """Test paths are classified by prefix."""
+        middleware = SecurityMiddleware(app)
+
+        assert middleware._route_class('/api/stats/me') == 'api'
+        assert middleware._route_class('/static/js/game.js') == 'static'
+        assert middleware._route_class('/stats') == 'html'
+        assert middleware.class_headers['static']['Cache-Control'].startswith('public')
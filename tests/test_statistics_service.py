@@ -0,0 +1,290 @@
+"""Tests for StatisticsService leaderboards, rankings and global statistics."""
+
+import pytest
+from src.app.database import db
+from src.app.models import GameMode, GlobalStats, User, UserStats, WordList
+from src.app.repositories import GlobalStatsRepository
+from src.app.services.game_service import GameService
+from src.app.services.lexicon import lexicon
+from src.app.services.statistics_service import (
+    StatisticsService, USER_STATS_CACHE_TTL, USER_STATS_LOCAL_CACHE_TTL
+)
+from src.app.utils.cache_backends import LRUCache, SQLiteCache
+from src.app.utils.caching import app_cache
+
+
+def add_user(username):
+    """Insert a user and return its ID."""
+    user = User(username=username, email=f"{username}@example.com")
+    user.set_password("TestPass123")
+    db.session.add(user)
+    db.session.commit()
+    return user.id
+
+
+def add_player(username, games_played, games_won, current_streak=0, game_mode=GameMode.CLASSIC):
+    """Insert a user with stats for a game mode."""
+    user_id = add_user(username)
+    distribution = {str(i): 0 for i in range(1, 7)}
+    distribution["3"] = games_won
+    db.session.add(UserStats(
+        user_id=user_id, game_mode=game_mode, games_played=games_played, games_won=games_won,
+        current_streak=current_streak, max_streak=current_streak, guess_distribution=distribution
+    ))
+    db.session.commit()
+    return user_id
+
+
+class QueryCounter:
+    """Count SQL statements executed on the engine."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        db.event.listen(db.engine, 'before_cursor_execute', self)
+        return self
+
+    def __exit__(self, *exc):
+        db.event.remove(db.engine, 'before_cursor_execute', self)
+
+
+class TestStatisticsService:
+    """Test StatisticsService functionality."""
+
+    @pytest.fixture
+    def players(self, app):
+        """Seed players with distinct records."""
+        with app.app_context():
+            yield {
+                'alice': add_player('alice', 10, 9, current_streak=2),
+                'bob': add_player('bob', 20, 10, current_streak=7),
+                'carol': add_player('carol', 6, 6, current_streak=6),
+                'dave': add_player('dave', 3, 3, current_streak=3),
+            }
+
+    def test_leaderboard_by_win_percentage(self, app, players):
+        """Test win percentage leaderboard ordering and qualification."""
+        with app.app_context():
+            leaderboard = StatisticsService().get_leaderboard(GameMode.CLASSIC, 'win_percentage')
+
+            assert [entry['username'] for entry in leaderboard] == ['carol', 'alice', 'bob']
+            assert leaderboard[0]['rank'] == 1
+            assert leaderboard[1]['win_percentage'] == 90.0
+            assert leaderboard[1]['average_guesses'] == 3.0
+
+    def test_leaderboard_by_other_metrics(self, app, players):
+        """Test wins and streak leaderboards."""
+        with app.app_context():
+            service = StatisticsService()
+
+            wins = service.get_leaderboard(GameMode.CLASSIC, 'total_wins')
+            streaks = service.get_leaderboard(GameMode.CLASSIC, 'current_streak', limit=2)
+
+            assert [entry['username'] for entry in wins] == ['bob', 'alice', 'carol', 'dave']
+            assert [entry['username'] for entry in streaks] == ['bob', 'carol']
+            assert service.get_leaderboard(GameMode.CLASSIC, 'unknown') == []
+
+    def test_leaderboard_single_query(self, app, players):
+        """Test usernames are loaded without a query per row."""
+        with app.app_context():
+            service = StatisticsService()
+
+            with QueryCounter() as counter:
+                leaderboard = service.get_leaderboard(GameMode.CLASSIC, 'total_wins', limit=50)
+
+            assert len(leaderboard) == 4
+            assert counter.count == 1
+
+    def test_user_rank_matches_leaderboard(self, app, players):
+        """Test counted ranks agree with leaderboard positions."""
+        with app.app_context():
+            service = StatisticsService()
+
+            for metric in ('win_percentage', 'total_wins', 'current_streak'):
+                leaderboard = service.get_leaderboard(GameMode.CLASSIC, metric, limit=50)
+                for entry in leaderboard:
+                    rank = service.get_user_rank(entry['user_id'], GameMode.CLASSIC, metric)
+                    assert rank['rank'] == entry['rank']
+                    assert rank['total_players'] == len(leaderboard)
+
+    def test_user_rank_tie_break(self, app, players):
+        """Test equal values are ordered by stats id, as on the leaderboard."""
+        with app.app_context():
+            eve = add_player('eve', 12, 12, current_streak=6)
+            service = StatisticsService()
+
+            assert service.get_user_rank(players['carol'], GameMode.CLASSIC, 'win_percentage')['rank'] == 1
+            assert service.get_user_rank(eve, GameMode.CLASSIC, 'win_percentage')['rank'] == 2
+            assert service.get_user_rank(eve, GameMode.CLASSIC, 'current_streak')['rank'] == 3
+
+    def test_user_rank_unqualified(self, app, players):
+        """Test players below the minimum games are not ranked by win percentage."""
+        with app.app_context():
+            rank = StatisticsService().get_user_rank(players['dave'], GameMode.CLASSIC, 'win_percentage')
+
+            assert rank['rank'] is None
+            assert rank['total_players'] == 3
+            assert rank['percentile'] == 0.0
+
+    def test_user_ranks_batch(self, app, players):
+        """Test all metrics are ranked with indexed counts and a shared player total."""
+        with app.app_context():
+            service = StatisticsService()
+
+            with QueryCounter() as counter:
+                result = service.get_user_ranks(players['bob'], GameMode.CLASSIC)
+
+            # The stats row, one count per metric, and the qualifying and overall totals
+            assert counter.count == 6
+            assert result['ranks']['total_wins'] == {'rank': 1, 'total_players': 4, 'percentile': 100.0}
+            assert result['ranks']['current_streak']['rank'] == 1
+            assert result['ranks']['win_percentage']['rank'] == 3
+
+    def test_user_ranks_without_stats(self, app, created_user):
+        """Test users with no games have no rank."""
+        with app.app_context():
+            result = StatisticsService().get_user_ranks(created_user.id, GameMode.CLASSIC)
+
+            assert result['ranks']['total_wins'] == {'rank': None, 'total_players': 0, 'percentile': 0.0}
+
+
+class TestGlobalStatistics:
+    """Test incrementally maintained global statistics."""
+
+    @pytest.fixture
+    def game_service(self, app):
+        """GameService with a one-word answer pool."""
+        with app.app_context():
+            db.session.add(WordList(word="CRANE", game_mode=GameMode.CLASSIC, is_answer=True, frequency_rank=1))
+            db.session.add(WordList(word="SLATE", game_mode=GameMode.CLASSIC, is_answer=False, frequency_rank=2))
+            db.session.commit()
+            lexicon.clear()
+            yield GameService()
+
+    def play(self, game_service, user_id, guesses):
+        """Play a classic game with the given guesses."""
+        session_id = game_service.start_new_game(user_id, GameMode.CLASSIC)['session']['id']
+        for word in guesses:
+            game_service.process_guess(user_id, {'word': word, 'session_id': session_id})
+
+    def test_totals_follow_finished_games(self, app, game_service):
+        """Test finished games update the aggregates in O(1) reads."""
+        with app.app_context():
+            alice = add_user('alice')
+            bob = add_user('bob')
+
+            self.play(game_service, alice, ['CRANE'])
+            self.play(game_service, alice, ['SLATE', 'CRANE'])
+            self.play(game_service, bob, ['SLATE'] * 6)
+
+            service = StatisticsService()
+            with QueryCounter() as counter:
+                stats = service.get_global_statistics(GameMode.CLASSIC)
+
+            assert counter.count == 1
+            assert stats['total_players'] == 2
+            assert stats['total_games'] == 3
+            assert stats['total_wins'] == 2
+            assert stats['average_attempts'] == 1.5
+            assert stats['guess_distribution_percentage']['1'] == 50.0
+
+    def test_record_game_upserts_mode_row(self, app):
+        """Test the first game for a mode creates its row and later games increment it."""
+        with app.app_context():
+            repo = GlobalStatsRepository()
+
+            assert repo.record_game(GameMode.DISNEY, won=True, attempts_used=3, new_player=True)
+            assert repo.record_game(GameMode.DISNEY, won=False, attempts_used=6)
+
+            db.session.expire_all()
+            stats = repo.get_by_mode(GameMode.DISNEY)
+            assert db.session.query(GlobalStats).count() == 1
+            assert (stats.total_players, stats.total_games, stats.total_wins, stats.dist_3) == (1, 2, 1, 1)
+
+    def test_rebuild_matches_user_stats(self, app):
+        """Test the rebuild reconciles aggregates from user stats."""
+        with app.app_context():
+            add_player('alice', 10, 9)
+            add_player('bob', 20, 10)
+            add_player('carol', 6, 6)
+            add_player('dave', 3, 3)
+
+            rebuilt = GlobalStatsRepository().rebuild(GameMode.CLASSIC)
+
+            assert rebuilt.total_players == 4
+            assert rebuilt.total_games == 39
+            assert rebuilt.total_wins == 28
+            assert rebuilt.get_guess_distribution()['3'] == 28
+
+            stats = StatisticsService().get_global_statistics(GameMode.CLASSIC)
+            assert stats['global_win_percentage'] == round(28 / 39 * 100, 1)
+            assert StatisticsService().get_global_statistics(GameMode.DISNEY)['total_players'] == 0
+
+
+class TestStatisticsCaching:
+    """Test read-through caching of statistics."""
+
+    @pytest.fixture
+    def game_service(self, app):
+        """GameService with a one-word answer pool."""
+        with app.app_context():
+            db.session.add(WordList(word="CRANE", game_mode=GameMode.CLASSIC, is_answer=True, frequency_rank=1))
+            db.session.commit()
+            lexicon.clear()
+            yield GameService()
+
+    def test_repeat_reads_skip_database(self, app):
+        """Test cached statistics are served without queries."""
+        with app.app_context():
+            alice = add_player('alice', 10, 9, current_streak=2)
+            service = StatisticsService()
+
+            first = (
+                service.get_user_stats(alice, GameMode.CLASSIC),
+                service.get_user_all_stats(alice),
+                service.get_leaderboard(GameMode.CLASSIC, 'total_wins'),
+                service.get_global_statistics(GameMode.CLASSIC),
+            )
+            with QueryCounter() as counter:
+                second = (
+                    service.get_user_stats(alice, GameMode.CLASSIC),
+                    service.get_user_all_stats(alice),
+                    service.get_leaderboard(GameMode.CLASSIC, 'total_wins', limit=1),
+                    service.get_global_statistics(GameMode.CLASSIC),
+                )
+
+            assert counter.count == 0
+            assert second[0] == first[0]
+            assert second[2] == first[2][:1]
+
+    def test_finished_game_invalidates(self, app, game_service):
+        """Test a committed game refreshes the affected statistics."""
+        with app.app_context():
+            alice = add_user('alice')
+            service = StatisticsService()
+            assert service.get_user_stats(alice, GameMode.CLASSIC)['games_played'] == 0
+            assert service.get_leaderboard(GameMode.CLASSIC, 'total_wins') == []
+            assert service.get_global_statistics(GameMode.CLASSIC)['total_games'] == 0
+
+            session_id = game_service.start_new_game(alice, GameMode.CLASSIC)['session']['id']
+            game_service.process_guess(alice, {'word': 'CRANE', 'session_id': session_id})
+
+            assert service.get_user_stats(alice, GameMode.CLASSIC)['games_won'] == 1
+            assert service.get_user_all_stats(alice)['overall']['total_games_won'] == 1
+            assert [entry['user_id'] for entry in service.get_leaderboard(GameMode.CLASSIC, 'total_wins')] == [alice]
+            assert service.get_global_statistics(GameMode.CLASSIC)['total_games'] == 1
+
+    def test_user_stats_ttl_follows_backend(self, app, tmp_path):
+        """Test user stats expire quickly unless the cache is shared by workers."""
+        service = StatisticsService()
+        assert service._user_stats_ttl() == USER_STATS_LOCAL_CACHE_TTL
+
+        app_cache.use(SQLiteCache(str(tmp_path / "cache.db")))
+        try:
+            assert service._user_stats_ttl() == USER_STATS_CACHE_TTL
+        finally:
+            app_cache.use(LRUCache())
@@ -0,0 +1,92 @@
+"""Tests for unit-of-work transactions across repositories."""
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from src.app.database import db, unit_of_work, in_unit_of_work, run_after_commit
+from src.app.models import GameMode, User, WordList
+from src.app.repositories import UserRepository, WordListRepository
+
+
+class TestUnitOfWork:
+    """Test unit_of_work functionality."""
+
+    def test_writes_flush_until_boundary(self, app):
+        """Test repository writes inside a unit are committed once at the end."""
+        with app.app_context():
+            commits = []
+            db.event.listen(db.session, 'after_commit', commits.append)
+
+            with unit_of_work():
+                WordListRepository().create({'word': 'CRANE', 'game_mode': GameMode.CLASSIC, 'is_answer': True})
+                WordListRepository().create({'word': 'SLATE', 'game_mode': GameMode.CLASSIC, 'is_answer': True})
+                assert commits == []
+
+            assert len(commits) == 1
+            assert db.session.query(WordList).count() == 2
+
+    def test_rolls_back_across_repositories(self, app):
+        """Test an error rolls back every write in the unit."""
+        with app.app_context():
+            with pytest.raises(RuntimeError):
+                with unit_of_work():
+                    WordListRepository().create({'word': 'CRANE', 'game_mode': GameMode.CLASSIC, 'is_answer': True})
+                    UserRepository().create({'username': 'player', 'email': 'player@example.com',
+                                             'password_hash': 'x'})
+                    raise RuntimeError("abort")
+
+            assert db.session.query(WordList).count() == 0
+            assert db.session.query(User).count() == 0
+            assert not in_unit_of_work()
+
+    def test_repository_errors_abort_unit(self, app, created_user):
+        """Test a failed write inside a unit propagates instead of returning None."""
+        with app.app_context():
+            with pytest.raises(SQLAlchemyError):
+                with unit_of_work():
+                    WordListRepository().create({'word': 'CRANE', 'game_mode': GameMode.CLASSIC, 'is_answer': True})
+                    UserRepository().create({'username': created_user.username, 'email': 'other@example.com',
+                                             'password_hash': 'x'})
+
+            assert db.session.query(WordList).count() == 0
+
+    def test_nested_units_join_outer(self, app):
+        """Test only the outermost unit commits."""
+        with app.app_context():
+            with pytest.raises(RuntimeError):
+                with unit_of_work():
+                    with unit_of_work():
+                        WordListRepository().create({'word': 'CRANE', 'game_mode': GameMode.CLASSIC, 'is_answer': True})
+                    assert in_unit_of_work()
+                    raise RuntimeError("abort")
+
+            assert db.session.query(WordList).count() == 0
+
+    def test_commits_without_unit(self, app):
+        """Test repositories still commit per call outside a unit."""
+        with app.app_context():
+            word = WordListRepository().create({'word': 'CRANE', 'game_mode': GameMode.CLASSIC, 'is_answer': True})
+
+            assert word is not None
+            db.session.rollback()
+            assert db.session.query(WordList).count() == 1
+
+    def test_after_commit_callbacks(self, app):
+        """Test callbacks run only once the outermost unit commits."""
+        with app.app_context():
+            calls = []
+
+            with unit_of_work():
+                with unit_of_work():
+                    run_after_commit(lambda: calls.append('inner'))
+                assert calls == []
+            assert calls == ['inner']
+
+            with pytest.raises(RuntimeError):
+                with unit_of_work():
+                    run_after_commit(lambda: calls.append('aborted'))
+                    raise RuntimeError("abort")
+
+            run_after_commit(lambda: calls.append('immediate'))
+            with unit_of_work():
+                pass
+            assert calls == ['inner', 'immediate']
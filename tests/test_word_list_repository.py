@@ -0,0 +1,61 @@
+"""Tests for bulk word list loading."""
+
+from src.app.database import db
+from src.app.models import GameMode, WordList
+from src.app.repositories.game_repository import WordListRepository
+
+
+WORDS = [("CRANE", True, 1), ("SLATE", True, 2), ("AAHED", False, 3)]
+
+
+class TestSyncWords:
+    """Test WordListRepository.sync_words."""
+
+    def rows(self, game_mode=GameMode.CLASSIC):
+        """Get (word, is_answer, frequency_rank) rows for a mode."""
+        return sorted(
+            (row.word, row.is_answer, row.frequency_rank)
+            for row in db.session.query(WordList).filter_by(game_mode=game_mode)
+        )
+
+    def test_inserts_new_words(self, app):
+        """Test a first load inserts every word."""
+        result = WordListRepository().sync_words(GameMode.CLASSIC, WORDS)
+
+        assert result == {'inserted': 3, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+        assert self.rows() == sorted(WORDS)
+        assert self.rows(GameMode.DISNEY) == []
+
+    def test_rerun_writes_nothing(self, app):
+        """Test loading the same list again changes nothing."""
+        repo = WordListRepository()
+        repo.sync_words(GameMode.CLASSIC, WORDS)
+        version = repo.get_word_list_version(GameMode.CLASSIC)
+
+        result = repo.sync_words(GameMode.CLASSIC, WORDS)
+
+        assert result == {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 3}
+        assert repo.get_word_list_version(GameMode.CLASSIC) == version
+
+    def test_applies_differences(self, app):
+        """Test changed words are updated and missing words kept unless pruned."""
+        repo = WordListRepository()
+        repo.sync_words(GameMode.CLASSIC, WORDS)
+        changed = [("CRANE", True, 1), ("SLATE", False, 2), ("PLANT", True, 4)]
+
+        result = repo.sync_words(GameMode.CLASSIC, changed)
+        assert result == {'inserted': 1, 'updated': 1, 'deleted': 0, 'unchanged': 1}
+        assert ("AAHED", False, 3) in self.rows()
+
+        result = repo.sync_words(GameMode.CLASSIC, changed, delete_missing=True)
+        assert result == {'inserted': 0, 'updated': 0, 'deleted': 1, 'unchanged': 3}
+        assert self.rows() == sorted(changed)
+
+    def test_normalizes_and_deduplicates(self, app):
+        """Test words are uppercased and later duplicates ignored."""
+        result = WordListRepository().sync_words(
+            GameMode.DISNEY, [("ariel", True, 1), ("ARIEL", False, 2)]
+        )
+
+        assert result['inserted'] == 1
+        assert self.rows(GameMode.DISNEY) == [("ARIEL", True, 1)]